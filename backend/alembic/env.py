@@ -1,4 +1,7 @@
 from src.domain_model.models.transaction import Transaction
+from src.domain_model.models.daily_rollup import DailyRollup
+from src.domain_model.models.recurring_template import RecurringTemplate
+from src.domain_model.models.data_version import DataVersion
 from src.domain_model.models.base import Base
 from src.settings.config import settings
 from logging.config import fileConfig
@@ -0,0 +1,153 @@
+"""add_user_id_tenant_scoping
+
+Revision ID: a7e2d4c19b35
+Revises: f1c3a9d2b7e6
+Create Date: 2026-10-18 17:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7e2d4c19b35'
+down_revision: Union[str, None] = 'f1c3a9d2b7e6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Owner assigned to rows that existed before tenancy
+EXISTING_ROWS_USER_ID = '1'
+
+
+def upgrade() -> None:
+    for table in ('transactions', 'daily_rollups', 'recurring_templates'):
+        op.add_column(
+            table,
+            sa.Column('user_id', sa.Integer(), nullable=False, server_default=EXISTING_ROWS_USER_ID)
+        )
+        op.alter_column(table, 'user_id', server_default=None)
+
+    op.drop_index('ix_transactions_recurring', table_name='transactions')
+    op.drop_index('ix_transactions_category_date', table_name='transactions')
+    op.drop_index('ix_transactions_type_date', table_name='transactions')
+    op.drop_index('ix_transactions_date_id', table_name='transactions')
+    op.create_index(
+        'ix_transactions_user_date_id',
+        'transactions',
+        ['user_id', sa.text('transaction_date DESC'), sa.text('id DESC')],
+        unique=False,
+        postgresql_include=['type', 'amount']
+    )
+    op.create_index(
+        'ix_transactions_user_type_date',
+        'transactions',
+        ['user_id', 'type', 'transaction_date'],
+        unique=False,
+        postgresql_include=['amount']
+    )
+    op.create_index(
+        'ix_transactions_user_category_date',
+        'transactions',
+        ['user_id', 'category', 'transaction_date'],
+        unique=False
+    )
+    op.create_index(
+        'ix_transactions_user_recurring',
+        'transactions',
+        ['user_id', 'category', 'amount', 'transaction_date'],
+        unique=False,
+        postgresql_where=sa.text('is_recurring_generated IS true')
+    )
+
+    op.drop_constraint('daily_rollups_pkey', 'daily_rollups', type_='primary')
+    op.create_primary_key(
+        'daily_rollups_pkey', 'daily_rollups', ['user_id', 'rollup_date', 'type', 'category']
+    )
+
+    op.create_index(
+        'ix_recurring_templates_user_id_id',
+        'recurring_templates',
+        ['user_id', 'id'],
+        unique=False
+    )
+
+    # Data versions become per user. Continue the existing owner's counter
+    # past the global one so ETags issued before the split cannot match.
+    op.execute(
+        f"""
+        INSERT INTO data_versions (name, version, updated_at)
+        SELECT 'transactions:{EXISTING_ROWS_USER_ID}', version + 1, now()
+        FROM data_versions WHERE name = 'transactions'
+        """
+    )
+    op.execute("DELETE FROM data_versions WHERE name = 'transactions'")
+
+
+def downgrade() -> None:
+    op.execute(
+        """
+        INSERT INTO data_versions (name, version, updated_at)
+        SELECT 'transactions', coalesce(sum(version), 0) + 1, now()
+        FROM data_versions WHERE name LIKE 'transactions:%'
+        """
+    )
+    op.execute("DELETE FROM data_versions WHERE name LIKE 'transactions:%'")
+
+    op.drop_index('ix_recurring_templates_user_id_id', table_name='recurring_templates')
+
+    # Fold every user's rollups back into the global key before narrowing it.
+    op.execute(
+        """
+        CREATE TEMPORARY TABLE daily_rollups_merged ON COMMIT DROP AS
+        SELECT rollup_date, type, category, sum(total) AS total, sum(txn_count) AS txn_count
+        FROM daily_rollups
+        GROUP BY rollup_date, type, category
+        """
+    )
+    op.execute('DELETE FROM daily_rollups')
+    op.drop_constraint('daily_rollups_pkey', 'daily_rollups', type_='primary')
+    op.drop_column('daily_rollups', 'user_id')
+    op.create_primary_key('daily_rollups_pkey', 'daily_rollups', ['rollup_date', 'type', 'category'])
+    op.execute(
+        """
+        INSERT INTO daily_rollups (rollup_date, type, category, total, txn_count)
+        SELECT rollup_date, type, category, total, txn_count FROM daily_rollups_merged
+        """
+    )
+
+    op.drop_index('ix_transactions_user_recurring', table_name='transactions')
+    op.drop_index('ix_transactions_user_category_date', table_name='transactions')
+    op.drop_index('ix_transactions_user_type_date', table_name='transactions')
+    op.drop_index('ix_transactions_user_date_id', table_name='transactions')
+    op.create_index(
+        'ix_transactions_date_id',
+        'transactions',
+        [sa.text('transaction_date DESC'), sa.text('id DESC')],
+        unique=False,
+        postgresql_include=['type', 'amount']
+    )
+    op.create_index(
+        'ix_transactions_type_date',
+        'transactions',
+        ['type', 'transaction_date'],
+        unique=False,
+        postgresql_include=['amount']
+    )
+    op.create_index(
+        'ix_transactions_category_date',
+        'transactions',
+        ['category', 'transaction_date'],
+        unique=False
+    )
+    op.create_index(
+        'ix_transactions_recurring',
+        'transactions',
+        ['category', 'amount', 'transaction_date'],
+        unique=False,
+        postgresql_where=sa.text('is_recurring_generated IS true')
+    )
+
+    op.drop_column('transactions', 'user_id')
+    op.drop_column('recurring_templates', 'user_id')
@@ -0,0 +1,44 @@
+"""add_recurring_generated_through
+
+Revision ID: b2d8e6f4a913
+Revises: a7e2d4c19b35
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b2d8e6f4a913'
+down_revision: Union[str, None] = 'a7e2d4c19b35'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'recurring_templates',
+        sa.Column('generated_through', sa.Date(), nullable=True)
+    )
+    # Templates already generated start from their latest occurrence, so
+    # occurrences deleted before this migration are not recreated either.
+    op.execute(
+        """
+        UPDATE recurring_templates AS t
+        SET generated_through = g.last_occurrence
+        FROM (
+            SELECT recurring_template_id, max(transaction_date) AS last_occurrence
+            FROM transactions
+            WHERE recurring_template_id IS NOT NULL
+            GROUP BY recurring_template_id
+        ) AS g
+        WHERE t.id = g.recurring_template_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('recurring_templates', 'generated_through')
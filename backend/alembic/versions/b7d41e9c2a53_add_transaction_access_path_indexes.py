@@ -0,0 +1,55 @@
+"""add_transaction_access_path_indexes
+
+Revision ID: b7d41e9c2a53
+Revises: 9f3c2b1a4d6e
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d41e9c2a53'
+down_revision: Union[str, None] = '9f3c2b1a4d6e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_transactions_date_id',
+        'transactions',
+        [sa.text('transaction_date DESC'), sa.text('id DESC')],
+        unique=False,
+        postgresql_include=['type', 'amount']
+    )
+    op.create_index(
+        'ix_transactions_type_date',
+        'transactions',
+        ['type', 'transaction_date'],
+        unique=False,
+        postgresql_include=['amount']
+    )
+    op.create_index(
+        'ix_transactions_category_date',
+        'transactions',
+        ['category', 'transaction_date'],
+        unique=False
+    )
+    op.create_index(
+        'ix_transactions_recurring',
+        'transactions',
+        ['category', 'amount', 'transaction_date'],
+        unique=False,
+        postgresql_where=sa.text('is_recurring_generated IS true')
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_transactions_recurring', table_name='transactions')
+    op.drop_index('ix_transactions_category_date', table_name='transactions')
+    op.drop_index('ix_transactions_type_date', table_name='transactions')
+    op.drop_index('ix_transactions_date_id', table_name='transactions')
@@ -0,0 +1,43 @@
+"""create_daily_rollups_table
+
+Revision ID: c3e8f51a7b20
+Revises: b7d41e9c2a53
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3e8f51a7b20'
+down_revision: Union[str, None] = 'b7d41e9c2a53'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('daily_rollups',
+    sa.Column('rollup_date', sa.Date(), nullable=False),
+    sa.Column('type', postgresql.ENUM(name='transactiontype', create_type=False), nullable=False),
+    sa.Column('category', postgresql.ENUM(name='transactioncategory', create_type=False), nullable=False),
+    sa.Column('total', sa.Numeric(precision=14, scale=2), nullable=False),
+    sa.Column('txn_count', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('rollup_date', 'type', 'category')
+    )
+    # Backfill from existing transactions
+    op.execute(
+        """
+        INSERT INTO daily_rollups (rollup_date, type, category, total, txn_count)
+        SELECT transaction_date, type, category, sum(amount), count(id)
+        FROM transactions
+        GROUP BY transaction_date, type, category
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('daily_rollups')
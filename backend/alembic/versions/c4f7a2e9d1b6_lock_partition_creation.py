@@ -0,0 +1,100 @@
+"""lock_partition_creation
+
+Revision ID: c4f7a2e9d1b6
+Revises: b2d8e6f4a913
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4f7a2e9d1b6'
+down_revision: Union[str, None] = 'b2d8e6f4a913'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Same as the original function, but callers creating the same partition are
+# serialized on a transaction-level advisory lock and the existence check is
+# repeated once the lock is held, so a concurrent caller returns false instead
+# of failing with "relation already exists".
+ENSURE_PARTITION_FUNCTION = """
+CREATE OR REPLACE FUNCTION ensure_transactions_partition(month_start date)
+RETURNS boolean
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    range_start date := date_trunc('month', month_start)::date;
+    range_end date := (date_trunc('month', month_start) + interval '1 month')::date;
+    partition_name text := format('transactions_p%s', to_char(range_start, 'YYYY_MM'));
+BEGIN
+    IF to_regclass(partition_name) IS NOT NULL THEN
+        RETURN false;
+    END IF;
+
+    PERFORM pg_advisory_xact_lock(hashtext(partition_name));
+    IF to_regclass(partition_name) IS NOT NULL THEN
+        RETURN false;
+    END IF;
+
+    EXECUTE format(
+        'CREATE TABLE %I (LIKE transactions INCLUDING DEFAULTS INCLUDING CONSTRAINTS)',
+        partition_name
+    );
+    EXECUTE format(
+        'WITH moved AS (DELETE FROM transactions_default '
+        'WHERE transaction_date >= %L AND transaction_date < %L RETURNING *) '
+        'INSERT INTO %I SELECT * FROM moved',
+        range_start, range_end, partition_name
+    );
+    EXECUTE format(
+        'ALTER TABLE transactions ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+        partition_name, range_start, range_end
+    );
+    RETURN true;
+END;
+$$;
+"""
+
+PREVIOUS_ENSURE_PARTITION_FUNCTION = """
+CREATE OR REPLACE FUNCTION ensure_transactions_partition(month_start date)
+RETURNS boolean
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    range_start date := date_trunc('month', month_start)::date;
+    range_end date := (date_trunc('month', month_start) + interval '1 month')::date;
+    partition_name text := format('transactions_p%s', to_char(range_start, 'YYYY_MM'));
+BEGIN
+    IF to_regclass(partition_name) IS NOT NULL THEN
+        RETURN false;
+    END IF;
+
+    EXECUTE format(
+        'CREATE TABLE %I (LIKE transactions INCLUDING DEFAULTS INCLUDING CONSTRAINTS)',
+        partition_name
+    );
+    EXECUTE format(
+        'WITH moved AS (DELETE FROM transactions_default '
+        'WHERE transaction_date >= %L AND transaction_date < %L RETURNING *) '
+        'INSERT INTO %I SELECT * FROM moved',
+        range_start, range_end, partition_name
+    );
+    EXECUTE format(
+        'ALTER TABLE transactions ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+        partition_name, range_start, range_end
+    );
+    RETURN true;
+END;
+$$;
+"""
+
+
+def upgrade() -> None:
+    op.execute(ENSURE_PARTITION_FUNCTION)
+
+
+def downgrade() -> None:
+    op.execute(PREVIOUS_ENSURE_PARTITION_FUNCTION)
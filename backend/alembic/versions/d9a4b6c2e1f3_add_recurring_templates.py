@@ -0,0 +1,65 @@
+"""add_recurring_templates
+
+Revision ID: d9a4b6c2e1f3
+Revises: c3e8f51a7b20
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd9a4b6c2e1f3'
+down_revision: Union[str, None] = 'c3e8f51a7b20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('recurring_templates',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('amount', sa.Numeric(precision=10, scale=2), nullable=False),
+    sa.Column('type', postgresql.ENUM(name='transactiontype', create_type=False), nullable=False),
+    sa.Column('category', postgresql.ENUM(name='transactioncategory', create_type=False), nullable=False),
+    sa.Column('description', sa.String(length=255), nullable=True),
+    sa.Column('day_of_month', sa.Integer(), nullable=False),
+    sa.Column('start_date', sa.Date(), nullable=False),
+    sa.Column('end_date', sa.Date(), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_recurring_templates_id'), 'recurring_templates', ['id'], unique=False)
+
+    op.add_column(
+        'transactions',
+        sa.Column('recurring_template_id', sa.Integer(), nullable=True)
+    )
+    op.create_foreign_key(
+        'fk_transactions_recurring_template_id',
+        'transactions',
+        'recurring_templates',
+        ['recurring_template_id'],
+        ['id'],
+        ondelete='SET NULL'
+    )
+    op.create_index(
+        'uq_transactions_recurring_occurrence',
+        'transactions',
+        ['recurring_template_id', 'transaction_date'],
+        unique=True,
+        postgresql_where=sa.text('recurring_template_id IS NOT NULL')
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('uq_transactions_recurring_occurrence', table_name='transactions')
+    op.drop_constraint('fk_transactions_recurring_template_id', 'transactions', type_='foreignkey')
+    op.drop_column('transactions', 'recurring_template_id')
+    op.drop_index(op.f('ix_recurring_templates_id'), table_name='recurring_templates')
+    op.drop_table('recurring_templates')
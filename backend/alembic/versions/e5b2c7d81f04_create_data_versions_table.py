@@ -0,0 +1,32 @@
+"""create_data_versions_table
+
+Revision ID: e5b2c7d81f04
+Revises: d9a4b6c2e1f3
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5b2c7d81f04'
+down_revision: Union[str, None] = 'd9a4b6c2e1f3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('data_versions',
+    sa.Column('name', sa.String(length=64), nullable=False),
+    sa.Column('version', sa.BigInteger(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('name')
+    )
+    op.execute("INSERT INTO data_versions (name, version, updated_at) VALUES ('transactions', 0, now())")
+
+
+def downgrade() -> None:
+    op.drop_table('data_versions')
@@ -0,0 +1,175 @@
+"""partition_transactions_by_month
+
+Revision ID: f1c3a9d2b7e6
+Revises: e5b2c7d81f04
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+from datetime import date
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1c3a9d2b7e6'
+down_revision: Union[str, None] = 'e5b2c7d81f04'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Months created ahead of the current one; the scheduler keeps this topped up.
+MONTHS_AHEAD = 3
+
+# Creates the monthly partition holding `month_start`, moving any rows that
+# landed in the default partition for that range into it first (ATTACH would
+# otherwise fail). Returns false when the partition already exists.
+ENSURE_PARTITION_FUNCTION = """
+CREATE OR REPLACE FUNCTION ensure_transactions_partition(month_start date)
+RETURNS boolean
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    range_start date := date_trunc('month', month_start)::date;
+    range_end date := (date_trunc('month', month_start) + interval '1 month')::date;
+    partition_name text := format('transactions_p%s', to_char(range_start, 'YYYY_MM'));
+BEGIN
+    IF to_regclass(partition_name) IS NOT NULL THEN
+        RETURN false;
+    END IF;
+
+    EXECUTE format(
+        'CREATE TABLE %I (LIKE transactions INCLUDING DEFAULTS INCLUDING CONSTRAINTS)',
+        partition_name
+    );
+    EXECUTE format(
+        'WITH moved AS (DELETE FROM transactions_default '
+        'WHERE transaction_date >= %L AND transaction_date < %L RETURNING *) '
+        'INSERT INTO %I SELECT * FROM moved',
+        range_start, range_end, partition_name
+    );
+    EXECUTE format(
+        'ALTER TABLE transactions ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+        partition_name, range_start, range_end
+    );
+    RETURN true;
+END;
+$$;
+"""
+
+
+def _month_starts(first: date, last: date):
+    year, month = first.year, first.month
+    while (year, month) <= (last.year, last.month):
+        yield date(year, month, 1)
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+
+
+def _add_months(value: date, months: int) -> date:
+    index = value.year * 12 + value.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _create_indexes(table: str) -> None:
+    op.create_index('ix_transactions_id', table, ['id'], unique=False)
+    op.create_index(
+        'ix_transactions_date_id',
+        table,
+        [sa.text('transaction_date DESC'), sa.text('id DESC')],
+        unique=False,
+        postgresql_include=['type', 'amount']
+    )
+    op.create_index(
+        'ix_transactions_type_date',
+        table,
+        ['type', 'transaction_date'],
+        unique=False,
+        postgresql_include=['amount']
+    )
+    op.create_index(
+        'ix_transactions_category_date',
+        table,
+        ['category', 'transaction_date'],
+        unique=False
+    )
+    op.create_index(
+        'ix_transactions_recurring',
+        table,
+        ['category', 'amount', 'transaction_date'],
+        unique=False,
+        postgresql_where=sa.text('is_recurring_generated IS true')
+    )
+    op.create_index(
+        'uq_transactions_recurring_occurrence',
+        table,
+        ['recurring_template_id', 'transaction_date'],
+        unique=True,
+        postgresql_where=sa.text('recurring_template_id IS NOT NULL')
+    )
+    op.create_foreign_key(
+        'fk_transactions_recurring_template_id',
+        table,
+        'recurring_templates',
+        ['recurring_template_id'],
+        ['id'],
+        ondelete='SET NULL'
+    )
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    first, last = bind.execute(
+        sa.text('SELECT min(transaction_date), max(transaction_date) FROM transactions')
+    ).one()
+    today = date.today()
+    first = min(first or today, today)
+    last = max(last or today, _add_months(today, MONTHS_AHEAD))
+
+    # Same columns, defaults (including the id sequence) and NOT NULLs.
+    op.execute(
+        'CREATE TABLE transactions_partitioned '
+        '(LIKE transactions INCLUDING DEFAULTS INCLUDING CONSTRAINTS) '
+        'PARTITION BY RANGE (transaction_date)'
+    )
+    for month_start in _month_starts(first, last):
+        op.execute(
+            f"CREATE TABLE transactions_p{month_start:%Y_%m} "
+            f"PARTITION OF transactions_partitioned "
+            f"FOR VALUES FROM ('{month_start}') TO ('{_add_months(month_start, 1)}')"
+        )
+    # Catches dates beyond the created range until their month is added.
+    op.execute('CREATE TABLE transactions_default PARTITION OF transactions_partitioned DEFAULT')
+
+    op.execute('INSERT INTO transactions_partitioned SELECT * FROM transactions')
+
+    # The serial sequence belongs to the old table; keep it across the drop.
+    op.execute('ALTER SEQUENCE transactions_id_seq OWNED BY NONE')
+    op.drop_table('transactions')
+    op.rename_table('transactions_partitioned', 'transactions')
+    op.execute('ALTER SEQUENCE transactions_id_seq OWNED BY transactions.id')
+
+    # Unique constraints on a partitioned table must include the partition key.
+    op.create_primary_key('transactions_pkey', 'transactions', ['id', 'transaction_date'])
+    _create_indexes('transactions')
+
+    op.execute(ENSURE_PARTITION_FUNCTION)
+    op.execute('ANALYZE transactions')
+
+
+def downgrade() -> None:
+    op.execute('DROP FUNCTION IF EXISTS ensure_transactions_partition(date)')
+
+    op.execute(
+        'CREATE TABLE transactions_unpartitioned '
+        '(LIKE transactions INCLUDING DEFAULTS INCLUDING CONSTRAINTS)'
+    )
+    op.execute('INSERT INTO transactions_unpartitioned SELECT * FROM transactions')
+
+    op.execute('ALTER SEQUENCE transactions_id_seq OWNED BY NONE')
+    # Dropping the parent drops every attached partition with it.
+    op.drop_table('transactions')
+    op.rename_table('transactions_unpartitioned', 'transactions')
+    op.execute('ALTER SEQUENCE transactions_id_seq OWNED BY transactions.id')
+
+    op.create_primary_key('transactions_pkey', 'transactions', ['id'])
+    _create_indexes('transactions')
@@ -0,0 +1,204 @@
+"""
+Generate a deterministic synthetic transaction dataset.
+
+The same --seed, --rows, --days and --end always produce the same rows.
+Types and categories follow fixed weights so that summaries and category
+breakdowns look like real data rather than a uniform spread. Rows are
+generated lazily, so 10M-row runs use constant memory.
+
+Usage (from the backend directory):
+    python -m benchmarks.datagen --rows 100000 --output data.csv
+    python -m benchmarks.datagen --rows 10000 --format ndjson --output data.ndjson
+    python -m benchmarks.datagen --rows 1000000 --load
+    python -m benchmarks.datagen --rows 10000000 --users 10000 --load
+"""
+import argparse
+import asyncio
+import csv
+import json
+import random
+import sys
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+from itertools import islice
+from typing import Iterator, List, Optional
+
+from src.utils.constants import TransactionType, TransactionCategory
+
+INCOME_SHARE = 0.12
+
+# (weight, min amount, max amount) per category and type
+INCOME_CATEGORIES = {
+    TransactionCategory.SALARY: (60, 2_000, 9_000),
+    TransactionCategory.BONUS: (8, 200, 5_000),
+    TransactionCategory.FREELANCE: (17, 50, 2_500),
+    TransactionCategory.INVESTMENT: (10, 5, 1_500),
+    TransactionCategory.OTHER: (5, 5, 500),
+}
+EXPENSE_CATEGORIES = {
+    TransactionCategory.FOOD: (22, 3, 80),
+    TransactionCategory.GROCERIES: (18, 10, 250),
+    TransactionCategory.TRANSPORT: (14, 2, 120),
+    TransactionCategory.UTILITIES: (6, 20, 300),
+    TransactionCategory.ENTERTAINMENT: (8, 5, 200),
+    TransactionCategory.HEALTHCARE: (4, 10, 900),
+    TransactionCategory.SHOPPING: (12, 5, 600),
+    TransactionCategory.EDUCATION: (2, 20, 1_500),
+    TransactionCategory.RENT: (2, 500, 3_000),
+    TransactionCategory.INSURANCE: (2, 30, 400),
+    TransactionCategory.SUBSCRIPTIONS: (6, 3, 60),
+    TransactionCategory.OTHER: (4, 1, 300),
+}
+
+DESCRIPTIONS = (None, None, None, "card payment", "online order", "monthly", "cash", "transfer")
+
+FIELDS = ("amount", "type", "category", "description", "transaction_date")
+
+
+def _table(categories):
+    names = list(categories)
+    weights = [categories[name][0] for name in names]
+    return names, weights
+
+
+def generate_transactions(
+    rows: int,
+    seed: int = 42,
+    days: int = 730,
+    end: Optional[date] = None,
+    users: int = 1
+) -> Iterator[dict]:
+    """
+    Yield `rows` transaction dicts spread over the `days` days ending at `end`
+    and over user ids 1..`users`.
+
+    Dicts carry the fields of TransactionCreateDto plus `user_id`, with enum
+    members and Decimal amounts, so they can go straight to bulk inserts or
+    encoders.
+    """
+    rng = random.Random(seed)
+    end = end or date.today()
+    income = _table(INCOME_CATEGORIES)
+    expense = _table(EXPENSE_CATEGORIES)
+
+    for _ in range(rows):
+        if rng.random() < INCOME_SHARE:
+            txn_type, (names, weights), ranges = TransactionType.INCOME, income, INCOME_CATEGORIES
+        else:
+            txn_type, (names, weights), ranges = TransactionType.EXPENSE, expense, EXPENSE_CATEGORIES
+
+        category = rng.choices(names, weights)[0]
+        _, low, high = ranges[category]
+        # Skew towards the low end of the range, like real spending.
+        cents = int((low + (high - low) * rng.random() ** 2) * 100)
+
+        # Only draw when needed so single-user datasets keep their old rows.
+        user_id = rng.randint(1, users) if users > 1 else 1
+
+        yield {
+            "user_id": user_id,
+            "amount": Decimal(cents) / 100,
+            "type": txn_type,
+            "category": category,
+            "description": rng.choice(DESCRIPTIONS),
+            "transaction_date": end - timedelta(days=rng.randrange(days)),
+        }
+
+
+def batched(rows: Iterator[dict], size: int) -> Iterator[List[dict]]:
+    while True:
+        batch = list(islice(rows, size))
+        if not batch:
+            return
+        yield batch
+
+
+def write_csv(rows: Iterator[dict], out) -> None:
+    writer = csv.writer(out)
+    writer.writerow(FIELDS)
+    for row in rows:
+        writer.writerow([
+            row["amount"],
+            row["type"].value,
+            row["category"].value,
+            row["description"] or "",
+            row["transaction_date"].isoformat(),
+        ])
+
+
+def write_ndjson(rows: Iterator[dict], out) -> None:
+    for row in rows:
+        out.write(json.dumps({
+            "amount": str(row["amount"]),
+            "type": row["type"].value,
+            "category": row["category"].value,
+            "description": row["description"],
+            "transaction_date": row["transaction_date"].isoformat(),
+        }))
+        out.write("\n")
+
+
+async def load(rows: Iterator[dict], total: int, chunk_size: int, users: int) -> None:
+    """
+    Insert rows directly, then rebuild rollups and bump every user's data
+    version once, the same bookkeeping the service layer does per write.
+    """
+    from src.domain_model.repositories.transaction_repository import TransactionRepository
+    from src.domain_model.repositories.daily_rollup_repository import DailyRollupRepository
+    from src.domain_model.repositories.data_version_repository import DataVersionRepository
+    from src.utils.constants import transactions_data_version
+    from src.utils.database import engine, AsyncSessionLocal
+
+    repo = TransactionRepository()
+    inserted = 0
+    started = time.perf_counter()
+    async with AsyncSessionLocal() as session:
+        for batch in batched(rows, chunk_size):
+            await repo.bulk_insert(session, batch)
+            await session.commit()
+            inserted += len(batch)
+            rate = inserted / (time.perf_counter() - started)
+            print(f"\r{inserted}/{total} rows ({rate:,.0f} rows/s)", end="", file=sys.stderr)
+        print(file=sys.stderr)
+
+        async with session.begin():
+            await DailyRollupRepository().rebuild(session)
+            version_repo = DataVersionRepository()
+            for user_id in range(1, users + 1):
+                await version_repo.bump(session, transactions_data_version(user_id))
+    await engine.dispose()
+    print(f"Loaded {inserted} transactions in {time.perf_counter() - started:.1f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--days", type=int, default=730, help="date range length")
+    parser.add_argument("--end", type=date.fromisoformat, default=None,
+                        help="last date of the range (default: today)")
+    parser.add_argument("--users", type=int, default=1, help="spread rows over this many user ids")
+    parser.add_argument("--format", dest="output_format", choices=("csv", "ndjson"), default="csv")
+    parser.add_argument("--output", help="file to write (default: stdout)")
+    parser.add_argument("--load", action="store_true",
+                        help="insert into the configured database instead of writing a file")
+    parser.add_argument("--chunk-size", type=int, default=5_000)
+    args = parser.parse_args()
+
+    rows = generate_transactions(args.rows, args.seed, args.days, args.end, args.users)
+
+    if args.load:
+        asyncio.run(load(rows, args.rows, args.chunk_size, args.users))
+        return
+
+    write = write_csv if args.output_format == "csv" else write_ndjson
+    if args.output:
+        with open(args.output, "w", newline="", encoding="utf-8") as out:
+            write(rows, out)
+    else:
+        write(rows, sys.stdout)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,232 @@
+"""
+Per-request dependency-resolution overhead, without a database.
+
+`resolve_*` benchmarks run FastAPI's dependency solver for the get-by-id
+route, including teardown of the session dependency. `*_legacy` variants
+solve the same signature wired the old way: repositories and the service
+constructed per request, sync dependencies (run in the threadpool) and the
+session generator wrapped in a second generator. `asgi_*` benchmarks send
+whole requests through the app in process, on /health as the floor and on
+get-by-id backed by the in-memory repositories; `concurrent` variants issue
+CONCURRENCY requests at once, the way a busy worker sees them.
+
+Usage (from the backend directory):
+    python -m benchmarks.dependencies
+    python -m benchmarks.dependencies -k resolve --json after.json --compare before.json
+"""
+import asyncio
+import sys
+from contextlib import AsyncExitStack
+from datetime import date
+from typing import Optional
+
+import httpx
+from fastapi import Depends, Header, HTTPException, Path, Response, status
+from fastapi.dependencies.utils import get_dependant, solve_dependencies
+from fastapi.routing import APIRoute
+from starlette.requests import Request
+
+from src.app import app
+from src.domain_model.models.transaction import Transaction
+from src.domain_model.repositories.transaction_repository import TransactionRepository
+from src.domain_model.repositories.daily_rollup_repository import DailyRollupRepository
+from src.domain_model.repositories.data_version_repository import DataVersionRepository
+from src.services.service_registry import ServiceRegistry
+from src.services.transaction_service import TransactionService
+from src.settings.config import settings
+from src.utils.database import get_async_session
+
+from benchmarks.datagen import generate_transactions
+from benchmarks.harness import run_suite
+from benchmarks.inmemory import (
+    InMemoryDailyRollupRepository,
+    InMemoryDataVersionRepository,
+    InMemoryTransactionRepository,
+)
+
+DATASET_ROWS = 1_000
+TODAY = date(2026, 6, 15)
+USER_ID = 1
+TXN_ID = DATASET_ROWS // 2
+CONCURRENCY = 50
+
+GET_BY_ID_PATH = "/api/v1/transactions/{txn_id}"
+
+
+# =========================================================
+# The previous wiring, kept here as the baseline
+# =========================================================
+
+def _legacy_transaction_repository():
+    return TransactionRepository()
+
+
+def _legacy_daily_rollup_repository():
+    return DailyRollupRepository()
+
+
+def _legacy_data_version_repository():
+    return DataVersionRepository()
+
+
+def _legacy_transaction_service(
+    repo: TransactionRepository = Depends(_legacy_transaction_repository),
+    rollup_repo: DailyRollupRepository = Depends(_legacy_daily_rollup_repository),
+    version_repo: DataVersionRepository = Depends(_legacy_data_version_repository)
+):
+    return TransactionService(repo, rollup_repo, None, version_repo)
+
+
+def _legacy_current_user_id(
+    user_id: Optional[int] = Header(None, alias=settings.USER_ID_HEADER, gt=0)
+) -> int:
+    if user_id is not None:
+        return user_id
+    if settings.DEFAULT_USER_ID is not None:
+        return settings.DEFAULT_USER_ID
+    raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
+
+
+async def _legacy_db_session():
+    async for session in get_async_session():
+        yield session
+
+
+async def _legacy_get_transaction_by_id(
+    response: Response,
+    txn_id: int = Path(..., gt=0),
+    if_none_match: Optional[str] = Header(None),
+    user_id: int = Depends(_legacy_current_user_id),
+    session=Depends(_legacy_db_session),
+    service: TransactionService = Depends(_legacy_transaction_service)
+):
+    raise NotImplementedError("only resolved, never called")
+
+
+# =========================================================
+# Fixtures
+# =========================================================
+
+def _route(path: str) -> APIRoute:
+    for route in app.routes:
+        if isinstance(route, APIRoute) and route.path == path and "GET" in route.methods:
+            return route
+    raise LookupError(path)
+
+
+def _request(path_params: dict) -> Request:
+    return Request({
+        "type": "http",
+        "method": "GET",
+        "path": GET_BY_ID_PATH.format(**path_params),
+        "query_string": b"",
+        "headers": [(settings.USER_ID_HEADER.lower().encode(), str(USER_ID).encode())],
+        "path_params": path_params,
+        "app": app,
+    })
+
+
+async def _resolve(dependant, request: Request):
+    async with AsyncExitStack() as stack:
+        values, errors, *_ = await solve_dependencies(
+            request=request, dependant=dependant, async_exit_stack=stack
+        )
+    if errors:
+        raise AssertionError(errors)
+    return values
+
+
+def fixtures() -> dict:
+    repo = InMemoryTransactionRepository()
+    for values in generate_transactions(DATASET_ROWS, seed=7, end=TODAY):
+        repo._store(Transaction(**values))
+    # What the lifespan does, with in-memory repositories.
+    app.state.services = ServiceRegistry(
+        None,
+        transaction_repository=repo,
+        rollup_repository=InMemoryDailyRollupRepository(),
+        version_repository=InMemoryDataVersionRepository(),
+    )
+
+    client = httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app),
+        base_url="http://bench",
+        headers={settings.USER_ID_HEADER: str(USER_ID)},
+    )
+    return {
+        "client": client,
+        "dependant": _route(GET_BY_ID_PATH).dependant,
+        "legacy_dependant": get_dependant(path=GET_BY_ID_PATH, call=_legacy_get_transaction_by_id),
+        "request": _request({"txn_id": str(TXN_ID)}),
+    }
+
+
+# =========================================================
+# Dependency resolution
+# =========================================================
+
+def bench_resolve_get_by_id(benchmark, dependant, request):
+    benchmark(_resolve, dependant, request)
+
+
+def bench_resolve_get_by_id_legacy(benchmark, legacy_dependant, request):
+    benchmark(_resolve, legacy_dependant, request)
+
+
+def bench_resolve_get_by_id_concurrent(benchmark, dependant, request):
+    async def run():
+        return await asyncio.gather(*(_resolve(dependant, request) for _ in range(CONCURRENCY)))
+
+    benchmark(run)
+
+
+def bench_resolve_get_by_id_concurrent_legacy(benchmark, legacy_dependant, request):
+    async def run():
+        return await asyncio.gather(
+            *(_resolve(legacy_dependant, request) for _ in range(CONCURRENCY))
+        )
+
+    benchmark(run)
+
+
+# =========================================================
+# Whole requests through the ASGI app
+# =========================================================
+
+async def _get_ok(client: httpx.AsyncClient, url: str):
+    response = await client.get(url)
+    if response.status_code != 200:
+        raise AssertionError(f"{url}: {response.status_code} {response.text}")
+    return response
+
+
+def bench_asgi_health(benchmark, client):
+    benchmark(_get_ok, client, "/health")
+
+
+def bench_asgi_get_by_id(benchmark, client):
+    benchmark(_get_ok, client, GET_BY_ID_PATH.format(txn_id=TXN_ID))
+
+
+def bench_asgi_health_concurrent(benchmark, client):
+    async def run():
+        return await asyncio.gather(*(_get_ok(client, "/health") for _ in range(CONCURRENCY)))
+
+    benchmark(run)
+
+
+def bench_asgi_get_by_id_concurrent(benchmark, client):
+    url = GET_BY_ID_PATH.format(txn_id=TXN_ID)
+
+    async def run():
+        return await asyncio.gather(*(_get_ok(client, url) for _ in range(CONCURRENCY)))
+
+    benchmark(run)
+
+
+def main():
+    run_suite(sys.modules[__name__], fixtures, __doc__.strip().splitlines()[0])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""
+A small timing harness with the call style of pytest-benchmark.
+
+Suites are modules of `bench_*` functions that take a `benchmark` fixture
+and call `benchmark(fn, *args)` once, the way pytest-benchmark tests do.
+Coroutine functions are awaited inside a single timing loop, so event-loop
+startup is not part of the measurement.
+"""
+import argparse
+import asyncio
+import inspect
+import json
+import statistics
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+
+class Benchmark:
+    """Calibrates an iteration count, then times `rounds` rounds of it."""
+
+    def __init__(
+        self,
+        name: str,
+        loop: asyncio.AbstractEventLoop,
+        rounds: int = 20,
+        min_round_time: float = 0.005
+    ):
+        self.name = name
+        self.loop = loop
+        self.rounds = rounds
+        self.min_round_time = min_round_time
+        self.stats: Optional[dict] = None
+
+    def _timer(self, fn: Callable, args, kwargs) -> Callable[[int], float]:
+        if inspect.iscoroutinefunction(fn):
+            async def timed(iterations: int) -> float:
+                start = time.perf_counter()
+                for _ in range(iterations):
+                    await fn(*args, **kwargs)
+                return time.perf_counter() - start
+
+            return lambda iterations: self.loop.run_until_complete(timed(iterations))
+
+        def run(iterations: int) -> float:
+            start = time.perf_counter()
+            for _ in range(iterations):
+                fn(*args, **kwargs)
+            return time.perf_counter() - start
+
+        return run
+
+    def __call__(self, fn: Callable, *args, **kwargs) -> Any:
+        timer = self._timer(fn, args, kwargs)
+
+        iterations = 1
+        while timer(iterations) < self.min_round_time and iterations < 1_000_000:
+            iterations *= 2
+
+        per_call = [timer(iterations) / iterations for _ in range(self.rounds)]
+        self.stats = {
+            "name": self.name,
+            "rounds": self.rounds,
+            "iterations": iterations,
+            "min_us": min(per_call) * 1e6,
+            "median_us": statistics.median(per_call) * 1e6,
+            "mean_us": statistics.fmean(per_call) * 1e6,
+            "stddev_us": statistics.pstdev(per_call) * 1e6,
+            "ops": 1 / statistics.median(per_call),
+        }
+
+        if inspect.iscoroutinefunction(fn):
+            return self.loop.run_until_complete(fn(*args, **kwargs))
+        return fn(*args, **kwargs)
+
+
+def collect(module) -> Dict[str, Callable]:
+    return {
+        name: value
+        for name, value in vars(module).items()
+        if name.startswith("bench_") and callable(value)
+    }
+
+
+def format_stats(results: List[dict]) -> str:
+    header = f"{'benchmark':<40}{'min us':>11}{'median us':>11}{'mean us':>11}{'stddev':>9}{'ops/s':>12}"
+    lines = [header, "-" * len(header)]
+    for row in results:
+        lines.append(
+            f"{row['name']:<40}{row['min_us']:>11.2f}{row['median_us']:>11.2f}"
+            f"{row['mean_us']:>11.2f}{row['stddev_us']:>9.2f}{row['ops']:>12,.0f}"
+        )
+    return "\n".join(lines)
+
+
+def compare(results: List[dict], baseline: List[dict], threshold: float) -> List[str]:
+    """Benchmarks whose median got slower than the baseline by more than threshold."""
+    previous = {row["name"]: row for row in baseline}
+    regressions = []
+    for row in results:
+        before = previous.get(row["name"])
+        if before and row["median_us"] > before["median_us"] * (1 + threshold):
+            regressions.append(
+                f"{row['name']}: {before['median_us']:.2f} us -> {row['median_us']:.2f} us"
+            )
+    return regressions
+
+
+def run_suite(module, fixtures: Callable[[], dict], description: str) -> None:
+    """
+    Command-line entry point for a suite module. `fixtures` builds the
+    keyword arguments (besides `benchmark`) that bench functions ask for.
+    """
+    benches = collect(module)
+
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("-k", dest="pattern", help="only run benchmarks whose name contains this")
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--json", dest="json_path", help="write results to this file")
+    parser.add_argument("--compare", help="baseline JSON from an earlier --json run")
+    parser.add_argument("--threshold", type=float, default=0.10)
+    args = parser.parse_args()
+
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    results = []
+    try:
+        for name, bench in benches.items():
+            if args.pattern and args.pattern not in name:
+                continue
+
+            # Fresh fixtures per benchmark so writes in one do not skew another.
+            available = fixtures()
+            wanted = inspect.signature(bench).parameters
+            kwargs = {key: value for key, value in available.items() if key in wanted}
+
+            benchmark = Benchmark(name.removeprefix("bench_"), loop, rounds=args.rounds)
+            bench(benchmark, **kwargs)
+            if benchmark.stats is None:
+                raise SystemExit(f"{name} never called benchmark()")
+            results.append(benchmark.stats)
+            print(f"{benchmark.stats['name']:<40}{benchmark.stats['median_us']:>11.2f} us")
+    finally:
+        loop.close()
+
+    print()
+    print(format_stats(results))
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as handle:
+            json.dump({"results": results}, handle, indent=2)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as handle:
+            regressions = compare(results, json.load(handle)["results"], args.threshold)
+        if regressions:
+            print("\nRegressions:")
+            for line in regressions:
+                print(f"  {line}")
+            raise SystemExit(1)
+        print("\nNo regressions against baseline")
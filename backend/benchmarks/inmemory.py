@@ -0,0 +1,544 @@
+"""
+In-memory stand-ins for the repositories, for benchmarks and tests that
+must not need Postgres.
+
+Each class subclasses the real repository and overrides every method the
+services call, with the same signatures and return shapes: ORM objects,
+column rows with attribute access, or plain tuples. Sessions are accepted
+and ignored, except that commits and rollbacks go through NullSession.
+"""
+from collections import namedtuple
+from datetime import date, timedelta
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from sqlalchemy.orm import Session
+
+from src.domain_model.models.base import utc_now
+from src.domain_model.models.recurring_template import RecurringTemplate
+from src.domain_model.models.transaction import Transaction
+from src.domain_model.repositories.daily_rollup_repository import DailyRollupRepository, _field
+from src.domain_model.repositories.data_version_repository import DataVersionRepository
+from src.domain_model.repositories.recurring_template_repository import RecurringTemplateRepository
+from src.domain_model.repositories.transaction_repository import TransactionRepository, month_bounds
+from src.utils.constants import TransactionType, DATE_GRANULARITIES
+
+
+class NullSession:
+    """
+    Enough of AsyncSession for the services. `sync_session` is a real,
+    unbound Session so cache invalidation can attach its commit hooks.
+    """
+
+    def __init__(self):
+        self.sync_session = Session()
+
+    async def commit(self):
+        return None
+
+    async def rollback(self):
+        return None
+
+    async def flush(self):
+        return None
+
+
+@lru_cache(maxsize=None)
+def _row_type(fields: Tuple[str, ...]):
+    return namedtuple("Row", fields)
+
+
+def _row(obj: Any, columns: Sequence[Any]):
+    keys = tuple(column.key for column in columns)
+    return _row_type(keys)(*(getattr(obj, key) for key in keys))
+
+
+AggregateFields = _row_type(("user_id", "transaction_date", "type", "category", "amount"))
+IncomeExpense = _row_type(("total_income", "total_expense", "net"))
+DashboardRow = _row_type((
+    "type", "category", "month_total", "month_count", "month_to_date_total", "week_total",
+))
+
+
+class _DateBucket:
+    """Marker returned by date_bucket; group_sum_by_field evaluates it."""
+
+    def __init__(self, granularity: str):
+        self.granularity = granularity
+
+    def __call__(self, value: date) -> date:
+        if self.granularity == "month":
+            return value.replace(day=1)
+        if self.granularity == "week":
+            return value - timedelta(days=value.weekday())
+        return value
+
+
+def _date_bucket(granularity: str) -> _DateBucket:
+    if granularity not in DATE_GRANULARITIES:
+        raise ValueError(f"Unsupported granularity: {granularity}")
+    return _DateBucket(granularity)
+
+
+class InMemoryTransactionRepository(TransactionRepository):
+
+    def __init__(self):
+        super().__init__()
+        self._rows: Dict[int, Transaction] = {}
+        self._next_id = 1
+        # user_id -> that user's rows, newest first
+        self._ordered: Optional[Dict[int, List[Transaction]]] = None
+
+    # =========================================================
+    # Storage
+    # =========================================================
+
+    def _store(self, obj: Transaction) -> Transaction:
+        now = utc_now()
+        obj.id = self._next_id
+        self._next_id += 1
+        if obj.transaction_date is None:
+            obj.transaction_date = date.today()
+        if obj.is_recurring_generated is None:
+            obj.is_recurring_generated = False
+        obj.created_at = obj.created_at or now
+        obj.updated_at = obj.updated_at or now
+        self._rows[obj.id] = obj
+        self._ordered = None
+        return obj
+
+    def _descending(self, user_id: int) -> List[Transaction]:
+        # Sorted once per write burst; reads in between reuse the order.
+        if self._ordered is None:
+            ordered: Dict[int, List[Transaction]] = {}
+            for obj in sorted(
+                self._rows.values(),
+                key=lambda obj: (obj.transaction_date, obj.id),
+                reverse=True,
+            ):
+                ordered.setdefault(obj.user_id, []).append(obj)
+            self._ordered = ordered
+        return self._ordered.get(user_id, [])
+
+    def _owned(self, user_id: int, obj_id: int) -> Optional[Transaction]:
+        obj = self._rows.get(obj_id)
+        return obj if obj is not None and obj.user_id == user_id else None
+
+    @staticmethod
+    def _matches(
+        obj: Transaction,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        year: Optional[int] = None,
+        month: Optional[int] = None,
+        txn_type: Optional[TransactionType] = None,
+        category: Optional[str] = None
+    ) -> bool:
+        if start_date and end_date and not start_date <= obj.transaction_date <= end_date:
+            return False
+        if year and month:
+            month_start, next_month = month_bounds(year, month)
+            if not month_start <= obj.transaction_date < next_month:
+                return False
+        if txn_type and obj.type != txn_type:
+            return False
+        if category and obj.category != category:
+            return False
+        return True
+
+    def _filtered(self, user_id: int, **filters) -> Iterable[Transaction]:
+        ordered = self._descending(user_id)
+        if not any(value for value in filters.values()):
+            return ordered
+        return [obj for obj in ordered if self._matches(obj, **filters)]
+
+    # =========================================================
+    # BaseRepository
+    # =========================================================
+
+    async def create(self, session, obj: Transaction) -> Transaction:
+        return self._store(obj)
+
+    async def get_by_id(self, session, user_id: int, obj_id: int) -> Optional[Transaction]:
+        return self._owned(user_id, obj_id)
+
+    async def delete(self, session, user_id: int, obj_id: int) -> bool:
+        if self._owned(user_id, obj_id) is None:
+            return False
+        del self._rows[obj_id]
+        self._ordered = None
+        return True
+
+    async def update(self, session, user_id: int, obj_id: int, data: dict) -> Optional[Transaction]:
+        obj = self._owned(user_id, obj_id)
+        if obj is None:
+            return None
+        for key, value in data.items():
+            setattr(obj, key, value)
+        obj.updated_at = utc_now()
+        self._ordered = None
+        return obj
+
+    async def bulk_create(self, session, rows: List[dict], returning=None, chunk_size=None):
+        stored = [self._store(Transaction(**values)) for values in rows]
+        return [_row(obj, returning) for obj in stored] if returning else len(stored)
+
+    async def get_many(
+        self,
+        session,
+        ids: Sequence[int],
+        criteria=(),
+        columns: Optional[Sequence[Any]] = None,
+        for_update: bool = False,
+        chunk_size=None,
+        *,
+        user_id: int
+    ) -> List[Any]:
+        owned = (self._owned(user_id, obj_id) for obj_id in sorted(set(ids)))
+        return [_row(obj, columns) if columns else obj for obj in owned if obj is not None]
+
+    async def bulk_update(
+        self,
+        session,
+        rows: List[dict],
+        criteria=(),
+        returning=None,
+        chunk_size=None,
+        *,
+        user_id: int
+    ):
+        updated = []
+        for values in rows:
+            data = {key: value for key, value in values.items() if key != "id"}
+            obj = await self.update(session, user_id, values["id"], data)
+            if obj is not None:
+                updated.append(obj)
+        return [_row(obj, returning) for obj in updated] if returning else len(updated)
+
+    async def bulk_delete(
+        self,
+        session,
+        ids: Sequence[int],
+        criteria=(),
+        returning=None,
+        chunk_size=None,
+        *,
+        user_id: int
+    ):
+        deleted = [self._rows[obj_id] for obj_id in ids if self._owned(user_id, obj_id) is not None]
+        for obj in deleted:
+            await self.delete(session, user_id, obj.id)
+        return [_row(obj, returning) for obj in deleted] if returning else len(deleted)
+
+    # =========================================================
+    # TransactionRepository
+    # =========================================================
+
+    async def filter_transactions(
+        self,
+        session,
+        user_id: int,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        year: Optional[int] = None,
+        month: Optional[int] = None,
+        txn_type: Optional[TransactionType] = None,
+        category: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 30,
+        columns: Optional[Sequence[Any]] = None
+    ) -> List[Any]:
+        rows = self._filtered(
+            user_id, start_date=start_date, end_date=end_date, year=year, month=month,
+            txn_type=txn_type, category=category,
+        )[skip:skip + limit]
+        return [_row(obj, columns) for obj in rows] if columns else list(rows)
+
+    async def filter_transactions_keyset(
+        self,
+        session,
+        user_id: int,
+        cursor: Optional[Tuple[date, int]] = None,
+        backward: bool = False,
+        limit: int = 30,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        year: Optional[int] = None,
+        month: Optional[int] = None,
+        txn_type: Optional[TransactionType] = None,
+        category: Optional[str] = None,
+        columns: Optional[Sequence[Any]] = None
+    ) -> List[Any]:
+        rows = self._filtered(
+            user_id, start_date=start_date, end_date=end_date, year=year, month=month,
+            txn_type=txn_type, category=category,
+        )
+        if cursor:
+            if backward:
+                rows = [obj for obj in rows if (obj.transaction_date, obj.id) > cursor]
+            else:
+                rows = [obj for obj in rows if (obj.transaction_date, obj.id) < cursor]
+        rows = rows[-limit:] if backward else rows[:limit]
+        return [_row(obj, columns) for obj in rows] if columns else list(rows)
+
+    async def get_aggregate_fields(self, session, user_id: int, txn_id: int, for_update: bool = True):
+        obj = self._owned(user_id, txn_id)
+        if obj is None:
+            return None
+        return AggregateFields(obj.user_id, obj.transaction_date, obj.type, obj.category, obj.amount)
+
+    async def stream_transactions(
+        self,
+        session,
+        user_id: int,
+        columns: Sequence[Any],
+        chunk_size: int = 1000,
+        **filters
+    ) -> AsyncIterator[list]:
+        rows = list(self._filtered(user_id, **filters))
+        for offset in range(0, len(rows), chunk_size):
+            yield [_row(obj, columns) for obj in rows[offset:offset + chunk_size]]
+
+    async def bulk_insert(self, session, rows: List[dict]) -> int:
+        for values in rows:
+            self._store(Transaction(**values))
+        return len(rows)
+
+    async def count_transactions(self, session, user_id: int, **filters) -> int:
+        return len(self._filtered(user_id, **filters))
+
+    async def sum_amount(self, session, user_id: int, start_date: date, end_date: date,
+                         txn_type: Optional[TransactionType] = None):
+        rows = self._filtered(user_id, start_date=start_date, end_date=end_date, txn_type=txn_type)
+        return sum((obj.amount for obj in rows), Decimal(0))
+
+    async def sum_income_expense(self, session, user_id: int, start_date: date, end_date: date):
+        income = expense = Decimal(0)
+        for obj in self._filtered(user_id, start_date=start_date, end_date=end_date):
+            if obj.type == TransactionType.INCOME:
+                income += obj.amount
+            else:
+                expense += obj.amount
+        return IncomeExpense(income, expense, income - expense)
+
+    date_bucket = staticmethod(_date_bucket)
+
+    async def existing_recurring_occurrences(
+        self,
+        session,
+        template_ids: List[int],
+        start_date: date,
+        end_date: date
+    ) -> Set[Tuple[int, date]]:
+        wanted = set(template_ids)
+        return {
+            (obj.recurring_template_id, obj.transaction_date)
+            for obj in self._rows.values()
+            if obj.recurring_template_id in wanted
+            and start_date <= obj.transaction_date <= end_date
+        }
+
+    async def insert_recurring_occurrences(self, session, rows: List[dict]) -> list:
+        existing = {
+            (obj.recurring_template_id, obj.transaction_date)
+            for obj in self._rows.values()
+            if obj.recurring_template_id is not None
+        }
+        inserted = []
+        for values in rows:
+            key = (values["recurring_template_id"], values["transaction_date"])
+            if key in existing:
+                continue
+            existing.add(key)
+            obj = self._store(Transaction(**values))
+            inserted.append(AggregateFields(
+                obj.user_id, obj.transaction_date, obj.type, obj.category, obj.amount
+            ))
+        return inserted
+
+
+class InMemoryDailyRollupRepository(DailyRollupRepository):
+
+    def __init__(self):
+        super().__init__()
+        # user_id -> {(rollup_date, type, category): [total, txn_count]}
+        self._rollups: Dict[int, Dict[Tuple[date, Any, Any], List[Any]]] = {}
+
+    def _window(self, user_id: int, start_date: date, end_date: date):
+        for key, (total, count) in self._rollups.get(user_id, {}).items():
+            if start_date <= key[0] <= end_date and count > 0:
+                yield key, total, count
+
+    async def apply_changes(self, session, added: Iterable[Any] = (), removed: Iterable[Any] = ()) -> None:
+        for items, sign in ((added, 1), (removed, -1)):
+            for item in items:
+                key = (
+                    _field(item, "transaction_date"),
+                    _field(item, "type"),
+                    _field(item, "category"),
+                )
+                rollups = self._rollups.setdefault(_field(item, "user_id"), {})
+                entry = rollups.setdefault(key, [Decimal(0), 0])
+                entry[0] += sign * Decimal(_field(item, "amount"))
+                entry[1] += sign
+
+    def rebuild_from(self, transactions: Iterable[Transaction]) -> int:
+        """Synchronous counterpart of rebuild() over in-memory rows."""
+        self._rollups.clear()
+        for obj in transactions:
+            entry = self._rollups.setdefault(obj.user_id, {}).setdefault(
+                (obj.transaction_date, obj.type, obj.category), [Decimal(0), 0]
+            )
+            entry[0] += Decimal(obj.amount)
+            entry[1] += 1
+        return sum(len(rollups) for rollups in self._rollups.values())
+
+    async def sum_income_expense(self, session, user_id: int, start_date: date, end_date: date):
+        income = expense = Decimal(0)
+        for (_, txn_type, _), total, _ in self._window(user_id, start_date, end_date):
+            if txn_type == TransactionType.INCOME:
+                income += total
+            else:
+                expense += total
+        return IncomeExpense(income, expense, income - expense)
+
+    date_bucket = staticmethod(_date_bucket)
+
+    async def group_sum_by_field(
+        self,
+        session,
+        user_id: int,
+        field: Any,
+        start_date: date,
+        end_date: date,
+        txn_type: Optional[TransactionType] = None
+    ):
+        fields = list(field) if isinstance(field, (list, tuple)) else [field]
+        positions = {"rollup_date": 0, "type": 1, "category": 2}
+
+        def project(key):
+            values = []
+            for item in fields:
+                if isinstance(item, _DateBucket):
+                    values.append(item(key[0]))
+                else:
+                    values.append(key[positions[item.key]])
+            return tuple(values)
+
+        groups: Dict[tuple, Decimal] = {}
+        for key, total, _ in self._window(user_id, start_date, end_date):
+            if txn_type and key[1] != txn_type:
+                continue
+            group = project(key)
+            groups[group] = groups.get(group, Decimal(0)) + total
+        return [(*group, total) for group, total in groups.items()]
+
+    async def dashboard_aggregates(
+        self,
+        session,
+        user_id: int,
+        month_start: date,
+        month_end: date,
+        week_start: date,
+        week_end: date,
+        as_of: date
+    ):
+        groups: Dict[tuple, List[Any]] = {}
+        window = self._window(user_id, min(month_start, week_start), max(month_end, week_end))
+        for (rollup_date, txn_type, category), total, count in window:
+            entry = groups.setdefault((txn_type, category), [Decimal(0), 0, Decimal(0), Decimal(0)])
+            if month_start <= rollup_date <= month_end:
+                entry[0] += total
+                entry[1] += count
+                if rollup_date <= as_of:
+                    entry[2] += total
+            if week_start <= rollup_date <= week_end:
+                entry[3] += total
+        return [DashboardRow(*key, *values) for key, values in groups.items()]
+
+
+class InMemoryDataVersionRepository(DataVersionRepository):
+
+    def __init__(self):
+        super().__init__()
+        self._versions: Dict[str, int] = {}
+
+    async def get_version(self, session, name: str) -> int:
+        return self._versions.get(name, 0)
+
+    async def bump(self, session, name: str) -> int:
+        self._versions[name] = self._versions.get(name, 0) + 1
+        return self._versions[name]
+
+
+class InMemoryRecurringTemplateRepository(RecurringTemplateRepository):
+
+    def __init__(self):
+        super().__init__()
+        self._rows: Dict[int, RecurringTemplate] = {}
+        self._next_id = 1
+
+    def _owned(self, user_id: int, obj_id: int) -> Optional[RecurringTemplate]:
+        obj = self._rows.get(obj_id)
+        return obj if obj is not None and obj.user_id == user_id else None
+
+    async def create(self, session, obj: RecurringTemplate) -> RecurringTemplate:
+        now = utc_now()
+        obj.id = self._next_id
+        self._next_id += 1
+        if obj.is_active is None:
+            obj.is_active = True
+        obj.created_at = obj.created_at or now
+        obj.updated_at = obj.updated_at or now
+        self._rows[obj.id] = obj
+        return obj
+
+    async def get_by_id(self, session, user_id: int, obj_id: int) -> Optional[RecurringTemplate]:
+        return self._owned(user_id, obj_id)
+
+    async def get_all(self, session, user_id: int, skip: int = 0, limit: int = 30):
+        owned = [obj for _, obj in sorted(self._rows.items()) if obj.user_id == user_id]
+        return owned[skip:skip + limit]
+
+    async def update(self, session, user_id: int, obj_id: int, data: dict):
+        obj = self._owned(user_id, obj_id)
+        if obj is None:
+            return None
+        for key, value in data.items():
+            setattr(obj, key, value)
+        obj.updated_at = utc_now()
+        return obj
+
+    async def delete(self, session, user_id: int, obj_id: int) -> bool:
+        if self._owned(user_id, obj_id) is None:
+            return False
+        del self._rows[obj_id]
+        return True
+
+    async def get_active_for_window(
+        self,
+        session,
+        start_date: date,
+        end_date: date,
+        user_id: Optional[int] = None,
+        pending_from: Optional[date] = None
+    ) -> List[RecurringTemplate]:
+        return [
+            obj for _, obj in sorted(self._rows.items())
+            if obj.is_active
+            and obj.start_date <= end_date
+            and (obj.end_date is None or obj.end_date >= start_date)
+            and (user_id is None or obj.user_id == user_id)
+            and (
+                pending_from is None
+                or obj.generated_through is None
+                or obj.generated_through < pending_from
+            )
+        ]
+
+    async def advance_generated_through(self, session, watermarks: Dict[int, date]) -> None:
+        for obj_id, value in watermarks.items():
+            obj = self._rows[obj_id]
+            if obj.generated_through is None or value > obj.generated_through:
+                obj.generated_through = value
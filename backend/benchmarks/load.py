@@ -0,0 +1,287 @@
+"""
+Drive every transaction route at fixed concurrency levels and report latency.
+
+Each endpoint runs on its own at each concurrency level: a short unmeasured
+warm-up, then --requests requests shared by that many concurrent workers.
+Write endpoints create, modify and delete real rows, so point this at a
+disposable database seeded with benchmarks.datagen. Requests act as one
+user (--user); seed with --users to measure that user among many. Requires httpx.
+
+Usage (from the backend directory, with the API running):
+    python -m benchmarks.load --concurrency 1,8,32 --requests 500 --output results.json
+    python -m benchmarks.load --endpoints list_page,summary_dashboard --concurrency 16
+    python -m benchmarks.load --endpoints batch --batch-ops 100
+"""
+import argparse
+import asyncio
+import io
+import json
+import random
+import time
+from dataclasses import dataclass
+from datetime import date
+from typing import Callable, Dict, List, Optional
+
+from benchmarks.datagen import generate_transactions, write_csv
+from benchmarks.report import format_table, summarize
+
+API_PREFIX = "/api/v1/transactions"
+
+
+@dataclass
+class Context:
+    """State shared by request builders during a run."""
+
+    rng: random.Random
+    today: date
+    ids: List[int]
+    deletable: List[int]
+    bulk_body: bytes
+    batch_ops: int
+
+
+@dataclass
+class Endpoint:
+    name: str
+    method: str
+    build: Callable[[Context], dict]
+    # Unmeasured preparation before each concurrency level (e.g. rows to delete).
+    prepare: Optional[Callable] = None
+
+
+def _new_transaction(ctx: Context) -> dict:
+    row = next(generate_transactions(1, seed=ctx.rng.randrange(1 << 30), end=ctx.today))
+    return {
+        "amount": str(row["amount"]),
+        "type": row["type"].value,
+        "category": row["category"].value,
+        "description": row["description"],
+        "transaction_date": row["transaction_date"].isoformat(),
+    }
+
+
+def _month_params(ctx: Context) -> dict:
+    return {"year": ctx.today.year, "month": ctx.today.month}
+
+
+def _known_id(ctx: Context) -> int:
+    return ctx.rng.choice(ctx.ids)
+
+
+def _batch_operations(ctx: Context) -> List[dict]:
+    # Half creates, half updates of distinct existing rows, like a client
+    # syncing its offline edits.
+    updates = ctx.rng.sample(ctx.ids, min(ctx.batch_ops // 2, len(ctx.ids)))
+    operations = [
+        {"op": "update", "id": txn_id,
+         "data": {"description": f"bench {ctx.rng.randrange(1_000_000)}"}}
+        for txn_id in updates
+    ]
+    operations += [
+        {"op": "create", "data": _new_transaction(ctx)}
+        for _ in range(ctx.batch_ops - len(updates))
+    ]
+    ctx.rng.shuffle(operations)
+    return operations
+
+
+async def _create_rows(client, count: int, ctx: Context) -> List[int]:
+    ids = []
+    for _ in range(count):
+        response = await client.post(f"{API_PREFIX}/", json=_new_transaction(ctx))
+        response.raise_for_status()
+        ids.append(response.json()["data"]["id"])
+    return ids
+
+
+async def _prepare_delete(client, ctx: Context, count: int) -> None:
+    ctx.deletable = await _create_rows(client, count, ctx)
+
+
+ENDPOINTS = [
+    Endpoint("create", "POST", lambda ctx: {
+        "url": f"{API_PREFIX}/", "json": _new_transaction(ctx),
+    }),
+    Endpoint("bulk_import", "POST", lambda ctx: {
+        "url": f"{API_PREFIX}/bulk",
+        "files": {"file": ("bench.csv", ctx.bulk_body, "text/csv")},
+    }),
+    Endpoint("batch", "POST", lambda ctx: {
+        "url": f"{API_PREFIX}/batch", "json": {"operations": _batch_operations(ctx)},
+    }),
+    Endpoint("list_page", "GET", lambda ctx: {
+        "url": f"{API_PREFIX}/",
+        "params": {"page_no": ctx.rng.randint(1, 50), "max_per_page": 20},
+    }),
+    Endpoint("list_cursor", "GET", lambda ctx: {
+        "url": f"{API_PREFIX}/",
+        "params": {"pagination": "cursor", "max_per_page": 20, "include_total": "false"},
+    }),
+    Endpoint("export_month", "GET", lambda ctx: {
+        "url": f"{API_PREFIX}/export",
+        "params": {"format": "ndjson", **_month_params(ctx)},
+    }),
+    Endpoint("get_by_id", "GET", lambda ctx: {
+        "url": f"{API_PREFIX}/{_known_id(ctx)}",
+    }),
+    Endpoint("update", "PUT", lambda ctx: {
+        "url": f"{API_PREFIX}/{_known_id(ctx)}",
+        "json": {"description": f"bench {ctx.rng.randrange(1_000_000)}"},
+    }),
+    Endpoint("delete", "DELETE", lambda ctx: {
+        "url": f"{API_PREFIX}/{ctx.deletable.pop()}",
+    }, prepare=_prepare_delete),
+    Endpoint("summary_monthly", "GET", lambda ctx: {
+        "url": f"{API_PREFIX}/summary/monthly", "params": _month_params(ctx),
+    }),
+    Endpoint("summary_weekly", "GET", lambda ctx: {
+        "url": f"{API_PREFIX}/summary/weekly",
+    }),
+    Endpoint("summary_category", "GET", lambda ctx: {
+        "url": f"{API_PREFIX}/summary/category", "params": _month_params(ctx),
+    }),
+    Endpoint("summary_projection", "GET", lambda ctx: {
+        "url": f"{API_PREFIX}/summary/projection", "params": _month_params(ctx),
+    }),
+    Endpoint("summary_dashboard", "GET", lambda ctx: {
+        "url": f"{API_PREFIX}/summary/dashboard", "params": _month_params(ctx),
+    }),
+    Endpoint("summary_series", "GET", lambda ctx: {
+        "url": f"{API_PREFIX}/summary/series",
+        "params": {
+            "from": f"{ctx.today.year - 1:04d}-{ctx.today.month:02d}",
+            "to": f"{ctx.today.year:04d}-{ctx.today.month:02d}",
+            "granularity": "week",
+        },
+    }),
+]
+
+
+async def _fetch_ids(client, limit: int = 500) -> List[int]:
+    response = await client.get(
+        f"{API_PREFIX}/",
+        params={"pagination": "cursor", "max_per_page": 100, "include_total": "false"},
+    )
+    response.raise_for_status()
+    return [row["id"] for row in response.json()["data"]["data"]][:limit]
+
+
+async def run_level(client, endpoint: Endpoint, ctx: Context, concurrency: int,
+                    requests: int, warmup: int) -> dict:
+    if endpoint.prepare is not None:
+        await endpoint.prepare(client, ctx, requests + warmup)
+
+    latencies: List[float] = []
+    errors = 0
+
+    async def phase(count: int, record: bool):
+        remaining = count
+
+        async def worker():
+            nonlocal remaining, errors
+            while remaining > 0:
+                remaining -= 1
+                kwargs = endpoint.build(ctx)
+
+                start = time.perf_counter()
+                response = await client.request(endpoint.method, **kwargs)
+                await response.aread()
+                elapsed_ms = (time.perf_counter() - start) * 1000
+
+                if record:
+                    latencies.append(elapsed_ms)
+                    if response.status_code >= 400:
+                        errors += 1
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+    await phase(warmup, record=False)
+    started = time.perf_counter()
+    await phase(requests, record=True)
+    elapsed = time.perf_counter() - started
+
+    return summarize(endpoint.name, concurrency, latencies, errors, elapsed)
+
+
+async def run(base_url: str, endpoints: List[Endpoint], levels: List[int],
+              requests: int, warmup: int, bulk_rows: int, batch_ops: int, seed: int,
+              timeout: float, user_id: int) -> List[dict]:
+    try:
+        import httpx
+    except ImportError as exc:
+        raise SystemExit("benchmarks.load requires the 'httpx' package") from exc
+
+    bulk = io.StringIO()
+    write_csv(generate_transactions(bulk_rows, seed=seed), bulk)
+
+    limits = httpx.Limits(max_connections=max(levels), max_keepalive_connections=max(levels))
+    headers = {"X-User-Id": str(user_id)}
+    async with httpx.AsyncClient(
+        base_url=base_url, timeout=timeout, limits=limits, headers=headers
+    ) as client:
+        ctx = Context(
+            rng=random.Random(seed),
+            today=date.today(),
+            ids=[],
+            deletable=[],
+            bulk_body=bulk.getvalue().encode("utf-8"),
+            batch_ops=batch_ops,
+        )
+        ctx.ids = await _fetch_ids(client) or await _create_rows(client, 50, ctx)
+
+        results = []
+        for endpoint in endpoints:
+            for concurrency in levels:
+                result = await run_level(client, endpoint, ctx, concurrency, requests, warmup)
+                print(
+                    f"{endpoint.name:<22} c={concurrency:<4} "
+                    f"p50={result['p50_ms']:.2f}ms p99={result['p99_ms']:.2f}ms "
+                    f"{result['throughput_rps']:.0f} rps"
+                )
+                results.append(result)
+        return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--concurrency", default="1,8,32",
+                        help="comma-separated concurrency levels")
+    parser.add_argument("--requests", type=int, default=200,
+                        help="measured requests per endpoint and level")
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--endpoints", help="comma-separated subset of: "
+                        + ", ".join(endpoint.name for endpoint in ENDPOINTS))
+    parser.add_argument("--bulk-rows", type=int, default=100, help="rows per bulk import")
+    parser.add_argument("--batch-ops", type=int, default=20, help="operations per batch")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--user", dest="user_id", type=int, default=1,
+                        help="user id sent in X-User-Id")
+    parser.add_argument("--output", help="write results as JSON for benchmarks.report")
+    args = parser.parse_args()
+
+    by_name: Dict[str, Endpoint] = {endpoint.name: endpoint for endpoint in ENDPOINTS}
+    if args.endpoints:
+        unknown = set(args.endpoints.split(",")) - set(by_name)
+        if unknown:
+            parser.error(f"unknown endpoints: {', '.join(sorted(unknown))}")
+        endpoints = [by_name[name] for name in args.endpoints.split(",")]
+    else:
+        endpoints = ENDPOINTS
+    levels = [int(level) for level in args.concurrency.split(",")]
+
+    results = asyncio.run(run(
+        args.base_url, endpoints, levels, args.requests, args.warmup,
+        args.bulk_rows, args.batch_ops, args.seed, args.timeout, args.user_id,
+    ))
+
+    print()
+    print(format_table(results))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump({"base_url": args.base_url, "results": results}, handle, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+Summarize load-test results as per-endpoint latency percentiles and throughput.
+
+Reads the JSON written by benchmarks.load. With --baseline, it flags endpoints
+whose p95 latency grew or whose throughput dropped by more than --threshold,
+and exits non-zero so it can gate CI.
+
+Usage (from the backend directory):
+    python -m benchmarks.report results.json
+    python -m benchmarks.report results.json --baseline baseline.json --threshold 0.15
+"""
+import argparse
+import json
+import math
+from typing import Dict, List, Sequence, Tuple
+
+
+def percentile(sorted_values: Sequence[float], q: float) -> float:
+    """Linear-interpolated percentile of already sorted values, q in [0, 100]."""
+    if not sorted_values:
+        return 0.0
+    rank = (len(sorted_values) - 1) * q / 100
+    low = math.floor(rank)
+    high = math.ceil(rank)
+    if low == high:
+        return sorted_values[low]
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (rank - low)
+
+
+def summarize(
+    endpoint: str,
+    concurrency: int,
+    latencies_ms: List[float],
+    errors: int,
+    elapsed_seconds: float
+) -> dict:
+    """Reduce raw latencies of one endpoint/concurrency run to a result row."""
+    values = sorted(latencies_ms)
+    count = len(values)
+    return {
+        "endpoint": endpoint,
+        "concurrency": concurrency,
+        "requests": count,
+        "errors": errors,
+        "elapsed_seconds": round(elapsed_seconds, 3),
+        "throughput_rps": round(count / elapsed_seconds, 1) if elapsed_seconds else 0.0,
+        "mean_ms": round(sum(values) / count, 3) if count else 0.0,
+        "p50_ms": round(percentile(values, 50), 3),
+        "p95_ms": round(percentile(values, 95), 3),
+        "p99_ms": round(percentile(values, 99), 3),
+        "max_ms": round(values[-1], 3) if count else 0.0,
+    }
+
+
+COLUMNS = (
+    ("endpoint", "endpoint", "<22"),
+    ("conc", "concurrency", ">5"),
+    ("reqs", "requests", ">7"),
+    ("errs", "errors", ">5"),
+    ("rps", "throughput_rps", ">9"),
+    ("p50 ms", "p50_ms", ">9"),
+    ("p95 ms", "p95_ms", ">9"),
+    ("p99 ms", "p99_ms", ">9"),
+    ("max ms", "max_ms", ">9"),
+)
+
+
+def format_table(results: List[dict]) -> str:
+    header = "  ".join(f"{title:{spec}}" for title, _, spec in COLUMNS)
+    lines = [header, "-" * len(header)]
+    for row in results:
+        lines.append("  ".join(f"{row[key]:{spec}}" for _, key, spec in COLUMNS))
+    return "\n".join(lines)
+
+
+def compare(results: List[dict], baseline: List[dict], threshold: float) -> List[str]:
+    """Describe every endpoint/concurrency pair that regressed past the threshold."""
+    previous: Dict[Tuple[str, int], dict] = {
+        (row["endpoint"], row["concurrency"]): row for row in baseline
+    }
+    regressions = []
+    for row in results:
+        before = previous.get((row["endpoint"], row["concurrency"]))
+        if before is None:
+            continue
+
+        label = f"{row['endpoint']} @ {row['concurrency']}"
+        if before["p95_ms"] and row["p95_ms"] > before["p95_ms"] * (1 + threshold):
+            regressions.append(
+                f"{label}: p95 {before['p95_ms']:.2f} ms -> {row['p95_ms']:.2f} ms"
+            )
+        if before["throughput_rps"] and row["throughput_rps"] < before["throughput_rps"] * (1 - threshold):
+            regressions.append(
+                f"{label}: throughput {before['throughput_rps']:.1f} -> {row['throughput_rps']:.1f} rps"
+            )
+    return regressions
+
+
+def load_results(path: str) -> List[dict]:
+    with open(path, encoding="utf-8") as handle:
+        return json.load(handle)["results"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("results", help="JSON written by benchmarks.load")
+    parser.add_argument("--baseline", help="earlier results to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="allowed relative change before flagging (default 0.10)")
+    args = parser.parse_args()
+
+    results = load_results(args.results)
+    print(format_table(results))
+
+    if args.baseline:
+        regressions = compare(results, load_results(args.baseline), args.threshold)
+        if regressions:
+            print("\nRegressions:")
+            for line in regressions:
+                print(f"  {line}")
+            raise SystemExit(1)
+        print("\nNo regressions against baseline")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Compare per-row cost of the transaction list response before and after the
+fast read path.
+
+before: ORM-like objects -> TransactionResponseDto.model_validate per row ->
+        FastAPI response_model validation + serialization -> JSONResponse
+after:  column tuples -> dicts -> FastJSONResponse (orjson)
+
+Both bodies are checked to be identical before timing.
+
+Usage (from the backend directory):
+    python -m benchmarks.serialization --rows 100 --repeat 200
+"""
+import argparse
+import asyncio
+import random
+import time
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from src.domain_model.dtos.base_dtos import ApiResponseDto, PaginatedResponseDto
+from src.domain_model.dtos.transaction_dtos import TransactionResponseDto
+from src.services.transaction_service import RESPONSE_FIELDS
+from src.utils.constants import TransactionType, TransactionCategory
+from src.utils.responses import FastJSONResponse
+
+
+RESPONSE_MODEL = ApiResponseDto[PaginatedResponseDto[TransactionResponseDto]]
+
+
+def make_rows(count: int, seed: int = 42):
+    rng = random.Random(seed)
+    categories = list(TransactionCategory)
+    now = datetime(2026, 1, 31, 12, 0, tzinfo=timezone.utc)
+    rows = []
+    for txn_id in range(1, count + 1):
+        created = now - timedelta(seconds=rng.randint(0, 10_000_000), microseconds=rng.randint(0, 999_999))
+        values = {
+            "amount": Decimal(rng.randint(100, 50_000)) / 100,
+            "type": rng.choice(list(TransactionType)),
+            "category": rng.choice(categories),
+            "description": rng.choice([None, "coffee", "rent for January", "salary"]),
+            "transaction_date": date(2026, 1, rng.randint(1, 31)),
+            "id": txn_id,
+            "user_id": 1,
+            "created_at": created,
+            "updated_at": created,
+        }
+        rows.append(tuple(values[field] for field in RESPONSE_FIELDS))
+    return rows
+
+
+async def render_before(objects, response_field) -> bytes:
+    content = ApiResponseDto(
+        data=PaginatedResponseDto(
+            data=[TransactionResponseDto.model_validate(obj) for obj in objects],
+            total=len(objects),
+            page_no=1,
+            max_per_page=len(objects),
+            current_count=len(objects),
+        ),
+        success=True,
+        message="Transactions fetched successfully",
+    )
+    serialized = await serialize_response(field=response_field, response_content=content)
+    return JSONResponse(serialized).body
+
+
+def render_after(rows) -> bytes:
+    return FastJSONResponse({
+        "data": {
+            "data": [dict(zip(RESPONSE_FIELDS, row)) for row in rows],
+            "total": len(rows),
+            "page_no": 1,
+            "max_per_page": len(rows),
+            "current_count": len(rows),
+        },
+        "success": True,
+        "message": "Transactions fetched successfully",
+    }).body
+
+
+async def run(rows_per_page: int, repeat: int):
+    rows = make_rows(rows_per_page)
+    objects = [SimpleNamespace(**dict(zip(RESPONSE_FIELDS, row))) for row in rows]
+    response_field = create_response_field(name="response", type_=RESPONSE_MODEL)
+
+    before_body = await render_before(objects, response_field)
+    after_body = render_after(rows)
+    if before_body != after_body:
+        raise SystemExit("Wire format mismatch between before and after paths")
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        await render_before(objects, response_field)
+    before = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        render_after(rows)
+    after = time.perf_counter() - start
+
+    total_rows = rows_per_page * repeat
+    print(f"rows/page={rows_per_page} pages={repeat} (bodies identical)")
+    print(f"before: {before / total_rows * 1e6:8.2f} us/row  {before / repeat * 1e3:8.3f} ms/page")
+    print(f"after:  {after / total_rows * 1e6:8.2f} us/row  {after / repeat * 1e3:8.3f} ms/page")
+    print(f"speedup: {before / after:.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100, help="rows per page")
+    parser.add_argument("--repeat", type=int, default=200, help="pages to render")
+    args = parser.parse_args()
+    asyncio.run(run(args.rows, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
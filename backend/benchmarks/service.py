@@ -0,0 +1,231 @@
+"""
+Micro-benchmarks for TransactionService and the response DTOs, without a database.
+
+The service runs on the in-memory repositories from benchmarks.inmemory over
+a seeded dataset, so only Python work is measured. Repository time is part of
+each service number; compare runs against each other, not against Postgres.
+
+Usage (from the backend directory):
+    python -m benchmarks.service
+    python -m benchmarks.service -k summary --json after.json --compare before.json
+"""
+import io
+import sys
+from datetime import date
+
+from src.domain_model.dtos.base_dtos import ApiResponseDto, PaginatedResponseDto
+from src.domain_model.dtos.transaction_dtos import (
+    CategoryBreakdownItemDto,
+    TransactionBatchRequestDto,
+    TransactionCreateDto,
+    TransactionResponseDto,
+    TransactionUpdateDto,
+)
+from src.domain_model.models.transaction import Transaction
+from src.services.transaction_service import TransactionService
+from src.utils.bulk_import import IMPORT_FORMAT_CSV
+from src.utils.cache import SummaryCache
+from src.utils.cache_backends import InMemoryCacheBackend
+from src.utils.constants import TransactionCategory, TransactionType
+from src.utils.responses import encode_json
+
+from benchmarks.datagen import generate_transactions, write_csv
+from benchmarks.harness import run_suite
+from benchmarks.inmemory import (
+    InMemoryDailyRollupRepository,
+    InMemoryDataVersionRepository,
+    InMemoryTransactionRepository,
+    NullSession,
+)
+
+DATASET_ROWS = 10_000
+PAGE_SIZE = 20
+TODAY = date(2026, 6, 15)
+# generate_transactions assigns every row to user 1 by default
+USER_ID = 1
+
+PAGE_MODEL = ApiResponseDto[PaginatedResponseDto[TransactionResponseDto]]
+
+
+def fixtures() -> dict:
+    repo = InMemoryTransactionRepository()
+    rollups = InMemoryDailyRollupRepository()
+    for values in generate_transactions(DATASET_ROWS, seed=7, days=365, end=TODAY):
+        repo._store(Transaction(**values))
+    rollups.rebuild_from(repo._rows.values())
+
+    versions = InMemoryDataVersionRepository()
+    cache = SummaryCache(InMemoryCacheBackend(max_entries=1024), ttl_seconds=3600)
+
+    bulk = io.StringIO()
+    write_csv(generate_transactions(500, seed=11, end=TODAY), bulk)
+
+    return {
+        "session": NullSession(),
+        "service": TransactionService(repo, rollups, None, versions),
+        "cached_service": TransactionService(repo, rollups, cache, versions),
+        "page": repo._descending(USER_ID)[:PAGE_SIZE],
+        "bulk_csv": bulk.getvalue().encode("utf-8"),
+    }
+
+
+# =========================================================
+# DTO construction and serialization
+# =========================================================
+
+def bench_dto_response_validate_page(benchmark, page):
+    benchmark(lambda: [TransactionResponseDto.model_validate(obj) for obj in page])
+
+
+def bench_dto_response_dump_json_page(benchmark, page):
+    dtos = [TransactionResponseDto.model_validate(obj) for obj in page]
+    benchmark(lambda: [dto.model_dump_json() for dto in dtos])
+
+
+def bench_dto_paginated_response_json(benchmark, page):
+    def build():
+        return PAGE_MODEL(
+            data=PaginatedResponseDto[TransactionResponseDto](
+                data=[TransactionResponseDto.model_validate(obj) for obj in page],
+                total=DATASET_ROWS,
+                page_no=1,
+                max_per_page=PAGE_SIZE,
+                current_count=len(page),
+            ),
+            success=True,
+            message="Transactions fetched successfully",
+        ).model_dump_json()
+
+    benchmark(build)
+
+
+def bench_dto_category_breakdown_json(benchmark):
+    grouped = [(category, index * 10) for index, category in enumerate(TransactionCategory)]
+
+    def build():
+        breakdown = TransactionService._build_category_breakdown(TODAY.year, TODAY.month, grouped)
+        return breakdown.model_dump_json()
+
+    benchmark(build)
+
+
+def bench_dto_category_item_validate(benchmark):
+    benchmark(CategoryBreakdownItemDto, category=TransactionCategory.FOOD, total="12.50")
+
+
+def bench_encode_fast_path_page(benchmark, service, session):
+    page = service.get_paginated
+
+    async def render():
+        return encode_json({
+            "data": await page(session, USER_ID, 1, PAGE_SIZE, include_total=False),
+            "success": True,
+            "message": "Transactions fetched successfully",
+        })
+
+    benchmark(render)
+
+
+# =========================================================
+# Reads
+# =========================================================
+
+def bench_service_get_paginated_first(benchmark, service, session):
+    benchmark(service.get_paginated, session, USER_ID, 1, PAGE_SIZE, True)
+
+
+def bench_service_get_paginated_deep(benchmark, service, session):
+    benchmark(service.get_paginated, session, USER_ID, 400, PAGE_SIZE, False)
+
+
+def bench_service_get_cursor_paginated(benchmark, service, session):
+    benchmark(service.get_cursor_paginated, session, USER_ID, None, PAGE_SIZE, False)
+
+
+def bench_service_get_by_id(benchmark, service, session):
+    benchmark(service.get_by_id, session, USER_ID, DATASET_ROWS // 2)
+
+
+def bench_summary_monthly(benchmark, service, session):
+    benchmark(service.get_monthly_summary, session, USER_ID, TODAY.year, TODAY.month)
+
+
+def bench_summary_monthly_cached(benchmark, cached_service, session):
+    benchmark(cached_service.get_monthly_summary, session, USER_ID, TODAY.year, TODAY.month)
+
+
+def bench_summary_category(benchmark, service, session):
+    benchmark(service.get_category_breakdown, session, USER_ID, TODAY.year, TODAY.month)
+
+
+def bench_summary_projection(benchmark, service, session):
+    benchmark(service.get_projection, session, USER_ID, TODAY.year, TODAY.month)
+
+
+def bench_summary_dashboard(benchmark, service, session):
+    benchmark(service.get_dashboard, session, USER_ID, TODAY.year, TODAY.month)
+
+
+def bench_summary_series_weekly(benchmark, service, session):
+    benchmark(
+        service.get_summary_series,
+        session, USER_ID, (TODAY.year - 1, TODAY.month), (TODAY.year, TODAY.month), "week"
+    )
+
+
+# =========================================================
+# Writes
+# =========================================================
+
+def bench_service_create(benchmark, service, session):
+    dto = TransactionCreateDto(
+        amount="42.10",
+        type=TransactionType.EXPENSE,
+        category=TransactionCategory.FOOD,
+        transaction_date=TODAY,
+    )
+    benchmark(service.create_transaction, session, USER_ID, dto)
+
+
+def bench_service_update(benchmark, service, session):
+    dto = TransactionUpdateDto(description="benchmark")
+    benchmark(service.update_transaction, session, USER_ID, DATASET_ROWS // 2, dto)
+
+
+def bench_service_bulk_import_500(benchmark, service, session, bulk_csv):
+    async def run():
+        return await service.bulk_import(
+            session, USER_ID, io.BytesIO(bulk_csv), IMPORT_FORMAT_CSV, chunk_size=250, max_errors=10
+        )
+
+    benchmark(run)
+
+
+def bench_service_batch_40(benchmark, service, session):
+    # 20 creates and 20 updates, then the created rows are deleted in a
+    # second batch so the dataset keeps its size across rounds.
+    create = {
+        "op": "create",
+        "data": {"amount": "12.50", "type": "expense", "category": "food", "transaction_date": str(TODAY)},
+    }
+    writes = TransactionBatchRequestDto.model_validate({"operations": [create] * 20 + [
+        {"op": "update", "id": txn_id, "data": {"description": "batch"}} for txn_id in range(1, 21)
+    ]})
+
+    async def run():
+        applied = await service.apply_batch(session, USER_ID, writes.operations, max_operations=500)
+        cleanup = TransactionBatchRequestDto.model_validate({"operations": [
+            {"op": "delete", "id": result.id} for result in applied.results if result.op == "create"
+        ]})
+        return await service.apply_batch(session, USER_ID, cleanup.operations, max_operations=500)
+
+    benchmark(run)
+
+
+def main():
+    run_suite(sys.modules[__name__], fixtures, __doc__.strip().splitlines()[0])
+
+
+if __name__ == "__main__":
+    main()
+
@@ -0,0 +1,189 @@
+"""
+Print EXPLAIN ANALYZE output for every TransactionRepository query.
+
+Statements are captured from the real repository methods, so the plans
+reflect exactly what the API sends to Postgres. Queries run as one user
+(--user); seeded rows are spread over --users users.
+
+Usage (from the backend directory):
+    python -m scripts.explain_queries
+    python -m scripts.explain_queries --seed 1000000 --users 1000
+"""
+import argparse
+import asyncio
+from calendar import monthrange
+from datetime import date, timedelta
+
+from sqlalchemy import event, text
+
+from src.domain_model.models.transaction import Transaction
+from src.domain_model.repositories.transaction_repository import TransactionRepository
+from src.domain_model.repositories.daily_rollup_repository import DailyRollupRepository
+from src.domain_model.repositories.data_version_repository import DataVersionRepository
+from src.domain_model.repositories.transaction_partition_repository import (
+    TransactionPartitionRepository
+)
+from src.utils.constants import TransactionType, TransactionCategory, transactions_data_version
+from src.utils.database import engine, AsyncSessionLocal
+
+
+SEED_SQL = text(
+    """
+    INSERT INTO transactions (
+        user_id, amount, type, category, description, transaction_date,
+        is_recurring_generated, created_at, updated_at
+    )
+    SELECT
+        1 + floor(random() * :users)::int,
+        round((random() * 500 + 1)::numeric, 2),
+        (CASE WHEN random() < 0.15 THEN 'INCOME' ELSE 'EXPENSE' END)::transactiontype,
+        (:categories)[1 + floor(random() * :category_count)::int]::transactioncategory,
+        NULL,
+        CAST(:today AS date) - floor(random() * :days)::int,
+        random() < 0.05,
+        now(),
+        now()
+    FROM generate_series(1, :rows)
+    """
+)
+
+
+async def seed(rows: int, days: int, users: int):
+    """
+    Insert random rows, then rebuild the rollups over the seeded window and
+    bump every seeded user's data version, the bookkeeping the service layer
+    does per write, so rollup-backed summaries match the raw rows. Monthly
+    partitions for the window are created first so no row lands in the
+    default partition.
+    """
+    categories = [category.name for category in TransactionCategory]
+    today = date.today()
+    version_repo = DataVersionRepository()
+    async with AsyncSessionLocal() as session:
+        async with session.begin():
+            await TransactionPartitionRepository().ensure_range(
+                session, today - timedelta(days=days), today
+            )
+        async with session.begin():
+            await session.execute(
+                SEED_SQL,
+                {
+                    "categories": categories,
+                    "category_count": len(categories),
+                    "days": days,
+                    "rows": rows,
+                    "users": users,
+                    "today": today,
+                },
+            )
+            await DailyRollupRepository().rebuild(session, today - timedelta(days=days), today)
+            for user_id in range(1, users + 1):
+                await version_repo.bump(session, transactions_data_version(user_id))
+        async with session.begin():
+            await session.execute(text("ANALYZE transactions"))
+            await session.execute(text("ANALYZE daily_rollups"))
+    print(f"Seeded {rows} transactions for {users} users over the last {days} days")
+
+
+def build_queries(repo: TransactionRepository, today: date, user_id: int = 1):
+    year, month = today.year, today.month
+    month_start = date(year, month, 1)
+    month_end = date(year, month, monthrange(year, month)[1])
+
+    return [
+        ("filter_transactions (first page)",
+         lambda s: repo.filter_transactions(s, user_id, skip=0, limit=10)),
+        ("filter_transactions (deep page)",
+         lambda s: repo.filter_transactions(s, user_id, skip=100_000, limit=10)),
+        ("filter_transactions (year/month)",
+         lambda s: repo.filter_transactions(s, user_id, year=year, month=month)),
+        ("filter_transactions (type)",
+         lambda s: repo.filter_transactions(s, user_id, txn_type=TransactionType.INCOME)),
+        ("filter_transactions (category)",
+         lambda s: repo.filter_transactions(s, user_id, category=TransactionCategory.FOOD)),
+        ("filter_transactions_keyset (first page)",
+         lambda s: repo.filter_transactions_keyset(s, user_id, limit=11)),
+        ("filter_transactions_keyset (after cursor)",
+         lambda s: repo.filter_transactions_keyset(s, user_id, cursor=(month_start, 0), limit=11)),
+        ("count_transactions",
+         lambda s: repo.count_transactions(s, user_id)),
+        ("count_transactions (year/month)",
+         lambda s: repo.count_transactions(s, user_id, year=year, month=month)),
+        ("sum_amount (expense, month)",
+         lambda s: repo.sum_amount(s, user_id, month_start, month_end, TransactionType.EXPENSE)),
+        ("sum_income_expense (month)",
+         lambda s: repo.sum_income_expense(s, user_id, month_start, month_end)),
+        ("group_sum_by_field (category, expense, month)",
+         lambda s: repo.group_sum_by_field(
+             s, user_id, Transaction.category, month_start, month_end, TransactionType.EXPENSE
+         )),
+        ("recurring_exists_for_month",
+         lambda s: repo.recurring_exists_for_month(
+             s, user_id, TransactionCategory.RENT, 1000, year, month
+         )),
+    ]
+
+
+async def capture_statements(session, run):
+    """Run a repository call and return the (statement, parameters) it sent."""
+    captured = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        captured.append((statement, parameters))
+
+    sync_engine = session.bind.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", capture)
+    try:
+        await run(session)
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", capture)
+    return captured
+
+
+async def explain_all(analyze: bool, user_id: int):
+    repo = TransactionRepository()
+    options = "ANALYZE, BUFFERS" if analyze else "COSTS"
+
+    async with AsyncSessionLocal() as session:
+        for name, run in build_queries(repo, date.today(), user_id):
+            captured = await capture_statements(session, run)
+
+            conn = await session.connection()
+            for statement, parameters in captured:
+                result = await conn.exec_driver_sql(
+                    f"EXPLAIN ({options}) {statement}", parameters
+                )
+                print("=" * 72)
+                print(name)
+                print("-" * 72)
+                for (line,) in result:
+                    print(line)
+
+        await session.rollback()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--seed", type=int, default=0,
+                        help="insert this many synthetic transactions first")
+    parser.add_argument("--users", type=int, default=1,
+                        help="spread seeded rows over this many user ids")
+    parser.add_argument("--user", dest="user_id", type=int, default=1,
+                        help="user id the queries run as")
+    parser.add_argument("--days", type=int, default=3 * 365,
+                        help="spread seeded rows over this many past days")
+    parser.add_argument("--no-analyze", action="store_true",
+                        help="print estimated plans without executing queries")
+    args = parser.parse_args()
+
+    async def run():
+        if args.seed:
+            await seed(args.seed, args.days, args.users)
+        await explain_all(analyze=not args.no_analyze, user_id=args.user_id)
+        await engine.dispose()
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
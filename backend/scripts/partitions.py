@@ -0,0 +1,222 @@
+"""
+Manage the monthly partitions of the transactions table.
+
+`create` adds partitions ahead of time and `split-default` moves rows
+that landed in the default partition into monthly partitions of their own
+(the scheduler does both daily), `detach` takes old months out of the
+table and archives or drops them (bumping the data version of every user
+with rows there), and `check-pruning` EXPLAINs the month-window repository
+queries and fails if any of them scans more than the current month's
+partition.
+
+Detached months disappear from listings and exports. Their daily rollups
+are kept, so summaries and series for those months still report them; run
+scripts.rebuild_rollups over the range if they should go as well (it bumps
+the owners' data versions and invalidates their cached summaries).
+
+Usage (from the backend directory):
+    python -m scripts.partitions list
+    python -m scripts.partitions create --ahead 6
+    python -m scripts.partitions split-default
+    python -m scripts.partitions detach --before 2024-01 --archive-schema archive
+    python -m scripts.partitions detach --before 2024-01 --drop
+    python -m scripts.partitions check-pruning
+"""
+import argparse
+import asyncio
+import json
+import sys
+from datetime import date, datetime
+
+from src.domain_model.repositories.data_version_repository import DataVersionRepository
+from src.domain_model.repositories.transaction_partition_repository import (
+    DEFAULT_PARTITION,
+    TransactionPartitionRepository,
+)
+from src.domain_model.repositories.transaction_repository import TransactionRepository
+from src.settings.config import settings
+from src.utils.constants import transactions_data_version
+from src.utils.database import engine, AsyncSessionLocal
+
+from scripts.explain_queries import build_queries, capture_statements
+
+
+# build_queries entries restricted to the current month.
+MONTH_WINDOW_QUERIES = (
+    "filter_transactions (year/month)",
+    "count_transactions (year/month)",
+    "sum_amount (expense, month)",
+    "sum_income_expense (month)",
+    "group_sum_by_field (category, expense, month)",
+    "recurring_exists_for_month",
+)
+
+
+def parse_month(value: str) -> date:
+    return datetime.strptime(value, "%Y-%m").date()
+
+
+async def list_partitions():
+    repo = TransactionPartitionRepository()
+    async with AsyncSessionLocal() as session:
+        partitions = await repo.list_partitions(session)
+
+    for partition in partitions:
+        print(f"{partition['name']:<28}{partition['estimated_rows']:>12,}  {partition['bounds']}")
+
+
+async def create(ahead: int):
+    repo = TransactionPartitionRepository()
+    async with AsyncSessionLocal() as session:
+        async with session.begin():
+            created = await repo.ensure_ahead(session, date.today(), ahead)
+
+    if created:
+        print("Created " + ", ".join(f"{month:%Y-%m}" for month in created))
+    else:
+        print("All partitions already exist")
+
+
+async def split_default():
+    repo = TransactionPartitionRepository()
+    async with AsyncSessionLocal() as session:
+        async with session.begin():
+            created = await repo.split_default(session)
+
+    if created:
+        months = ", ".join(f"{month:%Y-%m}" for month in created)
+        print(f"Moved {months} out of {DEFAULT_PARTITION}")
+    else:
+        print(f"No rows to move out of {DEFAULT_PARTITION}")
+
+
+async def detach(before: date, archive_schema, drop: bool, dry_run: bool):
+    if before > date.today().replace(day=1):
+        raise SystemExit("--before must not be later than the current month")
+
+    repo = TransactionPartitionRepository()
+    version_repo = DataVersionRepository()
+    async with AsyncSessionLocal() as session:
+        old = [
+            partition for partition in await repo.list_partitions(session)
+            if partition["month"] is not None and partition["month"] < before
+        ]
+        await session.rollback()
+
+        for partition in old:
+            if dry_run:
+                print(f"Would detach {partition['name']} (~{partition['estimated_rows']:,} rows)")
+                continue
+            # One transaction per month keeps the parent's exclusive lock short.
+            async with session.begin():
+                owners = await repo.owners(session, partition["name"])
+                await repo.detach(session, partition["name"], archive_schema, drop)
+                for user_id in owners:
+                    await version_repo.bump(session, transactions_data_version(user_id))
+            action = "dropped" if drop else f"moved to {archive_schema}" if archive_schema else "kept"
+            print(f"Detached {partition['name']} ({action})")
+
+    if not old:
+        print(f"No partitions before {before:%Y-%m}")
+
+
+def scanned_relations(plan: dict) -> set:
+    relations = set()
+    if "Relation Name" in plan:
+        relations.add(plan["Relation Name"])
+    for child in plan.get("Plans", ()):
+        relations |= scanned_relations(child)
+    return relations
+
+
+def scanned_partitions(plan: dict) -> set:
+    """Transactions partitions read by an EXPLAIN (FORMAT JSON) plan node."""
+    return {
+        relation for relation in scanned_relations(plan)
+        if relation.startswith("transactions_p") or relation == DEFAULT_PARTITION
+    }
+
+
+async def explain_partitions(session, run) -> set:
+    """Partitions the statements of a repository call would scan."""
+    conn = await session.connection()
+    partitions = set()
+    for statement, parameters in await capture_statements(session, run):
+        result = await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+        raw = result.scalar_one()
+        plan = json.loads(raw) if isinstance(raw, str) else raw
+        partitions |= scanned_partitions(plan[0]["Plan"])
+    return partitions
+
+
+async def check_pruning(user_id: int) -> bool:
+    today = date.today()
+    expected = {f"transactions_p{today:%Y_%m}"}
+    repo = TransactionRepository()
+    ok = True
+
+    async with AsyncSessionLocal() as session:
+        queries = dict(build_queries(repo, today, user_id))
+        for name in MONTH_WINDOW_QUERIES:
+            partitions = await explain_partitions(session, queries[name])
+            pruned = partitions <= expected
+            ok = ok and pruned
+            status = "ok" if pruned else "NOT PRUNED"
+            print(f"{name:<48}{status:<12}{', '.join(sorted(partitions)) or '-'}")
+        await session.rollback()
+
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("list", help="show partitions with estimated row counts")
+
+    create_parser = commands.add_parser("create", help="create upcoming monthly partitions")
+    create_parser.add_argument("--ahead", type=int, default=settings.PARTITION_MONTHS_AHEAD,
+                               help="months after the current one to create")
+
+    commands.add_parser(
+        "split-default", help="move default-partition rows into monthly partitions"
+    )
+
+    detach_parser = commands.add_parser("detach", help="detach months older than --before")
+    detach_parser.add_argument("--before", type=parse_month, required=True,
+                               help="first month to keep, as YYYY-MM")
+    target = detach_parser.add_mutually_exclusive_group()
+    target.add_argument("--archive-schema", help="move detached tables into this schema")
+    target.add_argument("--drop", action="store_true", help="drop detached tables")
+    detach_parser.add_argument("--dry-run", action="store_true")
+
+    pruning_parser = commands.add_parser(
+        "check-pruning", help="verify month queries scan one partition"
+    )
+    pruning_parser.add_argument("--user", dest="user_id", type=int, default=1,
+                                help="user id the queries run as")
+
+    args = parser.parse_args()
+
+    async def run():
+        try:
+            if args.command == "list":
+                await list_partitions()
+            elif args.command == "create":
+                await create(args.ahead)
+            elif args.command == "split-default":
+                await split_default()
+            elif args.command == "detach":
+                await detach(args.before, args.archive_schema, args.drop, args.dry_run)
+            else:
+                return await check_pruning(args.user_id)
+            return True
+        finally:
+            await engine.dispose()
+
+    if not asyncio.run(run()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
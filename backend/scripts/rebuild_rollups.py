@@ -0,0 +1,73 @@
+"""
+Rebuild the daily_rollups table from raw transactions.
+
+Use it to backfill after bulk loads that bypassed the service layer, or to
+repair drift. Without dates or a user the whole table is rebuilt. Every
+user whose rollups changed gets a data version bump, so ETags change.
+
+The affected months are also dropped from the summary cache, which only
+reaches the API workers when the cache backend is shared (redis). With the
+in-memory backend each worker keeps its cached summaries until they expire
+after SUMMARY_CACHE_TTL_SECONDS or the workers restart.
+
+Usage (from the backend directory):
+    python -m scripts.rebuild_rollups
+    python -m scripts.rebuild_rollups --from 2026-01-01 --to 2026-03-31
+    python -m scripts.rebuild_rollups --user 42
+"""
+import argparse
+import asyncio
+from datetime import date
+
+from src.domain_model.repositories.daily_rollup_repository import DailyRollupRepository
+from src.domain_model.repositories.data_version_repository import DataVersionRepository
+from src.settings.config import settings
+from src.utils.cache import summary_cache
+from src.utils.constants import transactions_data_version
+from src.utils.database import engine, AsyncSessionLocal
+
+
+async def rebuild(start_date, end_date, user_id):
+    repo = DailyRollupRepository()
+    version_repo = DataVersionRepository()
+    async with AsyncSessionLocal() as session:
+        async with session.begin():
+            # Months that had rollups before plus those that have them after.
+            affected = await repo.user_months(session, start_date, end_date, user_id)
+            rows = await repo.rebuild(session, start_date, end_date, user_id)
+            rebuilt = await repo.user_months(session, start_date, end_date, user_id)
+            for owner, months in rebuilt.items():
+                affected.setdefault(owner, set()).update(months)
+
+            for owner in sorted(affected):
+                await version_repo.bump(session, transactions_data_version(owner))
+
+    # After commit, so readers cannot re-cache the old totals.
+    if not summary_cache.backend.shared:
+        print(
+            "Warning: the summary cache backend is not shared; API workers keep "
+            f"cached summaries for up to {settings.SUMMARY_CACHE_TTL_SECONDS}s "
+            "unless restarted"
+        )
+    for owner, months in affected.items():
+        await summary_cache.invalidate_months(owner, months)
+    await summary_cache.backend.close()
+    await engine.dispose()
+    print(f"Rebuilt {rows} daily rollup rows for {len(affected)} users")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--from", dest="start_date", type=date.fromisoformat,
+                        help="first day to rebuild (inclusive)")
+    parser.add_argument("--to", dest="end_date", type=date.fromisoformat,
+                        help="last day to rebuild (inclusive)")
+    parser.add_argument("--user", dest="user_id", type=int,
+                        help="only rebuild this user's rollups")
+    args = parser.parse_args()
+
+    asyncio.run(rebuild(args.start_date, args.end_date, args.user_id))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,53 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Response
 from fastapi.responses import JSONResponse
 from src.settings.config import settings
+from src.services.maintenance_jobs import build_scheduler
+from src.services.service_registry import ServiceRegistry
+from src.utils.cache import summary_cache
+from src.utils.database import AsyncSessionLocal, pool_status
+from src.utils.metrics import mark_process_dead, render_metrics, set_pool_gauges
+from src.utils.timing import TimingMiddleware
 
 from src.controllers.transaction_controller import router as transaction_router
+from src.controllers.recurring_controller import router as recurring_router
+from src.controllers.admin_controller import router as admin_router
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application startup/shutdown hooks."""
+    cache = summary_cache if settings.SUMMARY_CACHE_ENABLED else None
+    # Stateless repositories and services, shared by requests and jobs.
+    services = ServiceRegistry(cache)
+    app.state.services = services
+    scheduler = build_scheduler(AsyncSessionLocal, services)
+    app.state.scheduler = scheduler
+    if settings.SCHEDULER_ENABLED:
+        await scheduler.start()
+
+    yield
+
+    await scheduler.stop()
+    await summary_cache.backend.close()
+    mark_process_dead()
+
+
 # Create FastAPI application instance
 app = FastAPI(
     title=settings.PROJECT_NAME,
     description="A simple expense tracker API",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
+app.add_middleware(TimingMiddleware, emit_header=settings.SERVER_TIMING_ENABLED)
+
 # Include API routers
 app.include_router(transaction_router)
+app.include_router(recurring_router)
+app.include_router(admin_router)
 
 
 @app.get("/health", tags=["Health"])
@@ -30,6 +66,16 @@ async def health_check():
     )
 
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus exposition for this worker, or all workers in multiprocess mode."""
+    # Sampled per scrape rather than on every checkout; in multiprocess mode
+    # each worker's gauges are as of the last scrape it served.
+    set_pool_gauges(pool_status())
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
+
+
 @app.get("/", tags=["Root"])
 async def root():
     """Root endpoint."""
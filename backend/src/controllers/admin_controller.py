@@ -0,0 +1,73 @@
+from typing import List
+
+from fastapi import APIRouter, Depends, Request
+
+from src.utils.cache import summary_cache
+from src.utils.database import pool_status
+from src.utils.dependencies import require_admin_endpoints
+from src.utils.timing import TimedRoute, timing_registry
+from src.domain_model.dtos.admin_dtos import (
+    CacheStatsDto,
+    PoolStatusDto,
+    SchedulerJobStatsDto,
+    RouteTimingStatsDto,
+)
+from src.domain_model.dtos.base_dtos import ApiResponseDto
+
+
+router = APIRouter(
+    prefix="/api/v1/admin",
+    tags=["Admin"],
+    route_class=TimedRoute,
+    dependencies=[Depends(require_admin_endpoints)]
+)
+
+
+@router.get(
+    "/cache",
+    response_model=ApiResponseDto[CacheStatsDto]
+)
+async def get_cache_stats():
+    return ApiResponseDto(
+        data=CacheStatsDto(**summary_cache.stats()),
+        success=True,
+        message="Cache stats fetched successfully"
+    )
+
+
+@router.get(
+    "/pool",
+    response_model=ApiResponseDto[PoolStatusDto]
+)
+async def get_pool_status():
+    return ApiResponseDto(
+        data=PoolStatusDto(**pool_status()),
+        success=True,
+        message="Pool status fetched successfully"
+    )
+
+
+@router.get(
+    "/scheduler",
+    response_model=ApiResponseDto[List[SchedulerJobStatsDto]]
+)
+async def get_scheduler_stats(request: Request):
+    scheduler = getattr(request.app.state, "scheduler", None)
+    jobs = scheduler.stats() if scheduler else []
+    return ApiResponseDto(
+        data=[SchedulerJobStatsDto(**job) for job in jobs],
+        success=True,
+        message="Scheduler stats fetched successfully"
+    )
+
+
+@router.get(
+    "/timings",
+    response_model=ApiResponseDto[List[RouteTimingStatsDto]]
+)
+async def get_route_timings():
+    return ApiResponseDto(
+        data=[RouteTimingStatsDto(**route) for route in timing_registry.stats()],
+        success=True,
+        message="Route timings fetched successfully"
+    )
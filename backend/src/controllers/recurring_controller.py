@@ -0,0 +1,179 @@
+from typing import List
+
+from fastapi import APIRouter, Depends, Query, Path, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.utils.dependencies import (
+    get_recurring_service,
+    get_current_user_id,
+    get_db_session
+)
+from src.utils.dates import YEAR_MONTH_PATTERN, parse_year_month
+from src.utils.exceptions import ServiceException
+from src.utils.exception_handler import ControllerExceptionHandler
+from src.utils.timing import TimedRoute
+from src.services.recurring_service import RecurringService
+from src.domain_model.dtos.recurring_dtos import (
+    RecurringTemplateCreateDto,
+    RecurringTemplateUpdateDto,
+    RecurringTemplateResponseDto,
+    RecurringGenerationResultDto,
+)
+from src.domain_model.dtos.base_dtos import ApiResponseDto
+
+
+router = APIRouter(
+    prefix="/api/v1/recurring-templates",
+    tags=["Recurring Templates"],
+    route_class=TimedRoute
+)
+
+
+@router.post(
+    "/",
+    response_model=ApiResponseDto[RecurringTemplateResponseDto],
+    status_code=status.HTTP_201_CREATED
+)
+async def create_template(
+    dto: RecurringTemplateCreateDto,
+    response: Response,
+    user_id: int = Depends(get_current_user_id),
+    session: AsyncSession = Depends(get_db_session),
+    service: RecurringService = Depends(get_recurring_service)
+):
+    try:
+        data = await service.create_template(session, user_id, dto)
+        return ApiResponseDto(
+            data=data,
+            success=True,
+            message="Recurring template created successfully"
+        )
+    except ServiceException as exc:
+        return await ControllerExceptionHandler.handle_service_exception(response, session, exc)
+    except Exception:
+        return await ControllerExceptionHandler.handle_unexpected_exception(response, session)
+
+
+@router.get(
+    "/",
+    response_model=ApiResponseDto[List[RecurringTemplateResponseDto]]
+)
+async def get_templates(
+    response: Response,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(30, ge=1, le=100),
+    user_id: int = Depends(get_current_user_id),
+    session: AsyncSession = Depends(get_db_session),
+    service: RecurringService = Depends(get_recurring_service)
+):
+    try:
+        data = await service.get_templates(session, user_id, skip, limit)
+        return ApiResponseDto(
+            data=data,
+            success=True,
+            message="Recurring templates fetched successfully"
+        )
+    except ServiceException as exc:
+        return await ControllerExceptionHandler.handle_service_exception(response, session, exc)
+    except Exception:
+        return await ControllerExceptionHandler.handle_unexpected_exception(response, session)
+
+
+@router.post(
+    "/generate",
+    response_model=ApiResponseDto[RecurringGenerationResultDto]
+)
+async def generate_recurring_transactions(
+    response: Response,
+    from_month: str = Query(..., alias="from", pattern=YEAR_MONTH_PATTERN),
+    to_month: str = Query(..., alias="to", pattern=YEAR_MONTH_PATTERN),
+    user_id: int = Depends(get_current_user_id),
+    session: AsyncSession = Depends(get_db_session),
+    service: RecurringService = Depends(get_recurring_service)
+):
+    try:
+        data = await service.generate(
+            session, user_id, parse_year_month(from_month), parse_year_month(to_month)
+        )
+        return ApiResponseDto(
+            data=data,
+            success=True,
+            message="Recurring transactions generated successfully"
+        )
+    except ServiceException as exc:
+        return await ControllerExceptionHandler.handle_service_exception(response, session, exc)
+    except Exception:
+        return await ControllerExceptionHandler.handle_unexpected_exception(response, session)
+
+
+@router.get(
+    "/{template_id}",
+    response_model=ApiResponseDto[RecurringTemplateResponseDto]
+)
+async def get_template(
+    response: Response,
+    template_id: int = Path(..., gt=0),
+    user_id: int = Depends(get_current_user_id),
+    session: AsyncSession = Depends(get_db_session),
+    service: RecurringService = Depends(get_recurring_service)
+):
+    try:
+        data = await service.get_template(session, user_id, template_id)
+        return ApiResponseDto(
+            data=data,
+            success=True,
+            message="Recurring template fetched successfully"
+        )
+    except ServiceException as exc:
+        return await ControllerExceptionHandler.handle_service_exception(response, session, exc)
+    except Exception:
+        return await ControllerExceptionHandler.handle_unexpected_exception(response, session)
+
+
+@router.put(
+    "/{template_id}",
+    response_model=ApiResponseDto[RecurringTemplateResponseDto]
+)
+async def update_template(
+    response: Response,
+    template_id: int = Path(..., gt=0),
+    dto: RecurringTemplateUpdateDto = ...,
+    user_id: int = Depends(get_current_user_id),
+    session: AsyncSession = Depends(get_db_session),
+    service: RecurringService = Depends(get_recurring_service)
+):
+    try:
+        data = await service.update_template(session, user_id, template_id, dto)
+        return ApiResponseDto(
+            data=data,
+            success=True,
+            message="Recurring template updated successfully"
+        )
+    except ServiceException as exc:
+        return await ControllerExceptionHandler.handle_service_exception(response, session, exc)
+    except Exception:
+        return await ControllerExceptionHandler.handle_unexpected_exception(response, session)
+
+
+@router.delete(
+    "/{template_id}",
+    response_model=ApiResponseDto[bool]
+)
+async def delete_template(
+    response: Response,
+    template_id: int = Path(..., gt=0),
+    user_id: int = Depends(get_current_user_id),
+    session: AsyncSession = Depends(get_db_session),
+    service: RecurringService = Depends(get_recurring_service)
+):
+    try:
+        data = await service.delete_template(session, user_id, template_id)
+        return ApiResponseDto(
+            data=data,
+            success=True,
+            message="Recurring template deleted successfully"
+        )
+    except ServiceException as exc:
+        return await ControllerExceptionHandler.handle_service_exception(response, session, exc)
+    except Exception:
+        return await ControllerExceptionHandler.handle_unexpected_exception(response, session)
@@ -1,12 +1,26 @@
-from fastapi import APIRouter, Depends, Query, Path, Response, status
+from datetime import date
+from typing import Optional, Union
+
+from fastapi import APIRouter, Depends, File, Header, Query, Path, Response, UploadFile, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.utils.dependencies import (
     get_transaction_service,
-    get_db_session
+    get_current_user_id,
+    get_db_session,
+    get_session_factory
 )
+from src.settings.config import settings
+from src.utils.bulk_import import detect_import_format
+from src.utils.constants import TransactionType, TransactionCategory
+from src.utils.dates import YEAR_MONTH_PATTERN, parse_year_month
+from src.utils.etag import version_etag, etag_headers, etag_matches, not_modified
+from src.utils.export import EXPORT_MEDIA_TYPES, EXPORT_FILE_EXTENSIONS
+from src.utils.responses import FastJSONResponse
 from src.utils.exceptions import ServiceException
 from src.utils.exception_handler import ControllerExceptionHandler
+from src.utils.timing import TimedRoute
 from src.services.transaction_service import TransactionService
 from src.domain_model.dtos.transaction_dtos import (
     TransactionCreateDto,
@@ -16,13 +30,23 @@ from src.domain_model.dtos.transaction_dtos import (
     WeeklySummaryDto,
     CategoryBreakdownDto,
     ProjectionSummaryDto,
+    DashboardSummaryDto,
+    BulkImportResultDto,
+    SummarySeriesDto,
+    TransactionBatchRequestDto,
+    TransactionBatchResponseDto,
+)
+from src.domain_model.dtos.base_dtos import (
+    ApiResponseDto,
+    PaginatedResponseDto,
+    CursorPaginatedResponseDto,
 )
-from src.domain_model.dtos.base_dtos import ApiResponseDto, PaginatedResponseDto
 
 
 router = APIRouter(
     prefix="/api/v1/transactions",
-    tags=["Transactions"]
+    tags=["Transactions"],
+    route_class=TimedRoute
 )
 
 
@@ -34,11 +58,12 @@ router = APIRouter(
 async def create_transaction(
     dto: TransactionCreateDto,
     response: Response,
+    user_id: int = Depends(get_current_user_id),
     session: AsyncSession = Depends(get_db_session),
     service: TransactionService = Depends(get_transaction_service)
 ):
     try:
-        data = await service.create_transaction(session, dto)
+        data = await service.create_transaction(session, user_id, dto)
         return ApiResponseDto(
             data=data,
             success=True,
@@ -50,30 +75,160 @@ async def create_transaction(
         return await ControllerExceptionHandler.handle_unexpected_exception(response, session)
 
 
+@router.post(
+    "/bulk",
+    response_model=ApiResponseDto[BulkImportResultDto]
+)
+async def bulk_import_transactions(
+    response: Response,
+    file: UploadFile = File(...),
+    import_format: Optional[str] = Query(None, alias="format", pattern="^(csv|ndjson)$"),
+    user_id: int = Depends(get_current_user_id),
+    session: AsyncSession = Depends(get_db_session),
+    service: TransactionService = Depends(get_transaction_service)
+):
+    try:
+        import_format = import_format or detect_import_format(file.filename, file.content_type)
+        if import_format is None:
+            raise ServiceException("Could not detect file format; pass format=csv or format=ndjson", 400)
+
+        data = await service.bulk_import(
+            session,
+            user_id,
+            file.file,
+            import_format,
+            chunk_size=settings.BULK_IMPORT_CHUNK_SIZE,
+            max_errors=settings.BULK_IMPORT_MAX_ERRORS,
+        )
+        return ApiResponseDto(
+            data=data,
+            success=True,
+            message="Transactions imported successfully"
+        )
+    except ServiceException as exc:
+        return await ControllerExceptionHandler.handle_service_exception(response, session, exc)
+    except Exception:
+        return await ControllerExceptionHandler.handle_unexpected_exception(response, session)
+
+
+@router.post(
+    "/batch",
+    response_model=ApiResponseDto[TransactionBatchResponseDto]
+)
+async def apply_transaction_batch(
+    dto: TransactionBatchRequestDto,
+    response: Response,
+    user_id: int = Depends(get_current_user_id),
+    session: AsyncSession = Depends(get_db_session),
+    service: TransactionService = Depends(get_transaction_service)
+):
+    try:
+        data = await service.apply_batch(
+            session, user_id, dto.operations, max_operations=settings.BATCH_MAX_OPERATIONS
+        )
+        if not data.applied:
+            # Status of the first operation that failed; the rest are 424.
+            response.status_code = next(
+                result.status_code for result in data.results
+                if result.status_code != status.HTTP_424_FAILED_DEPENDENCY
+            )
+            await session.rollback()
+            return ApiResponseDto(
+                data=data,
+                success=False,
+                message="No operations were applied"
+            )
+        return ApiResponseDto(
+            data=data,
+            success=True,
+            message="Batch applied successfully"
+        )
+    except ServiceException as exc:
+        return await ControllerExceptionHandler.handle_service_exception(response, session, exc)
+    except Exception:
+        return await ControllerExceptionHandler.handle_unexpected_exception(response, session)
+
+
 @router.get(
     "/",
-    response_model=ApiResponseDto[PaginatedResponseDto[TransactionResponseDto]]
+    response_model=ApiResponseDto[Union[
+        PaginatedResponseDto[TransactionResponseDto],
+        CursorPaginatedResponseDto[TransactionResponseDto],
+    ]]
 )
 async def get_transactions(
     response: Response,
     page_no: int = Query(1, ge=1),
     max_per_page: int = Query(10, ge=1, le=100),
+    pagination: str = Query("page", pattern="^(page|cursor)$"),
+    cursor: Optional[str] = Query(None),
+    include_total: bool = Query(True),
+    if_none_match: Optional[str] = Header(None),
+    user_id: int = Depends(get_current_user_id),
     session: AsyncSession = Depends(get_db_session),
     service: TransactionService = Depends(get_transaction_service)
 ):
     try:
-        paginated_data = await service.get_paginated(session, page_no, max_per_page)
-        return ApiResponseDto(
-            data=paginated_data,
-            success=True,
-            message="Transactions fetched successfully"
+        # Answer revalidation from the version row alone.
+        etag = version_etag(
+            await service.get_data_version(session, user_id), user_id
         )
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+
+        if cursor or pagination == "cursor":
+            paginated_data = await service.get_cursor_paginated(
+                session, user_id, cursor, max_per_page, include_total
+            )
+        else:
+            paginated_data = await service.get_paginated(
+                session, user_id, page_no, max_per_page, include_total
+            )
+        # The payload is built from trusted rows; skip response_model validation.
+        return FastJSONResponse({
+            "data": paginated_data,
+            "success": True,
+            "message": "Transactions fetched successfully"
+        }, headers=etag_headers(etag))
     except ServiceException as exc:
         return await ControllerExceptionHandler.handle_service_exception(response, session, exc)
     except Exception:
         return await ControllerExceptionHandler.handle_unexpected_exception(response, session)
 
 
+@router.get("/export")
+async def export_transactions(
+    export_format: str = Query("csv", alias="format", pattern="^(csv|ndjson|columnar)$"),
+    start_date: Optional[date] = Query(None),
+    end_date: Optional[date] = Query(None),
+    year: Optional[int] = Query(None, ge=2000),
+    month: Optional[int] = Query(None, ge=1, le=12),
+    txn_type: Optional[TransactionType] = Query(None, alias="type"),
+    category: Optional[TransactionCategory] = Query(None),
+    user_id: int = Depends(get_current_user_id),
+    session_factory=Depends(get_session_factory),
+    service: TransactionService = Depends(get_transaction_service)
+):
+    stream = service.export_transactions(
+        session_factory,
+        user_id,
+        export_format,
+        chunk_size=settings.EXPORT_CHUNK_SIZE,
+        start_date=start_date,
+        end_date=end_date,
+        year=year,
+        month=month,
+        txn_type=txn_type,
+        category=category,
+    )
+    filename = f"transactions.{EXPORT_FILE_EXTENSIONS[export_format]}"
+    return StreamingResponse(
+        stream,
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
 @router.get(
     "/{txn_id}",
     response_model=ApiResponseDto[TransactionResponseDto]
@@ -81,11 +236,20 @@ async def get_transactions(
 async def get_transaction_by_id(
     response: Response,
     txn_id: int = Path(..., gt=0),
+    if_none_match: Optional[str] = Header(None),
+    user_id: int = Depends(get_current_user_id),
     session: AsyncSession = Depends(get_db_session),
     service: TransactionService = Depends(get_transaction_service)
 ):
     try:
-        data = await service.get_by_id(session, txn_id)
+        etag = version_etag(
+            await service.get_data_version(session, user_id), user_id
+        )
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+
+        data = await service.get_by_id(session, user_id, txn_id)
+        response.headers.update(etag_headers(etag))
         return ApiResponseDto(
             data=data,
             success=True,
@@ -105,11 +269,12 @@ async def update_transaction(
     response: Response,
     txn_id: int = Path(..., gt=0),
     dto: TransactionUpdateDto = ...,
+    user_id: int = Depends(get_current_user_id),
     session: AsyncSession = Depends(get_db_session),
     service: TransactionService = Depends(get_transaction_service)
 ):
     try:
-        data = await service.update_transaction(session, txn_id, dto)
+        data = await service.update_transaction(session, user_id, txn_id, dto)
         return ApiResponseDto(
             data=data,
             success=True,
@@ -128,11 +293,12 @@ async def update_transaction(
 async def delete_transaction(
     response: Response,
     txn_id: int = Path(..., gt=0),
+    user_id: int = Depends(get_current_user_id),
     session: AsyncSession = Depends(get_db_session),
     service: TransactionService = Depends(get_transaction_service)
 ):
     try:
-        data = await service.delete_transaction(session, txn_id)
+        data = await service.delete_transaction(session, user_id, txn_id)
         return ApiResponseDto(
             data=data,
             success=True,
@@ -152,11 +318,20 @@ async def get_monthly_summary(
     response: Response,
     year: int = Query(..., ge=2000),
     month: int = Query(..., ge=1, le=12),
+    if_none_match: Optional[str] = Header(None),
+    user_id: int = Depends(get_current_user_id),
     session: AsyncSession = Depends(get_db_session),
     service: TransactionService = Depends(get_transaction_service)
 ):
     try:
-        data = await service.get_monthly_summary(session, year, month)
+        etag = version_etag(
+            await service.get_data_version(session, user_id), user_id
+        )
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+
+        data = await service.get_monthly_summary(session, user_id, year, month)
+        response.headers.update(etag_headers(etag))
         return ApiResponseDto(
             data=data,
             success=True,
@@ -174,11 +349,20 @@ async def get_monthly_summary(
 )
 async def get_weekly_summary(
     response: Response,
+    if_none_match: Optional[str] = Header(None),
+    user_id: int = Depends(get_current_user_id),
     session: AsyncSession = Depends(get_db_session),
     service: TransactionService = Depends(get_transaction_service)
 ):
     try:
-        data = await service.get_weekly_summary(session)
+        etag = version_etag(
+            await service.get_data_version(session, user_id), user_id, date.today()
+        )
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+
+        data = await service.get_weekly_summary(session, user_id)
+        response.headers.update(etag_headers(etag))
         return ApiResponseDto(
             data=data,
             success=True,
@@ -198,11 +382,20 @@ async def get_category_breakdown(
     response: Response,
     year: int = Query(..., ge=2000),
     month: int = Query(..., ge=1, le=12),
+    if_none_match: Optional[str] = Header(None),
+    user_id: int = Depends(get_current_user_id),
     session: AsyncSession = Depends(get_db_session),
     service: TransactionService = Depends(get_transaction_service)
 ):
     try:
-        data = await service.get_category_breakdown(session, year, month)
+        etag = version_etag(
+            await service.get_data_version(session, user_id), user_id
+        )
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+
+        data = await service.get_category_breakdown(session, user_id, year, month)
+        response.headers.update(etag_headers(etag))
         return ApiResponseDto(
             data=data,
             success=True,
@@ -222,11 +415,20 @@ async def get_projection(
     response: Response,
     year: int = Query(..., ge=2000),
     month: int = Query(..., ge=1, le=12),
+    if_none_match: Optional[str] = Header(None),
+    user_id: int = Depends(get_current_user_id),
     session: AsyncSession = Depends(get_db_session),
     service: TransactionService = Depends(get_transaction_service)
 ):
     try:
-        data = await service.get_projection(session, year, month)
+        etag = version_etag(
+            await service.get_data_version(session, user_id), user_id, date.today()
+        )
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+
+        data = await service.get_projection(session, user_id, year, month)
+        response.headers.update(etag_headers(etag))
         return ApiResponseDto(
             data=data,
             success=True,
@@ -236,3 +438,72 @@ async def get_projection(
         return await ControllerExceptionHandler.handle_service_exception(response, session, exc)
     except Exception:
         return await ControllerExceptionHandler.handle_unexpected_exception(response, session)
+
+
+@router.get(
+    "/summary/dashboard",
+    response_model=ApiResponseDto[DashboardSummaryDto]
+)
+async def get_dashboard_summary(
+    response: Response,
+    year: int = Query(..., ge=2000),
+    month: int = Query(..., ge=1, le=12),
+    if_none_match: Optional[str] = Header(None),
+    user_id: int = Depends(get_current_user_id),
+    session: AsyncSession = Depends(get_db_session),
+    service: TransactionService = Depends(get_transaction_service)
+):
+    try:
+        etag = version_etag(
+            await service.get_data_version(session, user_id), user_id, date.today()
+        )
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+
+        data = await service.get_dashboard(session, user_id, year, month)
+        response.headers.update(etag_headers(etag))
+        return ApiResponseDto(
+            data=data,
+            success=True,
+            message="Dashboard summary fetched successfully"
+        )
+    except ServiceException as exc:
+        return await ControllerExceptionHandler.handle_service_exception(response, session, exc)
+    except Exception:
+        return await ControllerExceptionHandler.handle_unexpected_exception(response, session)
+
+
+@router.get(
+    "/summary/series",
+    response_model=ApiResponseDto[SummarySeriesDto]
+)
+async def get_summary_series(
+    response: Response,
+    from_month: str = Query(..., alias="from", pattern=YEAR_MONTH_PATTERN),
+    to_month: str = Query(..., alias="to", pattern=YEAR_MONTH_PATTERN),
+    granularity: str = Query("month", pattern="^(day|week|month)$"),
+    if_none_match: Optional[str] = Header(None),
+    user_id: int = Depends(get_current_user_id),
+    session: AsyncSession = Depends(get_db_session),
+    service: TransactionService = Depends(get_transaction_service)
+):
+    try:
+        etag = version_etag(
+            await service.get_data_version(session, user_id), user_id
+        )
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+
+        data = await service.get_summary_series(
+            session, user_id, parse_year_month(from_month), parse_year_month(to_month), granularity
+        )
+        response.headers.update(etag_headers(etag))
+        return ApiResponseDto(
+            data=data,
+            success=True,
+            message="Summary series fetched successfully"
+        )
+    except ServiceException as exc:
+        return await ControllerExceptionHandler.handle_service_exception(response, session, exc)
+    except Exception:
+        return await ControllerExceptionHandler.handle_unexpected_exception(response, session)
@@ -0,0 +1,55 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class CacheStatsDto(BaseModel):
+    backend: str
+    ttl_seconds: float
+    hits: int
+    misses: int
+    hit_ratio: float
+    invalidations: int
+    errors: int
+    entries: Optional[int] = None
+    max_entries: Optional[int] = None
+    evictions: Optional[int] = None
+
+
+class PoolStatusDto(BaseModel):
+    pool_class: str
+    size: Optional[int] = None
+    checked_in: Optional[int] = None
+    checked_out: Optional[int] = None
+    overflow: Optional[int] = None
+    max_overflow: int
+
+
+class SchedulerJobStatsDto(BaseModel):
+    name: str
+    interval_seconds: float
+    exclusive: bool
+    runs: int
+    failures: int
+    skipped_busy: int
+    skipped_locked: int
+    last_duration_seconds: Optional[float] = None
+    last_error: Optional[str] = None
+
+
+class TimingSummaryDto(BaseModel):
+    count: int
+    mean: float
+    p50: float
+    p95: float
+    p99: float
+    max: float
+
+
+class RouteTimingStatsDto(BaseModel):
+    method: str
+    route: str
+    total_ms: TimingSummaryDto
+    db_ms: TimingSummaryDto
+    serialization_ms: TimingSummaryDto
+    queries: TimingSummaryDto
@@ -17,7 +17,18 @@ class PaginatedResponseDto(BaseModel, Generic[T]):
     """Generic paginated payload."""
 
     data: List[T]
-    total: int
+    total: Optional[int] = None
     page_no: int
     max_per_page: int
     current_count: int
+
+
+class CursorPaginatedResponseDto(BaseModel, Generic[T]):
+    """Generic keyset-paginated payload."""
+
+    data: List[T]
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
+    total: Optional[int] = None
+    max_per_page: int
+    current_count: int
@@ -0,0 +1,52 @@
+from pydantic import BaseModel, Field
+from typing import Optional
+from datetime import datetime, date
+from src.domain_model.dtos.transaction_dtos import Amount
+from src.utils.constants import TransactionType, TransactionCategory
+
+
+class RecurringTemplateBaseDto(BaseModel):
+    amount: Amount
+    type: TransactionType
+    category: TransactionCategory
+    description: Optional[str] = None
+    day_of_month: int = Field(..., ge=1, le=31)
+    start_date: date
+    end_date: Optional[date] = None
+    is_active: bool = True
+
+
+class RecurringTemplateCreateDto(RecurringTemplateBaseDto):
+    pass
+
+
+class RecurringTemplateUpdateDto(BaseModel):
+    amount: Optional[Amount] = None
+    type: Optional[TransactionType] = None
+    category: Optional[TransactionCategory] = None
+    description: Optional[str] = None
+    day_of_month: Optional[int] = Field(None, ge=1, le=31)
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+    is_active: Optional[bool] = None
+
+
+class RecurringTemplateResponseDto(RecurringTemplateBaseDto):
+    id: int
+    user_id: int
+    generated_through: Optional[date] = None
+    created_at: datetime
+    updated_at: datetime
+
+    model_config = {
+        "from_attributes": True
+    }
+
+
+class RecurringGenerationResultDto(BaseModel):
+    from_month: str
+    to_month: str
+    templates: int
+    due: int
+    created: int
+    already_present: int
@@ -1,12 +1,17 @@
-from pydantic import BaseModel
-from typing import Optional, Union, List
+from pydantic import BaseModel, Field
+from typing import Annotated, Optional, Union, List, Literal
 from datetime import datetime, date
 from decimal import Decimal
+from src.settings.config import settings
 from src.utils.constants import TransactionType, TransactionCategory
 
+# Fits the Numeric(10, 2) amount columns exactly, so stored values and the
+# rollups computed from the input never differ by rounding.
+Amount = Annotated[Decimal, Field(max_digits=10, decimal_places=2)]
+
 
 class TransactionBaseDto(BaseModel):
-    amount: Decimal
+    amount: Amount
     type: TransactionType
     category: TransactionCategory
     description: Optional[str] = None
@@ -18,7 +23,7 @@ class TransactionCreateDto(TransactionBaseDto):
 
 
 class TransactionUpdateDto(BaseModel):
-    amount: Optional[Decimal] = None
+    amount: Optional[Amount] = None
     type: Optional[TransactionType] = None
     category: Optional[TransactionCategory] = None
     description: Optional[str] = None
@@ -27,6 +32,7 @@ class TransactionUpdateDto(BaseModel):
 
 class TransactionResponseDto(TransactionBaseDto):
     id: int
+    user_id: int
     created_at: datetime
     updated_at: datetime
 
@@ -66,3 +72,84 @@ class ProjectionSummaryDto(BaseModel):
     projected_month_end: Decimal
     days_passed: int
     total_days: int
+
+
+class DashboardSummaryDto(BaseModel):
+    year: int
+    month: int
+    monthly: MonthlySummaryDto
+    category_breakdown: CategoryBreakdownDto
+    projection: ProjectionSummaryDto
+    weekly: WeeklySummaryDto
+
+
+class SummarySeriesPointDto(BaseModel):
+    bucket_start: date
+    total_expense: Decimal
+    total_income: Decimal
+    net_savings: Decimal
+
+
+class SummarySeriesDto(BaseModel):
+    granularity: str
+    from_month: str
+    to_month: str
+    points: List[SummarySeriesPointDto]
+
+
+class BulkImportRowErrorDto(BaseModel):
+    row: int
+    message: str
+
+
+class BulkImportResultDto(BaseModel):
+    total_rows: int
+    inserted: int
+    failed: int
+    errors: List[BulkImportRowErrorDto]
+    errors_truncated: bool = False
+
+
+class TransactionBatchCreateDto(BaseModel):
+    op: Literal["create"]
+    data: TransactionCreateDto
+
+
+class TransactionBatchUpdateDto(BaseModel):
+    op: Literal["update"]
+    id: int = Field(gt=0)
+    data: TransactionUpdateDto
+
+
+class TransactionBatchDeleteDto(BaseModel):
+    op: Literal["delete"]
+    id: int = Field(gt=0)
+
+
+TransactionBatchOperationDto = Annotated[
+    Union[TransactionBatchCreateDto, TransactionBatchUpdateDto, TransactionBatchDeleteDto],
+    Field(discriminator="op"),
+]
+
+
+class TransactionBatchRequestDto(BaseModel):
+    operations: List[TransactionBatchOperationDto] = Field(
+        min_length=1, max_length=settings.BATCH_MAX_OPERATIONS
+    )
+
+
+class TransactionBatchResultDto(BaseModel):
+    index: int
+    op: str
+    status_code: int
+    id: Optional[int] = None
+    data: Optional[TransactionResponseDto] = None
+    error: Optional[str] = None
+
+
+class TransactionBatchResponseDto(BaseModel):
+    applied: bool
+    created: int
+    updated: int
+    deleted: int
+    results: List[TransactionBatchResultDto]
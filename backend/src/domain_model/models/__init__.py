@@ -1,5 +1,8 @@
 # Domain model package
 from .base import Base, BaseModel
 from .transaction import Transaction
+from .daily_rollup import DailyRollup
+from .recurring_template import RecurringTemplate
+from .data_version import DataVersion
 
-__all__ = ["Base", "BaseModel", "Transaction"]
+__all__ = ["Base", "BaseModel", "Transaction", "DailyRollup", "RecurringTemplate", "DataVersion"]
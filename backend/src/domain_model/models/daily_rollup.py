@@ -0,0 +1,22 @@
+from sqlalchemy import Column, Integer, Numeric, Date, Enum as SQLEnum
+from src.domain_model.models.base import Base
+from src.utils.constants import TransactionType, TransactionCategory
+
+
+class DailyRollup(Base):
+    """Per-day transaction totals, maintained alongside every transaction write."""
+
+    __tablename__ = "daily_rollups"
+
+    user_id = Column(Integer, primary_key=True)
+    rollup_date = Column(Date, primary_key=True)
+    type = Column(SQLEnum(TransactionType), primary_key=True)
+    category = Column(SQLEnum(TransactionCategory), primary_key=True)
+    total = Column(Numeric(14, 2), default=0, nullable=False)
+    txn_count = Column(Integer, default=0, nullable=False)
+
+    def __repr__(self):
+        return (
+            f"<DailyRollup(user_id={self.user_id}, rollup_date={self.rollup_date}, type={self.type}, "
+            f"category={self.category}, total={self.total}, txn_count={self.txn_count})>"
+        )
@@ -0,0 +1,16 @@
+from sqlalchemy import BigInteger, Column, DateTime, String
+from src.domain_model.models.base import Base, utc_now
+
+
+class DataVersion(Base):
+    """Change counter per table, bumped in the same DB transaction as every write."""
+
+    __tablename__ = "data_versions"
+
+    name = Column(String(64), primary_key=True)
+    version = Column(BigInteger, default=0, nullable=False)
+    updated_at = Column(DateTime(timezone=True),
+                        default=utc_now, onupdate=utc_now, nullable=False)
+
+    def __repr__(self):
+        return f"<DataVersion(name={self.name}, version={self.version})>"
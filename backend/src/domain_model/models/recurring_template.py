@@ -0,0 +1,36 @@
+from sqlalchemy import Column, Integer, Numeric, String, Date, Boolean, Index, Enum as SQLEnum
+from src.domain_model.models.base import BaseModel
+from src.utils.constants import TransactionType, TransactionCategory
+
+
+class RecurringTemplate(BaseModel):
+    """Template for a transaction that repeats on the same day every month."""
+
+    __tablename__ = "recurring_templates"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, nullable=False)
+    amount = Column(Numeric(10, 2), nullable=False)
+    type = Column(SQLEnum(TransactionType), nullable=False)
+    category = Column(SQLEnum(TransactionCategory), nullable=False)
+    description = Column(String(255), nullable=True)
+    # Clamped to the last day in shorter months
+    day_of_month = Column(Integer, nullable=False)
+    start_date = Column(Date, nullable=False)
+    end_date = Column(Date, nullable=True)
+    is_active = Column(Boolean, default=True, nullable=False)
+    # Latest occurrence generation has handled; months up to and including
+    # this one are never generated again, even if the user deletes or
+    # re-dates their occurrence.
+    generated_through = Column(Date, nullable=True)
+
+    __table_args__ = (
+        # Per-user listings in id order.
+        Index("ix_recurring_templates_user_id_id", "user_id", "id"),
+    )
+
+    def __repr__(self):
+        return (
+            f"<RecurringTemplate(id={self.id}, user_id={self.user_id}, amount={self.amount}, type={self.type}, "
+            f"category={self.category}, day_of_month={self.day_of_month})>"
+        )
@@ -1,4 +1,6 @@
-from sqlalchemy import Column, Integer, Numeric, String, Date, Boolean, Enum as SQLEnum
+from sqlalchemy import (
+    Column, Integer, Numeric, String, Date, Boolean, ForeignKey, Index, Enum as SQLEnum
+)
 from datetime import date
 from src.domain_model.models.base import BaseModel
 from src.utils.constants import TransactionType, TransactionCategory
@@ -10,6 +12,9 @@ class Transaction(BaseModel):
     __tablename__ = "transactions"
 
     id = Column(Integer, primary_key=True, index=True)
+    # Owning user; every query is scoped to it, and tenant-leading indexes
+    # keep one user's latency independent of everyone else's volume.
+    user_id = Column(Integer, nullable=False)
     amount = Column(Numeric(10, 2), nullable=False)
     type = Column(SQLEnum(TransactionType), nullable=False)
     category = Column(SQLEnum(TransactionCategory), nullable=False)
@@ -17,9 +22,61 @@ class Transaction(BaseModel):
     transaction_date = Column(
         Date, default=date.today, nullable=False)
     is_recurring_generated = Column(Boolean, default=False, nullable=False)
+    recurring_template_id = Column(
+        Integer,
+        ForeignKey("recurring_templates.id", ondelete="SET NULL"),
+        nullable=True
+    )
+
+    __table_args__ = (
+        # Listing order and keyset pagination; INCLUDE lets window sums run index-only.
+        Index(
+            "ix_transactions_user_date_id",
+            "user_id",
+            transaction_date.desc(),
+            id.desc(),
+            postgresql_include=["type", "amount"],
+        ),
+        # Per-type sums over a date window.
+        Index(
+            "ix_transactions_user_type_date",
+            "user_id",
+            "type",
+            "transaction_date",
+            postgresql_include=["amount"],
+        ),
+        # Category filters and breakdowns.
+        Index(
+            "ix_transactions_user_category_date",
+            "user_id",
+            "category",
+            "transaction_date",
+        ),
+        # Recurring lookups only ever touch generated rows.
+        Index(
+            "ix_transactions_user_recurring",
+            "user_id",
+            "category",
+            "amount",
+            "transaction_date",
+            postgresql_where=is_recurring_generated.is_(True),
+        ),
+        # One occurrence per template per day; makes generation idempotent.
+        Index(
+            "uq_transactions_recurring_occurrence",
+            "recurring_template_id",
+            "transaction_date",
+            unique=True,
+            postgresql_where=recurring_template_id.isnot(None),
+        ),
+        # Monthly range partitions (transactions_pYYYY_MM plus transactions_default).
+        # The database primary key is (id, transaction_date); ids stay unique
+        # through the shared sequence, so the mapper keeps identifying rows by id.
+        {"postgresql_partition_by": "RANGE (transaction_date)"},
+    )
 
     def __repr__(self):
         return (
-            f"<Transaction(id={self.id}, amount={self.amount}, type={self.type}, "
+            f"<Transaction(id={self.id}, user_id={self.user_id}, amount={self.amount}, type={self.type}, "
             f"category={self.category}, transaction_date={self.transaction_date})>"
         )
@@ -1,14 +1,33 @@
-from typing import Generic, TypeVar, Type, List, Optional
+from typing import Any, Dict, Generic, Iterator, TypeVar, Type, List, Optional, Sequence, Tuple, Union
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, delete
+from sqlalchemy import select, insert, update, delete, any_, bindparam, cast, column, values
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import DeclarativeBase
 from uuid import UUID
 
+from src.utils.timing import label_db_operations
+
 ModelType = TypeVar("ModelType", bound=DeclarativeBase)
 
+# Postgres accepts at most this many bind parameters in one statement.
+MAX_BIND_PARAMETERS = 32767
+
+
+def _chunks(items: Sequence[Any], size: int) -> Iterator[Sequence[Any]]:
+    for offset in range(0, len(items), size):
+        yield items[offset:offset + size]
+
 
 class BaseRepository(Generic[ModelType]):
 
+    # Rows per statement for the bulk methods; subclasses and callers can
+    # lower it. It is also capped so a chunk stays under MAX_BIND_PARAMETERS.
+    bulk_chunk_size: int = 1000
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        label_db_operations(cls)
+
     def __init__(self, model: Type[ModelType]):
         self.model = model
 
@@ -18,13 +37,17 @@ class BaseRepository(Generic[ModelType]):
         await session.refresh(obj)
         return obj
 
+    # `criteria` are extra WHERE clauses, e.g. an owner filter, that
+    # subclasses add to scope single-row operations.
+
     async def get_by_id(
         self,
         session: AsyncSession,
-        obj_id: UUID
+        obj_id: UUID,
+        criteria: Sequence[Any] = ()
     ) -> Optional[ModelType]:
 
-        stmt = select(self.model).where(self.model.id == obj_id)
+        stmt = select(self.model).where(self.model.id == obj_id, *criteria)
         result = await session.execute(stmt)
         return result.scalar_one_or_none()
 
@@ -32,20 +55,22 @@ class BaseRepository(Generic[ModelType]):
         self,
         session: AsyncSession,
         skip: int = 0,
-        limit: int = 30
+        limit: int = 30,
+        criteria: Sequence[Any] = ()
     ) -> List[ModelType]:
 
-        stmt = select(self.model).offset(skip).limit(limit)
+        stmt = select(self.model).where(*criteria).offset(skip).limit(limit)
         result = await session.execute(stmt)
         return result.scalars().all()
 
     async def delete(
         self,
         session: AsyncSession,
-        obj_id: UUID
+        obj_id: UUID,
+        criteria: Sequence[Any] = ()
     ) -> bool:
 
-        stmt = delete(self.model).where(self.model.id == obj_id)
+        stmt = delete(self.model).where(self.model.id == obj_id, *criteria)
         result = await session.execute(stmt)
         return result.rowcount > 0
 
@@ -53,15 +78,181 @@ class BaseRepository(Generic[ModelType]):
         self,
         session: AsyncSession,
         obj_id: UUID,
-        data: dict
+        data: dict,
+        criteria: Sequence[Any] = ()
     ) -> Optional[ModelType]:
 
         stmt = (
             update(self.model)
-            .where(self.model.id == obj_id)
+            .where(self.model.id == obj_id, *criteria)
             .values(**data)
             .returning(self.model)
         )
 
         result = await session.execute(stmt)
         return result.scalar_one_or_none()
+
+    # =========================================================
+    # Bulk Operations
+    # =========================================================
+    # Each sends one statement per chunk of `chunk_size` rows (default
+    # `bulk_chunk_size`). With `returning`, the listed columns of every
+    # affected row come back as plain rows.
+
+    def _chunk_size(self, chunk_size: Optional[int], params_per_row: int = 1) -> int:
+        size = chunk_size or self.bulk_chunk_size
+        return max(1, min(size, MAX_BIND_PARAMETERS // max(params_per_row, 1)))
+
+    def _id_array(self, ids: Sequence[Any]):
+        # One array parameter instead of one bind per id, so the statement
+        # text (and its prepared statement) is the same for any number of ids.
+        return bindparam("ids", list(ids), type_=ARRAY(self.model.__table__.c.id.type))
+
+    async def bulk_create(
+        self,
+        session: AsyncSession,
+        rows: Sequence[dict],
+        returning: Optional[Sequence[Any]] = None,
+        chunk_size: Optional[int] = None
+    ) -> Union[List[Any], int]:
+        """
+        Insert rows with multi-row INSERT statements. Rows must share the
+        same keys. Returns the `returning` rows in input order, otherwise the
+        number of rows inserted.
+        """
+
+        if not rows:
+            return [] if returning else 0
+
+        inserted = []
+        # Every column may be bound, including ones filled by Python defaults.
+        size = self._chunk_size(chunk_size, len(self.model.__table__.columns))
+        for chunk in _chunks(rows, size):
+            if returning:
+                # Postgres does not promise RETURNING follows VALUES order;
+                # SQLAlchemy's insertmanyvalues batches the rows with a
+                # sentinel and sorts the results back into parameter order.
+                stmt = insert(self.model).returning(*returning, sort_by_parameter_order=True)
+                result = await session.execute(stmt, list(chunk))
+                inserted.extend(result.all())
+            else:
+                await session.execute(insert(self.model).values(list(chunk)))
+
+        return inserted if returning else len(rows)
+
+    async def get_many(
+        self,
+        session: AsyncSession,
+        ids: Sequence[Any],
+        criteria: Sequence[Any] = (),
+        columns: Optional[Sequence[Any]] = None,
+        for_update: bool = False,
+        chunk_size: Optional[int] = None
+    ) -> List[Any]:
+        """
+        Fetch rows by id with `id = ANY(...)`, ordered by id. With `columns`,
+        plain rows are returned instead of ORM objects. `for_update` locks the
+        rows; the id order keeps concurrent callers from deadlocking. Ids
+        that are missing or excluded by `criteria` are simply absent.
+        """
+
+        found = []
+        for chunk in _chunks(sorted(set(ids)), self._chunk_size(chunk_size)):
+            stmt = select(*columns) if columns else select(self.model)
+            stmt = (
+                stmt.where(self.model.id == any_(self._id_array(chunk)), *criteria)
+                .order_by(self.model.id)
+            )
+            if for_update:
+                stmt = stmt.with_for_update()
+
+            result = await session.execute(stmt)
+            found.extend(result.all() if columns else result.scalars().all())
+
+        return found
+
+    async def bulk_update(
+        self,
+        session: AsyncSession,
+        rows: Sequence[dict],
+        criteria: Sequence[Any] = (),
+        returning: Optional[Sequence[Any]] = None,
+        chunk_size: Optional[int] = None
+    ) -> Union[List[Any], int]:
+        """
+        Apply per-row changes with UPDATE ... FROM (VALUES ...).
+
+        Each row holds `id` plus the fields to set. Rows setting the same
+        fields share statements; an id must appear only once. Returns the
+        `returning` rows in no particular order, otherwise the number of rows
+        updated.
+        """
+
+        by_fields: Dict[Tuple[str, ...], List[dict]] = {}
+        for row in rows:
+            fields = tuple(sorted(name for name in row if name != "id"))
+            by_fields.setdefault(fields, []).append(row)
+
+        table = self.model.__table__
+        updated = []
+        count = 0
+        for fields, group in by_fields.items():
+            for chunk in _chunks(group, self._chunk_size(chunk_size, len(fields) + 1)):
+                data = values(
+                    column("id", table.c.id.type),
+                    *(column(name, table.c[name].type) for name in fields),
+                    name="data"
+                ).data([(row["id"], *(row[name] for name in fields)) for row in chunk])
+
+                stmt = (
+                    update(self.model)
+                    .where(self.model.id == data.c.id, *criteria)
+                    # Cast rather than rely on the driver typing VALUES binds; enums need it.
+                    .values({name: cast(data.c[name], table.c[name].type) for name in fields})
+                    .execution_options(synchronize_session=False)
+                )
+                if returning:
+                    stmt = stmt.returning(*returning)
+
+                result = await session.execute(stmt)
+                if returning:
+                    updated.extend(result.all())
+                else:
+                    count += result.rowcount
+
+        return updated if returning else count
+
+    async def bulk_delete(
+        self,
+        session: AsyncSession,
+        ids: Sequence[Any],
+        criteria: Sequence[Any] = (),
+        returning: Optional[Sequence[Any]] = None,
+        chunk_size: Optional[int] = None
+    ) -> Union[List[Any], int]:
+        """
+        Delete rows by id with `id = ANY(...)`. Returns the `returning` rows,
+        otherwise the number of rows deleted.
+        """
+
+        deleted = []
+        count = 0
+        for chunk in _chunks(list(ids), self._chunk_size(chunk_size)):
+            stmt = (
+                delete(self.model)
+                .where(self.model.id == any_(self._id_array(chunk)), *criteria)
+                .execution_options(synchronize_session=False)
+            )
+            if returning:
+                stmt = stmt.returning(*returning)
+
+            result = await session.execute(stmt)
+            if returning:
+                deleted.extend(result.all())
+            else:
+                count += result.rowcount
+
+        return deleted if returning else count
+
+
+label_db_operations(BaseRepository)
@@ -0,0 +1,314 @@
+from datetime import date
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set
+
+from sqlalchemy import Date, literal_column, select, delete, func, and_, case
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain_model.repositories.base_repository import BaseRepository
+from src.domain_model.models.daily_rollup import DailyRollup
+from src.domain_model.models.transaction import Transaction
+from src.utils.constants import TransactionType, DATE_GRANULARITIES
+from src.utils.dates import Month
+
+
+def _field(item: Any, name: str) -> Any:
+    if isinstance(item, Mapping):
+        return item[name]
+    return getattr(item, name)
+
+
+class DailyRollupRepository(BaseRepository[DailyRollup]):
+
+    def __init__(self):
+        super().__init__(DailyRollup)
+
+    # =========================================================
+    # Incremental Maintenance
+    # =========================================================
+
+    async def apply_changes(
+        self,
+        session: AsyncSession,
+        added: Iterable[Any] = (),
+        removed: Iterable[Any] = ()
+    ) -> None:
+        """
+        Fold added/removed transactions into the rollup in one upsert.
+
+        Items only need `user_id`, `transaction_date`, `type`, `category` and
+        `amount`, as attributes or mapping keys, so ORM rows, column tuples
+        and plain insert dicts all work. Deltas for the same key are merged
+        first because a single INSERT ... ON CONFLICT cannot touch one row
+        twice.
+        """
+
+        deltas = {}
+        for items, sign in ((added, 1), (removed, -1)):
+            for item in items:
+                key = (
+                    _field(item, "user_id"),
+                    _field(item, "transaction_date"),
+                    _field(item, "type"),
+                    _field(item, "category"),
+                )
+                total, count = deltas.get(key, (Decimal(0), 0))
+                deltas[key] = (total + sign * Decimal(_field(item, "amount")), count + sign)
+
+        values = [
+            {
+                "user_id": user_id,
+                "rollup_date": rollup_date,
+                "type": txn_type,
+                "category": category,
+                "total": total,
+                "txn_count": count,
+            }
+            for (user_id, rollup_date, txn_type, category), (total, count) in deltas.items()
+            if total or count
+        ]
+        if not values:
+            return
+
+        stmt = insert(DailyRollup).values(values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[
+                DailyRollup.user_id,
+                DailyRollup.rollup_date,
+                DailyRollup.type,
+                DailyRollup.category,
+            ],
+            set_={
+                "total": DailyRollup.total + stmt.excluded.total,
+                "txn_count": DailyRollup.txn_count + stmt.excluded.txn_count,
+            },
+        )
+        await session.execute(stmt)
+
+    async def rebuild(
+        self,
+        session: AsyncSession,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        user_id: Optional[int] = None
+    ) -> int:
+        """
+        Recompute rollups from raw transactions, optionally for a date window
+        and a single user. Returns the number of rollup rows written.
+        """
+
+        rollup_filters = self._window_filters(start_date, end_date, user_id)
+        txn_filters = []
+        if user_id is not None:
+            txn_filters.append(Transaction.user_id == user_id)
+        if start_date:
+            txn_filters.append(Transaction.transaction_date >= start_date)
+        if end_date:
+            txn_filters.append(Transaction.transaction_date <= end_date)
+
+        await session.execute(delete(DailyRollup).where(and_(True, *rollup_filters)))
+
+        source = (
+            select(
+                Transaction.user_id,
+                Transaction.transaction_date,
+                Transaction.type,
+                Transaction.category,
+                func.sum(Transaction.amount),
+                func.count(Transaction.id),
+            )
+            .where(and_(True, *txn_filters))
+            .group_by(
+                Transaction.user_id,
+                Transaction.transaction_date,
+                Transaction.type,
+                Transaction.category,
+            )
+        )
+        stmt = insert(DailyRollup).from_select(
+            ["user_id", "rollup_date", "type", "category", "total", "txn_count"],
+            source,
+        )
+        result = await session.execute(stmt)
+        return result.rowcount
+
+    async def user_months(
+        self,
+        session: AsyncSession,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        user_id: Optional[int] = None
+    ) -> Dict[int, Set[Month]]:
+        """
+        The months each user has rollups in, optionally within a date window
+        and for a single user. Used to find whose summaries a rebuild changes.
+        """
+
+        month = func.date_trunc("month", DailyRollup.rollup_date)
+        stmt = (
+            select(DailyRollup.user_id, month)
+            .where(and_(True, *self._window_filters(start_date, end_date, user_id)))
+            .group_by(DailyRollup.user_id, month)
+        )
+        result = await session.execute(stmt)
+
+        months: Dict[int, Set[Month]] = {}
+        for owner, month_start in result.all():
+            months.setdefault(owner, set()).add((month_start.year, month_start.month))
+        return months
+
+    @staticmethod
+    def _window_filters(
+        start_date: Optional[date],
+        end_date: Optional[date],
+        user_id: Optional[int]
+    ) -> List[Any]:
+        filters = []
+        if user_id is not None:
+            filters.append(DailyRollup.user_id == user_id)
+        if start_date:
+            filters.append(DailyRollup.rollup_date >= start_date)
+        if end_date:
+            filters.append(DailyRollup.rollup_date <= end_date)
+        return filters
+
+    # =========================================================
+    # Aggregations
+    # =========================================================
+
+    async def sum_income_expense(
+        self,
+        session: AsyncSession,
+        user_id: int,
+        start_date: date,
+        end_date: date
+    ):
+        """Return income, expense and net totals for a date window."""
+
+        income = func.coalesce(
+            func.sum(
+                case(
+                    (DailyRollup.type == TransactionType.INCOME, DailyRollup.total),
+                    else_=0
+                )
+            ),
+            0
+        )
+        expense = func.coalesce(
+            func.sum(
+                case(
+                    (DailyRollup.type == TransactionType.EXPENSE, DailyRollup.total),
+                    else_=0
+                )
+            ),
+            0
+        )
+
+        stmt = select(
+            income.label("total_income"),
+            expense.label("total_expense"),
+            (income - expense).label("net")
+        ).where(
+            DailyRollup.user_id == user_id,
+            DailyRollup.rollup_date.between(start_date, end_date)
+        )
+
+        result = await session.execute(stmt)
+        return result.one()
+
+    @staticmethod
+    def date_bucket(granularity: str):
+        """Start date of the day/week/month bucket each row falls in."""
+        if granularity not in DATE_GRANULARITIES:
+            raise ValueError(f"Unsupported granularity: {granularity}")
+        # Inline the unit so SELECT and GROUP BY render the same expression.
+        unit = literal_column(f"'{granularity}'")
+        return func.date_trunc(unit, DailyRollup.rollup_date).cast(Date).label("bucket")
+
+    async def group_sum_by_field(
+        self,
+        session: AsyncSession,
+        user_id: int,
+        field: Any,
+        start_date: date,
+        end_date: date,
+        txn_type: Optional[TransactionType] = None
+    ):
+        """
+        Sum amounts grouped by `field`, which may be a single expression or
+        a sequence of them (e.g. a date bucket and the type).
+        """
+
+        fields = list(field) if isinstance(field, (list, tuple)) else [field]
+
+        filters = [
+            DailyRollup.user_id == user_id,
+            DailyRollup.rollup_date.between(start_date, end_date),
+            DailyRollup.txn_count > 0
+        ]
+
+        if txn_type:
+            filters.append(DailyRollup.type == txn_type)
+
+        stmt = (
+            select(
+                *fields,
+                func.sum(DailyRollup.total).label("total")
+            )
+            .where(and_(*filters))
+            .group_by(*fields)
+        )
+
+        result = await session.execute(stmt)
+        return result.all()
+
+    async def dashboard_aggregates(
+        self,
+        session: AsyncSession,
+        user_id: int,
+        month_start: date,
+        month_end: date,
+        week_start: date,
+        week_end: date,
+        as_of: date
+    ):
+        """
+        Per (type, category) totals for a month, its month-to-date part and
+        a week, from a single scan over the union of both windows.
+        """
+
+        def window_sum(column, start: date, end: date):
+            return func.coalesce(
+                func.sum(
+                    case(
+                        (DailyRollup.rollup_date.between(start, end), column),
+                        else_=0
+                    )
+                ),
+                0
+            )
+
+        stmt = (
+            select(
+                DailyRollup.type,
+                DailyRollup.category,
+                window_sum(DailyRollup.total, month_start, month_end).label("month_total"),
+                window_sum(DailyRollup.txn_count, month_start, month_end).label("month_count"),
+                window_sum(
+                    DailyRollup.total, month_start, min(as_of, month_end)
+                ).label("month_to_date_total"),
+                window_sum(DailyRollup.total, week_start, week_end).label("week_total"),
+            )
+            .where(
+                DailyRollup.user_id == user_id,
+                DailyRollup.rollup_date.between(
+                    min(month_start, week_start), max(month_end, week_end)
+                ),
+                DailyRollup.txn_count > 0
+            )
+            .group_by(DailyRollup.type, DailyRollup.category)
+        )
+
+        result = await session.execute(stmt)
+        return result.all()
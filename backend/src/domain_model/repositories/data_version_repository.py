@@ -0,0 +1,61 @@
+from datetime import datetime
+from typing import List
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain_model.repositories.base_repository import BaseRepository
+from src.domain_model.models.base import utc_now
+from src.domain_model.models.data_version import DataVersion
+
+
+class DataVersionRepository(BaseRepository[DataVersion]):
+
+    def __init__(self):
+        super().__init__(DataVersion)
+
+    async def get_version(self, session: AsyncSession, name: str) -> int:
+        """Current version for `name`, 0 if it was never bumped."""
+
+        result = await session.execute(
+            select(DataVersion.version).where(DataVersion.name == name)
+        )
+        return result.scalar_one_or_none() or 0
+
+    async def bump(self, session: AsyncSession, name: str) -> int:
+        """
+        Increment the version inside the caller's transaction and return it.
+
+        The row stays locked until commit, so call this as the last write
+        of a unit of work to keep concurrent writers from queueing on it.
+        """
+
+        stmt = insert(DataVersion).values(name=name, version=1, updated_at=utc_now())
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[DataVersion.name],
+            set_={
+                "version": DataVersion.version + 1,
+                "updated_at": stmt.excluded.updated_at,
+            },
+        ).returning(DataVersion.version)
+
+        result = await session.execute(stmt)
+        return result.scalar_one()
+
+    async def changed_since(
+        self,
+        session: AsyncSession,
+        prefix: str,
+        since: datetime,
+        limit: int
+    ) -> List[str]:
+        """Names starting with `prefix` bumped after `since`, most recent first."""
+
+        result = await session.execute(
+            select(DataVersion.name)
+            .where(DataVersion.name.startswith(prefix), DataVersion.updated_at > since)
+            .order_by(DataVersion.updated_at.desc())
+            .limit(limit)
+        )
+        return result.scalars().all()
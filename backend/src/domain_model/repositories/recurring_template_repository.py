@@ -0,0 +1,146 @@
+from datetime import date
+from typing import Dict, List, Optional
+
+from sqlalchemy import Date, Integer, column, func, select, update, values, and_, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain_model.repositories.base_repository import BaseRepository, _chunks
+from src.domain_model.models.recurring_template import RecurringTemplate
+
+
+class RecurringTemplateRepository(BaseRepository[RecurringTemplate]):
+
+    def __init__(self):
+        super().__init__(RecurringTemplate)
+
+    # =========================================================
+    # Owner-scoped CRUD
+    # =========================================================
+
+    async def get_by_id(
+        self,
+        session: AsyncSession,
+        user_id: int,
+        obj_id: int
+    ) -> Optional[RecurringTemplate]:
+        return await super().get_by_id(
+            session, obj_id, criteria=[RecurringTemplate.user_id == user_id]
+        )
+
+    async def get_all(
+        self,
+        session: AsyncSession,
+        user_id: int,
+        skip: int = 0,
+        limit: int = 30
+    ) -> List[RecurringTemplate]:
+
+        stmt = (
+            select(RecurringTemplate)
+            .where(RecurringTemplate.user_id == user_id)
+            .order_by(RecurringTemplate.id)
+            .offset(skip)
+            .limit(limit)
+        )
+
+        result = await session.execute(stmt)
+        return result.scalars().all()
+
+    async def advance_generated_through(
+        self,
+        session: AsyncSession,
+        watermarks: Dict[int, date]
+    ) -> None:
+        """
+        Move each template's generated_through forward to the given date.
+        A watermark never moves back, so a run over an older window cannot
+        reopen months a newer run already handled.
+        """
+
+        items = sorted(watermarks.items())
+        for chunk in _chunks(items, self.bulk_chunk_size):
+            data = values(
+                column("id", Integer),
+                column("generated_through", Date),
+                name="watermarks"
+            ).data(list(chunk))
+
+            stmt = (
+                update(RecurringTemplate)
+                .where(RecurringTemplate.id == data.c.id)
+                .values(
+                    # GREATEST ignores NULL, so the first watermark is taken as is.
+                    generated_through=func.greatest(
+                        RecurringTemplate.generated_through, data.c.generated_through
+                    ),
+                    # Bookkeeping, not an edit of the template.
+                    updated_at=RecurringTemplate.updated_at
+                )
+                .execution_options(synchronize_session=False)
+            )
+            await session.execute(stmt)
+
+    async def update(
+        self,
+        session: AsyncSession,
+        user_id: int,
+        obj_id: int,
+        data: dict
+    ) -> Optional[RecurringTemplate]:
+        return await super().update(
+            session, obj_id, data, criteria=[RecurringTemplate.user_id == user_id]
+        )
+
+    async def delete(
+        self,
+        session: AsyncSession,
+        user_id: int,
+        obj_id: int
+    ) -> bool:
+        return await super().delete(
+            session, obj_id, criteria=[RecurringTemplate.user_id == user_id]
+        )
+
+    # =========================================================
+    # Generation
+    # =========================================================
+
+    async def get_active_for_window(
+        self,
+        session: AsyncSession,
+        start_date: date,
+        end_date: date,
+        user_id: Optional[int] = None,
+        pending_from: Optional[date] = None
+    ) -> List[RecurringTemplate]:
+        """
+        Active templates whose validity overlaps [start_date, end_date], for
+        one user or, without `user_id`, for everyone (scheduled generation).
+        With `pending_from`, templates already generated through that date
+        or later are left out.
+        """
+
+        filters = [
+            RecurringTemplate.is_active == True,
+            RecurringTemplate.start_date <= end_date,
+            or_(
+                RecurringTemplate.end_date.is_(None),
+                RecurringTemplate.end_date >= start_date
+            )
+        ]
+        if user_id is not None:
+            filters.append(RecurringTemplate.user_id == user_id)
+        if pending_from is not None:
+            filters.append(or_(
+                RecurringTemplate.generated_through.is_(None),
+                RecurringTemplate.generated_through < pending_from
+            ))
+
+        stmt = (
+            select(RecurringTemplate)
+            .where(and_(*filters))
+            .order_by(RecurringTemplate.id)
+        )
+
+        result = await session.execute(stmt)
+        return result.scalars().all()
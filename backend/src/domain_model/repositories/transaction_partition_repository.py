@@ -0,0 +1,147 @@
+import re
+from datetime import date
+from typing import Iterable, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain_model.repositories.base_repository import BaseRepository
+from src.domain_model.models.transaction import Transaction
+
+
+PARTITION_NAME = re.compile(r"^transactions_p(\d{4})_(\d{2})$")
+DEFAULT_PARTITION = "transactions_default"
+SCHEMA_NAME = re.compile(r"^[a-z_][a-z0-9_]*$")
+
+
+def partition_month(name: str) -> Optional[date]:
+    """First day of the month a partition holds, None for the default partition."""
+    match = PARTITION_NAME.match(name)
+    if match is None:
+        return None
+    return date(int(match.group(1)), int(match.group(2)), 1)
+
+
+def add_months(value: date, months: int) -> date:
+    index = value.year * 12 + value.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+class TransactionPartitionRepository(BaseRepository[Transaction]):
+    """Monthly range partitions of the transactions table."""
+
+    def __init__(self):
+        super().__init__(Transaction)
+
+    async def ensure_month(self, session: AsyncSession, month_start: date) -> bool:
+        """Create the partition for the month of `month_start`; False if it existed."""
+
+        result = await session.execute(
+            text("SELECT ensure_transactions_partition(:month_start)"),
+            {"month_start": month_start},
+        )
+        return result.scalar_one()
+
+    async def ensure_months(self, session: AsyncSession, dates: Iterable[date]) -> List[date]:
+        """Make sure the months of `dates` have partitions; return the months created."""
+
+        created = []
+        for month_start in sorted({value.replace(day=1) for value in dates}):
+            if await self.ensure_month(session, month_start):
+                created.append(month_start)
+        return created
+
+    async def ensure_range(self, session: AsyncSession, first: date, last: date) -> List[date]:
+        """
+        Make sure every month from `first` to `last` has a partition, e.g.
+        before a bulk load of history; return the months created.
+        """
+
+        months = []
+        month_start = first.replace(day=1)
+        while month_start <= last:
+            months.append(month_start)
+            month_start = add_months(month_start, 1)
+        return await self.ensure_months(session, months)
+
+    async def ensure_ahead(self, session: AsyncSession, today: date, months: int) -> List[date]:
+        """Make sure this month and the next `months` exist; return the months created."""
+
+        return await self.ensure_range(session, today, add_months(today, months))
+
+    async def split_default(self, session: AsyncSession) -> List[date]:
+        """
+        Give every month with rows in the default partition its own
+        partition; return the months created.
+
+        Rows land there when their month has no partition, e.g. history
+        loaded after the migration. ensure_transactions_partition moves them
+        into the new partition, so pruning applies to them again and the
+        default partition, which each ATTACH has to scan, stays small.
+        """
+
+        result = await session.execute(
+            text(
+                f"SELECT DISTINCT date_trunc('month', transaction_date)::date "
+                f"FROM {DEFAULT_PARTITION}"
+            )
+        )
+        return await self.ensure_months(session, result.scalars().all())
+
+    async def list_partitions(self, session: AsyncSession) -> List[dict]:
+        """Attached partitions with their bounds and planner row estimates."""
+
+        result = await session.execute(
+            text(
+                """
+                SELECT c.relname, pg_get_expr(c.relpartbound, c.oid), c.reltuples
+                FROM pg_inherits i
+                JOIN pg_class c ON c.oid = i.inhrelid
+                WHERE i.inhparent = 'transactions'::regclass
+                ORDER BY c.relname
+                """
+            )
+        )
+        return [
+            {
+                "name": name,
+                "month": partition_month(name),
+                "bounds": bounds,
+                "estimated_rows": max(int(rows), 0),
+            }
+            for name, bounds, rows in result.all()
+        ]
+
+    async def owners(self, session: AsyncSession, name: str) -> List[int]:
+        """Distinct user ids with rows in a monthly partition."""
+
+        if partition_month(name) is None:
+            raise ValueError(f"{name} is not a monthly transactions partition")
+
+        result = await session.execute(text(f'SELECT DISTINCT user_id FROM "{name}" ORDER BY 1'))
+        return result.scalars().all()
+
+    async def detach(
+        self,
+        session: AsyncSession,
+        name: str,
+        archive_schema: Optional[str] = None,
+        drop: bool = False
+    ) -> None:
+        """
+        Detach a monthly partition, then move it to `archive_schema` or drop it.
+
+        Without either option the table stays in place as a plain table.
+        """
+
+        if partition_month(name) is None:
+            raise ValueError(f"{name} is not a monthly transactions partition")
+        if archive_schema and not SCHEMA_NAME.match(archive_schema):
+            raise ValueError(f"invalid schema name: {archive_schema}")
+
+        await session.execute(text(f'ALTER TABLE transactions DETACH PARTITION "{name}"'))
+        if drop:
+            await session.execute(text(f'DROP TABLE "{name}"'))
+        elif archive_schema:
+            await session.execute(text(f'CREATE SCHEMA IF NOT EXISTS "{archive_schema}"'))
+            await session.execute(text(f'ALTER TABLE "{name}" SET SCHEMA "{archive_schema}"'))
@@ -1,37 +1,147 @@
 from datetime import date
-from typing import List, Optional, Any
+from typing import AsyncIterator, List, Optional, Any, Sequence, Set, Tuple, Union
 
-from sqlalchemy import select, func, and_
+from sqlalchemy import Date, literal_column, select, insert, func, and_, case, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain_model.repositories.base_repository import BaseRepository
 from src.domain_model.models.transaction import Transaction
-from src.utils.constants import TransactionType
+from src.utils.constants import TransactionType, DATE_GRANULARITIES
+
+
+def month_bounds(year: int, month: int) -> Tuple[date, date]:
+    """Return the half-open range [first day, first day of next month)."""
+    start = date(year, month, 1)
+    if month == 12:
+        return start, date(year + 1, 1, 1)
+    return start, date(year, month + 1, 1)
 
 
 class TransactionRepository(BaseRepository[Transaction]):
+    """
+    Transactions of one user at a time. Every method takes the owner's
+    `user_id` and filters on it, matching the user-leading indexes.
+    """
 
     def __init__(self):
         super().__init__(Transaction)
 
     # =========================================================
-    # Generic Filtering
+    # Owner-scoped Row Operations
     # =========================================================
 
-    async def filter_transactions(
+    async def get_by_id(
+        self,
+        session: AsyncSession,
+        user_id: int,
+        obj_id: int
+    ) -> Optional[Transaction]:
+        return await super().get_by_id(
+            session, obj_id, criteria=[Transaction.user_id == user_id]
+        )
+
+    async def update(
+        self,
+        session: AsyncSession,
+        user_id: int,
+        obj_id: int,
+        data: dict
+    ) -> Optional[Transaction]:
+        return await super().update(
+            session, obj_id, data, criteria=[Transaction.user_id == user_id]
+        )
+
+    async def delete(
+        self,
+        session: AsyncSession,
+        user_id: int,
+        obj_id: int
+    ) -> bool:
+        return await super().delete(
+            session, obj_id, criteria=[Transaction.user_id == user_id]
+        )
+
+    # The bulk methods keep the base signatures and add a required
+    # keyword-only `user_id`.
+
+    async def get_many(
+        self,
+        session: AsyncSession,
+        ids: Sequence[int],
+        criteria: Sequence[Any] = (),
+        columns: Optional[Sequence[Any]] = None,
+        for_update: bool = False,
+        chunk_size: Optional[int] = None,
+        *,
+        user_id: int
+    ) -> List[Any]:
+        return await super().get_many(
+            session,
+            ids,
+            criteria=[Transaction.user_id == user_id, *criteria],
+            columns=columns,
+            for_update=for_update,
+            chunk_size=chunk_size
+        )
+
+    async def bulk_update(
+        self,
+        session: AsyncSession,
+        rows: Sequence[dict],
+        criteria: Sequence[Any] = (),
+        returning: Optional[Sequence[Any]] = None,
+        chunk_size: Optional[int] = None,
+        *,
+        user_id: int
+    ) -> Union[List[Any], int]:
+        return await super().bulk_update(
+            session,
+            rows,
+            criteria=[Transaction.user_id == user_id, *criteria],
+            returning=returning,
+            chunk_size=chunk_size
+        )
+
+    async def bulk_delete(
         self,
         session: AsyncSession,
+        ids: Sequence[int],
+        criteria: Sequence[Any] = (),
+        returning: Optional[Sequence[Any]] = None,
+        chunk_size: Optional[int] = None,
+        *,
+        user_id: int
+    ) -> Union[List[Any], int]:
+        return await super().bulk_delete(
+            session,
+            ids,
+            criteria=[Transaction.user_id == user_id, *criteria],
+            returning=returning,
+            chunk_size=chunk_size
+        )
+
+    # =========================================================
+    # Filter Builder
+    # =========================================================
+
+    @staticmethod
+    def build_filters(
+        user_id: int,
         start_date: Optional[date] = None,
         end_date: Optional[date] = None,
         year: Optional[int] = None,
         month: Optional[int] = None,
         txn_type: Optional[TransactionType] = None,
-        category: Optional[str] = None,
-        skip: int = 0,
-        limit: int = 30
-    ) -> List[Transaction]:
+        category: Optional[str] = None
+    ) -> list:
+        """
+        Build WHERE clauses shared by listing, counting and exporting.
+        Month filters compile to a date range so indexes on
+        transaction_date stay usable.
+        """
 
-        filters = []
+        filters = [Transaction.user_id == user_id]
 
         if start_date and end_date:
             filters.append(
@@ -39,10 +149,9 @@ class TransactionRepository(BaseRepository[Transaction]):
             )
 
         if year and month:
-            filters.append(func.extract(
-                "year", Transaction.transaction_date) == year)
-            filters.append(func.extract(
-                "month", Transaction.transaction_date) == month)
+            month_start, next_month = month_bounds(year, month)
+            filters.append(Transaction.transaction_date >= month_start)
+            filters.append(Transaction.transaction_date < next_month)
 
         if txn_type:
             filters.append(Transaction.type == txn_type)
@@ -50,55 +159,239 @@ class TransactionRepository(BaseRepository[Transaction]):
         if category:
             filters.append(Transaction.category == category)
 
-        stmt = select(Transaction)
+        return filters
+
+    # =========================================================
+    # Generic Filtering
+    # =========================================================
+
+    async def filter_transactions(
+        self,
+        session: AsyncSession,
+        user_id: int,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        year: Optional[int] = None,
+        month: Optional[int] = None,
+        txn_type: Optional[TransactionType] = None,
+        category: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 30,
+        columns: Optional[Sequence[Any]] = None
+    ) -> List[Any]:
+        """
+        List transactions newest first. With `columns`, only those columns
+        are selected and plain rows are returned instead of ORM objects.
+        """
+
+        filters = self.build_filters(
+            user_id, start_date, end_date, year, month, txn_type, category
+        )
 
-        if filters:
-            stmt = stmt.where(and_(*filters))
+        stmt = select(*columns) if columns else select(Transaction)
+        stmt = stmt.where(and_(*filters))
 
-        stmt = stmt.order_by(Transaction.transaction_date.desc())
+        stmt = stmt.order_by(
+            Transaction.transaction_date.desc(),
+            Transaction.id.desc()
+        )
         stmt = stmt.offset(skip).limit(limit)
 
         result = await session.execute(stmt)
-        return result.scalars().all()
+        return result.all() if columns else result.scalars().all()
 
     # =========================================================
-    # Count
+    # Keyset Pagination
     # =========================================================
 
-    async def count_transactions(
+    async def filter_transactions_keyset(
         self,
         session: AsyncSession,
+        user_id: int,
+        cursor: Optional[Tuple[date, int]] = None,
+        backward: bool = False,
+        limit: int = 30,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        year: Optional[int] = None,
+        month: Optional[int] = None,
+        txn_type: Optional[TransactionType] = None,
+        category: Optional[str] = None,
+        columns: Optional[Sequence[Any]] = None
+    ) -> List[Any]:
+        """
+        Page through transactions ordered by (transaction_date, id) descending.
+
+        Rows strictly after `cursor` are returned, or strictly before it when
+        `backward` is set. Results are always in display (descending) order.
+        `columns` works as in filter_transactions.
+        """
+
+        filters = self.build_filters(
+            user_id, start_date, end_date, year, month, txn_type, category
+        )
+        key = tuple_(Transaction.transaction_date, Transaction.id)
+        stmt = select(*columns) if columns else select(Transaction)
+        stmt = stmt.where(and_(*filters))
+
+        if backward:
+            if cursor:
+                stmt = stmt.where(key > tuple_(*cursor))
+            stmt = stmt.order_by(
+                Transaction.transaction_date.asc(),
+                Transaction.id.asc()
+            )
+        else:
+            if cursor:
+                stmt = stmt.where(key < tuple_(*cursor))
+            stmt = stmt.order_by(
+                Transaction.transaction_date.desc(),
+                Transaction.id.desc()
+            )
+
+        stmt = stmt.limit(limit)
+
+        result = await session.execute(stmt)
+        items = list(result.all() if columns else result.scalars().all())
+        if backward:
+            items.reverse()
+        return items
+
+    async def get_aggregate_fields(
+        self,
+        session: AsyncSession,
+        user_id: int,
+        txn_id: int,
+        for_update: bool = True
+    ):
+        """
+        Fetch the columns the daily rollup is keyed on, locking the row so the
+        rollup delta matches what a following update/delete replaces.
+        """
+
+        stmt = select(
+            Transaction.user_id,
+            Transaction.transaction_date,
+            Transaction.type,
+            Transaction.category,
+            Transaction.amount
+        ).where(Transaction.id == txn_id, Transaction.user_id == user_id)
+
+        if for_update:
+            stmt = stmt.with_for_update()
+
+        result = await session.execute(stmt)
+        return result.one_or_none()
+
+    async def get_aggregate_fields_many(
+        self,
+        session: AsyncSession,
+        user_id: int,
+        txn_ids: Sequence[int]
+    ) -> dict:
+        """
+        get_aggregate_fields for many rows, keyed by id. The rows are locked
+        in id order so concurrent batches cannot deadlock. Ids the user does
+        not own are simply absent.
+        """
+
+        rows = await self.get_many(
+            session,
+            txn_ids,
+            columns=(
+                Transaction.id,
+                Transaction.user_id,
+                Transaction.transaction_date,
+                Transaction.type,
+                Transaction.category,
+                Transaction.amount
+            ),
+            for_update=True,
+            user_id=user_id
+        )
+        return {row.id: row for row in rows}
+
+    # =========================================================
+    # Streaming
+    # =========================================================
+
+    async def stream_transactions(
+        self,
+        session: AsyncSession,
+        user_id: int,
+        columns: Sequence[Any],
+        chunk_size: int = 1000,
         start_date: Optional[date] = None,
         end_date: Optional[date] = None,
         year: Optional[int] = None,
         month: Optional[int] = None,
         txn_type: Optional[TransactionType] = None,
         category: Optional[str] = None
-    ) -> int:
+    ) -> AsyncIterator[list]:
+        """
+        Yield matching rows as lists of column tuples, `chunk_size` at a time.
+        Uses a server-side cursor so the full result is never materialized.
+        """
+
+        filters = self.build_filters(
+            user_id, start_date, end_date, year, month, txn_type, category
+        )
 
-        filters = []
+        stmt = select(*columns).where(and_(*filters))
 
-        if start_date and end_date:
-            filters.append(
-                Transaction.transaction_date.between(start_date, end_date)
-            )
+        stmt = stmt.order_by(
+            Transaction.transaction_date.desc(),
+            Transaction.id.desc()
+        ).execution_options(yield_per=chunk_size)
 
-        if year and month:
-            filters.append(func.extract(
-                "year", Transaction.transaction_date) == year)
-            filters.append(func.extract(
-                "month", Transaction.transaction_date) == month)
+        result = await session.stream(stmt)
+        async for partition in result.partitions(chunk_size):
+            yield partition
 
-        if txn_type:
-            filters.append(Transaction.type == txn_type)
+    # =========================================================
+    # Bulk Insert
+    # =========================================================
 
-        if category:
-            filters.append(Transaction.category == category)
+    async def bulk_insert(
+        self,
+        session: AsyncSession,
+        rows: List[dict]
+    ) -> int:
+        """
+        Insert many rows without loading them back as ORM objects.
+        The asyncpg dialect batches these into multi-row INSERT statements.
+        No partition DDL runs here: rows for months without a partition land
+        in the default partition until the scheduled maintain_partitions job
+        splits them out.
+        """
 
-        stmt = select(func.count(Transaction.id))
+        if not rows:
+            return 0
 
-        if filters:
-            stmt = stmt.where(and_(*filters))
+        await session.execute(insert(Transaction), rows)
+        return len(rows)
+
+    # =========================================================
+    # Count
+    # =========================================================
+
+    async def count_transactions(
+        self,
+        session: AsyncSession,
+        user_id: int,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        year: Optional[int] = None,
+        month: Optional[int] = None,
+        txn_type: Optional[TransactionType] = None,
+        category: Optional[str] = None
+    ) -> int:
+
+        filters = self.build_filters(
+            user_id, start_date, end_date, year, month, txn_type, category
+        )
+
+        stmt = select(func.count(Transaction.id)).where(and_(*filters))
 
         result = await session.execute(stmt)
         return result.scalar_one()
@@ -110,12 +403,14 @@ class TransactionRepository(BaseRepository[Transaction]):
     async def sum_amount(
         self,
         session: AsyncSession,
+        user_id: int,
         start_date: date,
         end_date: date,
         txn_type: Optional[TransactionType] = None
     ) -> float:
 
         filters = [
+            Transaction.user_id == user_id,
             Transaction.transaction_date.between(start_date, end_date)
         ]
 
@@ -129,16 +424,76 @@ class TransactionRepository(BaseRepository[Transaction]):
         result = await session.execute(stmt)
         return result.scalar_one()
 
+    async def sum_income_expense(
+        self,
+        session: AsyncSession,
+        user_id: int,
+        start_date: date,
+        end_date: date
+    ):
+        """
+        Return income, expense and net totals for a date window.
+        Uses conditional aggregation so both types are summed in one query.
+        """
+
+        income = func.coalesce(
+            func.sum(
+                case(
+                    (Transaction.type == TransactionType.INCOME, Transaction.amount),
+                    else_=0
+                )
+            ),
+            0
+        )
+        expense = func.coalesce(
+            func.sum(
+                case(
+                    (Transaction.type == TransactionType.EXPENSE, Transaction.amount),
+                    else_=0
+                )
+            ),
+            0
+        )
+
+        stmt = select(
+            income.label("total_income"),
+            expense.label("total_expense"),
+            (income - expense).label("net")
+        ).where(
+            Transaction.user_id == user_id,
+            Transaction.transaction_date.between(start_date, end_date)
+        )
+
+        result = await session.execute(stmt)
+        return result.one()
+
+    @staticmethod
+    def date_bucket(granularity: str):
+        """Start date of the day/week/month bucket each row falls in."""
+        if granularity not in DATE_GRANULARITIES:
+            raise ValueError(f"Unsupported granularity: {granularity}")
+        # Inline the unit so SELECT and GROUP BY render the same expression.
+        unit = literal_column(f"'{granularity}'")
+        return func.date_trunc(unit, Transaction.transaction_date).cast(Date).label("bucket")
+
     async def group_sum_by_field(
         self,
         session: AsyncSession,
+        user_id: int,
         field: Any,
         start_date: date,
         end_date: date,
         txn_type: Optional[TransactionType] = None
     ):
+        """
+        Sum amounts grouped by `field`, which may be a single expression or
+        a sequence of them (e.g. a date bucket and the type).
+        """
+
+        fields = list(field) if isinstance(field, (list, tuple)) else [field]
 
         filters = [
+            Transaction.user_id == user_id,
             Transaction.transaction_date.between(start_date, end_date)
         ]
 
@@ -147,11 +502,11 @@ class TransactionRepository(BaseRepository[Transaction]):
 
         stmt = (
             select(
-                field,
+                *fields,
                 func.sum(Transaction.amount).label("total")
             )
             .where(and_(*filters))
-            .group_by(field)
+            .group_by(*fields)
         )
 
         result = await session.execute(stmt)
@@ -164,21 +519,94 @@ class TransactionRepository(BaseRepository[Transaction]):
     async def recurring_exists_for_month(
         self,
         session: AsyncSession,
+        user_id: int,
         category: str,
         amount: float,
         year: int,
         month: int
     ) -> bool:
 
+        month_start, next_month = month_bounds(year, month)
+
         stmt = select(Transaction.id).where(
             and_(
+                Transaction.user_id == user_id,
                 Transaction.category == category,
                 Transaction.amount == amount,
-                func.extract("year", Transaction.transaction_date) == year,
-                func.extract("month", Transaction.transaction_date) == month,
+                Transaction.transaction_date >= month_start,
+                Transaction.transaction_date < next_month,
                 Transaction.is_recurring_generated == True
             )
-        )
+        ).limit(1)
 
         result = await session.execute(stmt)
         return result.scalar_one_or_none() is not None
+
+    async def existing_recurring_occurrences(
+        self,
+        session: AsyncSession,
+        template_ids: List[int],
+        start_date: date,
+        end_date: date
+    ) -> Set[Tuple[int, date]]:
+        """
+        Return (template_id, transaction_date) for every generated occurrence
+        of the given templates in the window, in a single query. Templates
+        belong to one user each, so the ids already scope it; the scheduler
+        passes templates of all users at once.
+        """
+
+        if not template_ids:
+            return set()
+
+        stmt = select(
+            Transaction.recurring_template_id,
+            Transaction.transaction_date
+        ).where(
+            and_(
+                Transaction.recurring_template_id.in_(template_ids),
+                Transaction.transaction_date >= start_date,
+                Transaction.transaction_date <= end_date
+            )
+        )
+
+        result = await session.execute(stmt)
+        return {(template_id, txn_date) for template_id, txn_date in result.all()}
+
+    async def insert_recurring_occurrences(
+        self,
+        session: AsyncSession,
+        rows: List[dict]
+    ) -> list:
+        """
+        Insert occurrences with one multi-row statement.
+
+        Rows that another run already inserted are skipped by the unique
+        (recurring_template_id, transaction_date) index, so concurrent runs
+        are safe. Only rows actually inserted are returned.
+        """
+
+        if not rows:
+            return []
+
+        stmt = (
+            pg_insert(Transaction)
+            .values(rows)
+            .on_conflict_do_nothing(
+                index_elements=[
+                    Transaction.recurring_template_id,
+                    Transaction.transaction_date
+                ],
+                index_where=Transaction.recurring_template_id.isnot(None)
+            )
+            .returning(
+                Transaction.user_id,
+                Transaction.transaction_date,
+                Transaction.type,
+                Transaction.category,
+                Transaction.amount
+            )
+        )
+
+        result = await session.execute(stmt)
+        return result.all()
@@ -0,0 +1,97 @@
+from datetime import date, timedelta
+from typing import Callable
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain_model.repositories.transaction_partition_repository import (
+    TransactionPartitionRepository
+)
+from src.services.service_registry import ServiceRegistry
+from src.domain_model.models.base import utc_now
+from src.settings.config import settings
+from src.utils.constants import TRANSACTIONS_DATA_VERSION, user_id_of_data_version
+from src.utils.scheduler import Scheduler
+
+
+def build_scheduler(
+    session_factory: Callable[[], AsyncSession],
+    services: ServiceRegistry
+) -> Scheduler:
+    """Create the scheduler with the app's periodic maintenance jobs."""
+    cache = services.cache
+    transaction_service = services.transaction_service
+    recurring_service = services.recurring_service
+    version_repo = services.version_repository
+    partition_repo = TransactionPartitionRepository()
+
+    async def materialize_recurring(session: AsyncSession):
+        # Generation only moves forward from each template's watermark, so
+        # deleted or re-dated occurrences stay that way and templates that
+        # are caught up are not even loaded. Last month is in the window
+        # only so a run missed around month end still catches up.
+        today = date.today()
+        previous = (today.year - 1, 12) if today.month == 1 else (today.year, today.month - 1)
+        await recurring_service.generate(session, None, previous, (today.year, today.month))
+
+    async def precompute_summaries(session: AsyncSession):
+        # Cache entries are per user; warm only users with recent writes.
+        names = await version_repo.changed_since(
+            session,
+            f"{TRANSACTIONS_DATA_VERSION}:",
+            utc_now() - timedelta(seconds=settings.SCHEDULER_SUMMARY_ACTIVE_SECONDS),
+            settings.SCHEDULER_SUMMARY_MAX_USERS,
+        )
+        today = date.today()
+        for user_id in map(user_id_of_data_version, names):
+            await transaction_service.get_monthly_summary(session, user_id, today.year, today.month)
+            await transaction_service.get_category_breakdown(
+                session, user_id, today.year, today.month
+            )
+            await transaction_service.get_projection(session, user_id, today.year, today.month)
+            await transaction_service.get_weekly_summary(session, user_id)
+
+    async def analyze_tables(session: AsyncSession):
+        await session.execute(text("ANALYZE transactions"))
+        await session.execute(text("ANALYZE daily_rollups"))
+
+    async def maintain_partitions(session: AsyncSession):
+        # Rows past the last partition land in transactions_default; creating
+        # months ahead keeps that partition empty and pruning effective.
+        await partition_repo.ensure_ahead(session, date.today(), settings.PARTITION_MONTHS_AHEAD)
+        # Older history loaded without partitions (e.g. bulk imports) lands
+        # there too; split it out into monthly partitions.
+        await partition_repo.split_default(session)
+
+    scheduler = Scheduler(session_factory)
+    jitter = settings.SCHEDULER_JITTER_SECONDS
+
+    scheduler.add_job(
+        "materialize_recurring",
+        materialize_recurring,
+        settings.SCHEDULER_RECURRING_INTERVAL_SECONDS,
+        jitter,
+    )
+    if cache is not None:
+        # A per-process cache is only warmed by the worker that computes the
+        # summaries, so every worker must run the job, not just the lock holder.
+        scheduler.add_job(
+            "precompute_summaries",
+            precompute_summaries,
+            settings.SCHEDULER_SUMMARY_INTERVAL_SECONDS,
+            jitter,
+            exclusive=cache.backend.shared,
+        )
+    scheduler.add_job(
+        "analyze_tables",
+        analyze_tables,
+        settings.SCHEDULER_ANALYZE_INTERVAL_SECONDS,
+        jitter,
+    )
+    scheduler.add_job(
+        "maintain_partitions",
+        maintain_partitions,
+        settings.SCHEDULER_PARTITION_INTERVAL_SECONDS,
+        jitter,
+    )
+    return scheduler
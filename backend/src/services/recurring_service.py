@@ -0,0 +1,241 @@
+from datetime import date
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain_model.models.base import utc_now
+from src.domain_model.models.recurring_template import RecurringTemplate
+from src.domain_model.repositories.recurring_template_repository import RecurringTemplateRepository
+from src.domain_model.repositories.transaction_repository import TransactionRepository
+from src.domain_model.repositories.daily_rollup_repository import DailyRollupRepository
+from src.domain_model.repositories.data_version_repository import DataVersionRepository
+from src.domain_model.dtos.recurring_dtos import (
+    RecurringTemplateCreateDto,
+    RecurringTemplateUpdateDto,
+    RecurringTemplateResponseDto,
+    RecurringGenerationResultDto,
+)
+from src.utils.cache import SummaryCache, months_of
+from src.utils.constants import transactions_data_version
+from src.utils.dates import Month, clamp_day, iter_months
+from src.utils.exceptions import ServiceException
+
+# Rows per INSERT; keeps bind parameters well under the Postgres limit.
+GENERATION_CHUNK_SIZE = 1000
+
+
+class RecurringService:
+
+    def __init__(
+        self,
+        repository: RecurringTemplateRepository,
+        transaction_repository: TransactionRepository,
+        rollup_repository: DailyRollupRepository,
+        cache: Optional[SummaryCache] = None,
+        version_repository: Optional[DataVersionRepository] = None
+    ):
+        self.repository = repository
+        self.transaction_repository = transaction_repository
+        self.rollup_repository = rollup_repository
+        self.cache = cache
+        self.version_repository = version_repository or DataVersionRepository()
+
+    @staticmethod
+    def _validate(data: dict):
+        if data.get("amount") is not None and data["amount"] <= 0:
+            raise ServiceException("Amount must be greater than zero", 400)
+
+        start_date = data.get("start_date")
+        end_date = data.get("end_date")
+        if start_date and end_date and end_date < start_date:
+            raise ServiceException("End date must not be before start date", 400)
+
+    # =========================================================
+    # CRUD
+    # =========================================================
+
+    async def create_template(
+        self,
+        session: AsyncSession,
+        user_id: int,
+        dto: RecurringTemplateCreateDto
+    ):
+        data = dto.model_dump()
+        self._validate(data)
+
+        try:
+            created = await self.repository.create(
+                session, RecurringTemplate(user_id=user_id, **data)
+            )
+            return RecurringTemplateResponseDto.model_validate(created)
+        except Exception as exc:
+            raise ServiceException(f"Error creating recurring template: {str(exc)}", 500) from exc
+
+    async def get_templates(self, session: AsyncSession, user_id: int, skip: int, limit: int):
+        try:
+            templates = await self.repository.get_all(session, user_id, skip=skip, limit=limit)
+            return [RecurringTemplateResponseDto.model_validate(item) for item in templates]
+        except Exception as exc:
+            raise ServiceException(f"Error fetching recurring templates: {str(exc)}", 500) from exc
+
+    async def get_template(self, session: AsyncSession, user_id: int, template_id: int):
+        try:
+            template = await self.repository.get_by_id(session, user_id, template_id)
+            if not template:
+                raise ServiceException("Recurring template not found", 404)
+            return RecurringTemplateResponseDto.model_validate(template)
+        except ServiceException:
+            raise
+        except Exception as exc:
+            raise ServiceException(f"Error retrieving recurring template: {str(exc)}", 500) from exc
+
+    async def update_template(
+        self,
+        session: AsyncSession,
+        user_id: int,
+        template_id: int,
+        dto: RecurringTemplateUpdateDto
+    ):
+        data = dto.model_dump(exclude_unset=True)
+        self._validate(data)
+
+        try:
+            updated = await self.repository.update(
+                session=session, user_id=user_id, obj_id=template_id, data=data
+            )
+            if not updated:
+                raise ServiceException("Recurring template not found", 404)
+            if updated.end_date and updated.end_date < updated.start_date:
+                raise ServiceException("End date must not be before start date", 400)
+            return RecurringTemplateResponseDto.model_validate(updated)
+        except ServiceException:
+            raise
+        except Exception as exc:
+            raise ServiceException(f"Error updating recurring template: {str(exc)}", 500) from exc
+
+    async def delete_template(self, session: AsyncSession, user_id: int, template_id: int):
+        try:
+            deleted = await self.repository.delete(session, user_id, template_id)
+            if not deleted:
+                raise ServiceException("Recurring template not found", 404)
+            return True
+        except ServiceException:
+            raise
+        except Exception as exc:
+            raise ServiceException(f"Error deleting recurring template: {str(exc)}", 500) from exc
+
+    # =========================================================
+    # Generation
+    # =========================================================
+
+    async def generate(
+        self,
+        session: AsyncSession,
+        user_id: Optional[int],
+        from_month: Month,
+        to_month: Month,
+        as_of: Optional[date] = None
+    ):
+        """
+        Materialize every due occurrence of active templates in the months.
+
+        Each template remembers the latest occurrence generation handled
+        (`generated_through`); months up to that one are skipped, so an
+        occurrence the user deleted or moved to another date is not created
+        again by a later run. Existing occurrences are fetched in one query
+        and new ones inserted in bulk; the unique occurrence index turns
+        races with a concurrent run into no-ops. Occurrences after `as_of`
+        (default today) are not due yet and are left for a later run. A
+        `user_id` of None covers every user's templates, which is what the
+        scheduler does.
+        """
+        if from_month > to_month:
+            raise ServiceException("from must not be after to", 400)
+
+        as_of = as_of or date.today()
+        window_start = date(from_month[0], from_month[1], 1)
+        window_end = min(clamp_day(to_month[0], to_month[1], 31), as_of)
+
+        try:
+            # Templates generated through the last month have nothing left
+            # to do here, so steady-state runs load only newly due ones.
+            templates = await self.repository.get_active_for_window(
+                session, window_start, window_end, user_id,
+                pending_from=date(to_month[0], to_month[1], 1)
+            )
+
+            due = []
+            watermarks = {}
+            for template in templates:
+                generated_through = template.generated_through
+                for year, month in iter_months(from_month, to_month):
+                    if generated_through and (year, month) <= (
+                        generated_through.year, generated_through.month
+                    ):
+                        continue
+                    occurrence = clamp_day(year, month, template.day_of_month)
+                    if occurrence > window_end or occurrence < template.start_date:
+                        continue
+                    if template.end_date and occurrence > template.end_date:
+                        continue
+                    due.append((template, occurrence))
+                    watermarks[template.id] = occurrence
+
+            existing = await self.transaction_repository.existing_recurring_occurrences(
+                session, [template.id for template in templates], window_start, window_end
+            )
+
+            now = utc_now()
+            rows = [
+                {
+                    "user_id": template.user_id,
+                    "amount": template.amount,
+                    "type": template.type,
+                    "category": template.category,
+                    "description": template.description,
+                    "transaction_date": occurrence,
+                    "is_recurring_generated": True,
+                    "recurring_template_id": template.id,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for template, occurrence in due
+                if (template.id, occurrence) not in existing
+            ]
+
+            inserted = []
+            for offset in range(0, len(rows), GENERATION_CHUNK_SIZE):
+                inserted.extend(
+                    await self.transaction_repository.insert_recurring_occurrences(
+                        session, rows[offset:offset + GENERATION_CHUNK_SIZE]
+                    )
+                )
+
+            if watermarks:
+                await self.repository.advance_generated_through(session, watermarks)
+
+            if inserted:
+                await self.rollup_repository.apply_changes(session, added=inserted)
+
+                dates_by_user = {}
+                for row in inserted:
+                    dates_by_user.setdefault(row.user_id, set()).add(row.transaction_date)
+                for owner in sorted(dates_by_user):
+                    if self.cache is not None:
+                        await self.cache.invalidate_on_commit(
+                            session, owner, months_of(*dates_by_user[owner])
+                        )
+                    await self.version_repository.bump(session, transactions_data_version(owner))
+
+            return RecurringGenerationResultDto(
+                from_month=f"{from_month[0]:04d}-{from_month[1]:02d}",
+                to_month=f"{to_month[0]:04d}-{to_month[1]:02d}",
+                templates=len(templates),
+                due=len(due),
+                created=len(inserted),
+                already_present=len(due) - len(inserted),
+            )
+        except ServiceException:
+            raise
+        except Exception as exc:
+            raise ServiceException(f"Error generating recurring transactions: {str(exc)}", 500) from exc
@@ -0,0 +1,49 @@
+from typing import Optional
+
+from src.domain_model.repositories.transaction_repository import TransactionRepository
+from src.domain_model.repositories.daily_rollup_repository import DailyRollupRepository
+from src.domain_model.repositories.recurring_template_repository import RecurringTemplateRepository
+from src.domain_model.repositories.data_version_repository import DataVersionRepository
+from src.services.transaction_service import TransactionService
+from src.services.recurring_service import RecurringService
+from src.utils.cache import SummaryCache
+
+
+class ServiceRegistry:
+    """
+    Repositories and services shared by every request and scheduled job.
+
+    They hold no per-request state (sessions are passed to each call), so
+    the app builds one registry at startup instead of new objects per
+    request. Repositories can be swapped, e.g. for in-memory ones.
+    """
+
+    def __init__(
+        self,
+        cache: Optional[SummaryCache] = None,
+        transaction_repository: Optional[TransactionRepository] = None,
+        rollup_repository: Optional[DailyRollupRepository] = None,
+        recurring_template_repository: Optional[RecurringTemplateRepository] = None,
+        version_repository: Optional[DataVersionRepository] = None
+    ):
+        self.cache = cache
+        self.transaction_repository = transaction_repository or TransactionRepository()
+        self.rollup_repository = rollup_repository or DailyRollupRepository()
+        self.recurring_template_repository = (
+            recurring_template_repository or RecurringTemplateRepository()
+        )
+        self.version_repository = version_repository or DataVersionRepository()
+
+        self.transaction_service = TransactionService(
+            self.transaction_repository,
+            self.rollup_repository,
+            cache,
+            self.version_repository,
+        )
+        self.recurring_service = RecurringService(
+            self.recurring_template_repository,
+            self.transaction_repository,
+            self.rollup_repository,
+            cache,
+            self.version_repository,
+        )
@@ -1,10 +1,18 @@
+import time
 from calendar import monthrange
 from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import AsyncIterator, BinaryIO, Callable, Dict, List, Optional, Tuple
 
+from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
 
 from src.domain_model.models.transaction import Transaction
+from src.domain_model.models.daily_rollup import DailyRollup
 from src.domain_model.repositories.transaction_repository import TransactionRepository
+from src.domain_model.repositories.daily_rollup_repository import DailyRollupRepository
+from src.domain_model.repositories.data_version_repository import DataVersionRepository
 from src.domain_model.dtos.transaction_dtos import (
     TransactionCreateDto,
     TransactionUpdateDto,
@@ -14,16 +22,74 @@ from src.domain_model.dtos.transaction_dtos import (
     CategoryBreakdownDto,
     CategoryBreakdownItemDto,
     ProjectionSummaryDto,
+    DashboardSummaryDto,
+    BulkImportRowErrorDto,
+    BulkImportResultDto,
+    SummarySeriesPointDto,
+    SummarySeriesDto,
+    TransactionBatchOperationDto,
+    TransactionBatchResultDto,
+    TransactionBatchResponseDto,
 )
-from src.domain_model.dtos.base_dtos import PaginatedResponseDto
-from src.utils.constants import TransactionType
+from src.utils.constants import TransactionType, TransactionCategory, transactions_data_version
 from src.utils.exceptions import ServiceException
+from src.utils import metrics
+from src.utils.cache import SummaryCache, months_of
+from src.utils.bulk_import import (
+    IMPORT_FORMAT_CSV,
+    iter_csv_rows,
+    iter_ndjson_rows,
+    take_batch,
+)
+from src.utils.export import ExportEncoder
+from src.utils.dates import Month, clamp_day, iter_months
+from src.utils.pagination import CURSOR_NEXT, CURSOR_PREV, decode_cursor, cursor_from_row
+
+# Largest value that fits Transaction.amount (Numeric(10, 2))
+MAX_AMOUNT = Decimal("99999999.99")
+
+# Columns backing TransactionResponseDto, in its field order, so list
+# responses can be built from plain rows without per-row validation.
+RESPONSE_COLUMNS = (
+    Transaction.amount,
+    Transaction.type,
+    Transaction.category,
+    Transaction.description,
+    Transaction.transaction_date,
+    Transaction.id,
+    Transaction.user_id,
+    Transaction.created_at,
+    Transaction.updated_at,
+)
+RESPONSE_FIELDS = tuple(column.key for column in RESPONSE_COLUMNS)
+
+# Columns written by exports, in TransactionResponseDto order
+EXPORT_COLUMNS = (
+    Transaction.id,
+    Transaction.user_id,
+    Transaction.amount,
+    Transaction.type,
+    Transaction.category,
+    Transaction.description,
+    Transaction.transaction_date,
+    Transaction.created_at,
+    Transaction.updated_at,
+)
 
 
 class TransactionService:
 
-    def __init__(self, repository: TransactionRepository):
+    def __init__(
+        self,
+        repository: TransactionRepository,
+        rollup_repository: Optional[DailyRollupRepository] = None,
+        cache: Optional[SummaryCache] = None,
+        version_repository: Optional[DataVersionRepository] = None
+    ):
         self.repository = repository
+        self.rollup_repository = rollup_repository or DailyRollupRepository()
+        self.cache = cache
+        self.version_repository = version_repository or DataVersionRepository()
 
     @staticmethod
     def _normalize_transaction_date(value):
@@ -39,11 +105,49 @@ class TransactionService:
         end = date(year, month, monthrange(year, month)[1])
         return start, end
 
-    async def create_transaction(self, session: AsyncSession, dto: TransactionCreateDto):
+    async def _cache_key(self, user_id: int, name, months):
+        if self.cache is None:
+            return None
+        return await self.cache.key_for(user_id, name, months)
+
+    async def _cache_get(self, key, model):
+        if self.cache is None:
+            return None
+        return await self.cache.get(key, model)
+
+    async def _cache_set(self, key, value):
+        if self.cache is not None:
+            await self.cache.set(key, value)
+        return value
+
+    async def _invalidate_summaries(self, session: AsyncSession, user_id: int, *dates):
+        if self.cache is not None:
+            await self.cache.invalidate_on_commit(session, user_id, months_of(*dates))
+
+    async def _bump_data_version(self, session: AsyncSession, user_id: int):
+        # Last write of each unit of work; the row lock is held until commit.
+        await self.version_repository.bump(session, transactions_data_version(user_id))
+
+    async def get_data_version(self, session: AsyncSession, user_id: int) -> int:
+        """Version of the user's transactions, for ETags on read endpoints."""
+        try:
+            return await self.version_repository.get_version(
+                session, transactions_data_version(user_id)
+            )
+        except Exception as exc:
+            raise ServiceException(f"Error fetching data version: {str(exc)}", 500) from exc
+
+    async def create_transaction(
+        self,
+        session: AsyncSession,
+        user_id: int,
+        dto: TransactionCreateDto
+    ):
         if dto.amount <= 0:
             raise ServiceException("Amount must be greater than zero", 400)
 
         transaction = Transaction(
+            user_id=user_id,
             amount=dto.amount,
             type=dto.type,
             category=dto.category,
@@ -53,38 +157,255 @@ class TransactionService:
 
         try:
             created = await self.repository.create(session, transaction)
+            await self.rollup_repository.apply_changes(session, added=[created])
+            await self._invalidate_summaries(session, user_id, created.transaction_date)
+            await self._bump_data_version(session, user_id)
             return TransactionResponseDto.model_validate(created)
         except Exception as exc:
             raise ServiceException(f"Error creating transaction: {str(exc)}", 500) from exc
 
+    @staticmethod
+    def _bulk_row_error(dto: TransactionCreateDto) -> Optional[str]:
+        if dto.amount <= 0:
+            return "Amount must be greater than zero"
+        if dto.amount > MAX_AMOUNT:
+            return f"Amount must not exceed {MAX_AMOUNT}"
+        if dto.description is not None and len(dto.description) > 255:
+            return "Description must be at most 255 characters"
+        return None
+
+    async def bulk_import(
+        self,
+        session: AsyncSession,
+        user_id: int,
+        stream: BinaryIO,
+        import_format: str,
+        chunk_size: int,
+        max_errors: int
+    ):
+        """
+        Import transactions from a CSV or NDJSON stream chunk by chunk.
+
+        Each chunk is validated, inserted with one multi-row INSERT, folded
+        into the daily rollup and committed, so memory stays flat regardless
+        of file size. Invalid rows are skipped and reported by row number.
+        """
+        if import_format == IMPORT_FORMAT_CSV:
+            rows = iter_csv_rows(stream)
+        else:
+            rows = iter_ndjson_rows(stream)
+
+        total_rows = 0
+        inserted = 0
+        failed = 0
+        errors = []
+        started = time.perf_counter()
+
+        try:
+            while True:
+                # File reads may hit disk, so keep them off the event loop.
+                batch = await run_in_threadpool(take_batch, rows, chunk_size)
+                if not batch:
+                    break
+
+                values = []
+                for row_no, record in batch:
+                    total_rows += 1
+                    message = record if isinstance(record, str) else None
+                    if message is None:
+                        try:
+                            dto = TransactionCreateDto.model_validate(record)
+                            message = self._bulk_row_error(dto)
+                        except ValidationError as exc:
+                            message = "; ".join(
+                                f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}"
+                                for error in exc.errors()
+                            )
+
+                    if message:
+                        failed += 1
+                        if len(errors) < max_errors:
+                            errors.append(BulkImportRowErrorDto(row=row_no, message=message))
+                        continue
+
+                    values.append({
+                        "user_id": user_id,
+                        "amount": dto.amount,
+                        "type": dto.type,
+                        "category": dto.category,
+                        "description": dto.description,
+                        "transaction_date": self._normalize_transaction_date(dto.transaction_date),
+                    })
+
+                if values:
+                    await self.repository.bulk_insert(session, values)
+                    await self.rollup_repository.apply_changes(session, added=values)
+                    await self._invalidate_summaries(
+                        session, user_id, *{value["transaction_date"] for value in values}
+                    )
+                    await self._bump_data_version(session, user_id)
+                    await session.commit()
+                    inserted += len(values)
+                    metrics.bulk_import_rows_total.labels("inserted").inc(len(values))
+        except UnicodeDecodeError as exc:
+            raise ServiceException(
+                f"File is not valid UTF-8 (imported {inserted} rows before the error)", 400
+            ) from exc
+        except Exception as exc:
+            raise ServiceException(
+                f"Error importing transactions after {inserted} rows: {str(exc)}", 500
+            ) from exc
+        finally:
+            metrics.bulk_import_rows_total.labels("failed").inc(failed)
+            metrics.bulk_import_duration_seconds.observe(time.perf_counter() - started)
+
+        return BulkImportResultDto(
+            total_rows=total_rows,
+            inserted=inserted,
+            failed=failed,
+            errors=errors,
+            errors_truncated=failed > len(errors),
+        )
+
     async def get_paginated(
         self,
         session: AsyncSession,
+        user_id: int,
         page_no: int,
-        max_per_page: int
+        max_per_page: int,
+        include_total: bool = True
     ):
+        """
+        Return a PaginatedResponseDto-shaped dict.
+
+        Rows come straight from the database with trusted types, so they are
+        not validated again; the controller encodes the dict directly.
+        """
         try:
             skip = (page_no - 1) * max_per_page
-            items = await self.repository.filter_transactions(
+            rows = await self.repository.filter_transactions(
                 session=session,
+                user_id=user_id,
                 skip=skip,
-                limit=max_per_page
+                limit=max_per_page,
+                columns=RESPONSE_COLUMNS
+            )
+            total = (
+                await self.repository.count_transactions(session, user_id)
+                if include_total else None
+            )
+
+            return {
+                "data": [dict(zip(RESPONSE_FIELDS, row)) for row in rows],
+                "total": total,
+                "page_no": page_no,
+                "max_per_page": max_per_page,
+                "current_count": len(rows),
+            }
+        except Exception as exc:
+            raise ServiceException(f"Error fetching transactions: {str(exc)}", 500) from exc
+
+    async def get_cursor_paginated(
+        self,
+        session: AsyncSession,
+        user_id: int,
+        cursor: Optional[str],
+        max_per_page: int,
+        include_total: bool = True
+    ):
+        """Return a CursorPaginatedResponseDto-shaped dict, built like get_paginated."""
+        try:
+            position = None
+            backward = False
+            if cursor:
+                cursor_date, cursor_id, direction = decode_cursor(cursor)
+                position = (cursor_date, cursor_id)
+                backward = direction == CURSOR_PREV
+
+            # Fetch one extra row to learn whether another page exists.
+            items = await self.repository.filter_transactions_keyset(
+                session=session,
+                user_id=user_id,
+                cursor=position,
+                backward=backward,
+                limit=max_per_page + 1,
+                columns=RESPONSE_COLUMNS
             )
-            total = await self.repository.count_transactions(session)
+            has_more = len(items) > max_per_page
+            if has_more:
+                items = items[1:] if backward else items[:max_per_page]
+
+            first = items[0] if items else None
+            last = items[-1] if items else None
+            if backward:
+                next_cursor = cursor_from_row(last, CURSOR_NEXT)
+                prev_cursor = cursor_from_row(first, CURSOR_PREV) if has_more else None
+            else:
+                next_cursor = cursor_from_row(last, CURSOR_NEXT) if has_more else None
+                prev_cursor = cursor_from_row(first, CURSOR_PREV) if position else None
 
-            return PaginatedResponseDto(
-                data=[TransactionResponseDto.model_validate(item) for item in items],
-                total=total,
-                page_no=page_no,
-                max_per_page=max_per_page,
-                current_count=len(items),
+            total = (
+                await self.repository.count_transactions(session, user_id)
+                if include_total else None
             )
+
+            return {
+                "data": [dict(zip(RESPONSE_FIELDS, row)) for row in items],
+                "next_cursor": next_cursor,
+                "prev_cursor": prev_cursor,
+                "total": total,
+                "max_per_page": max_per_page,
+                "current_count": len(items),
+            }
+        except ServiceException:
+            raise
         except Exception as exc:
             raise ServiceException(f"Error fetching transactions: {str(exc)}", 500) from exc
 
-    async def get_by_id(self, session: AsyncSession, txn_id: int):
+    async def export_transactions(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        user_id: int,
+        export_format: str,
+        chunk_size: int,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        year: Optional[int] = None,
+        month: Optional[int] = None,
+        txn_type: Optional[TransactionType] = None,
+        category: Optional[TransactionCategory] = None
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream matching transactions as encoded chunks.
+
+        The response body is produced after the request's own session has
+        been released, so the export opens a dedicated session that lives
+        exactly as long as the stream.
+        """
+        encoder = ExportEncoder(export_format, [column.key for column in EXPORT_COLUMNS])
+
+        async with session_factory() as session:
+            header = encoder.header()
+            if header:
+                yield header
+
+            async for rows in self.repository.stream_transactions(
+                session,
+                user_id,
+                EXPORT_COLUMNS,
+                chunk_size=chunk_size,
+                start_date=start_date,
+                end_date=end_date,
+                year=year,
+                month=month,
+                txn_type=txn_type,
+                category=category,
+            ):
+                yield encoder.encode(rows)
+
+    async def get_by_id(self, session: AsyncSession, user_id: int, txn_id: int):
         try:
-            transaction = await self.repository.get_by_id(session, txn_id)
+            transaction = await self.repository.get_by_id(session, user_id, txn_id)
             if not transaction:
                 raise ServiceException("Transaction not found", 404)
 
@@ -97,6 +418,7 @@ class TransactionService:
     async def update_transaction(
         self,
         session: AsyncSession,
+        user_id: int,
         txn_id: int,
         dto: TransactionUpdateDto
     ):
@@ -109,124 +431,507 @@ class TransactionService:
             data["transaction_date"] = self._normalize_transaction_date(data["transaction_date"])
 
         try:
+            previous = await self.repository.get_aggregate_fields(session, user_id, txn_id)
+            if not previous:
+                raise ServiceException("Transaction not found", 404)
+
             updated = await self.repository.update(
                 session=session,
+                user_id=user_id,
                 obj_id=txn_id,
                 data=data
             )
             if not updated:
                 raise ServiceException("Transaction not found", 404)
 
+            await self.rollup_repository.apply_changes(
+                session, added=[updated], removed=[previous]
+            )
+            await self._invalidate_summaries(
+                session, user_id, previous.transaction_date, updated.transaction_date
+            )
+            await self._bump_data_version(session, user_id)
+
             return TransactionResponseDto.model_validate(updated)
         except ServiceException:
             raise
         except Exception as exc:
             raise ServiceException(f"Error updating transaction: {str(exc)}", 500) from exc
 
-    async def delete_transaction(self, session: AsyncSession, txn_id: int):
+    async def delete_transaction(self, session: AsyncSession, user_id: int, txn_id: int):
         try:
-            deleted = await self.repository.delete(session, txn_id)
+            previous = await self.repository.get_aggregate_fields(session, user_id, txn_id)
+            if not previous:
+                raise ServiceException("Transaction not found", 404)
+
+            deleted = await self.repository.delete(session, user_id, txn_id)
             if not deleted:
                 raise ServiceException("Transaction not found", 404)
+
+            await self.rollup_repository.apply_changes(session, removed=[previous])
+            await self._invalidate_summaries(session, user_id, previous.transaction_date)
+            await self._bump_data_version(session, user_id)
             return True
         except ServiceException:
             raise
         except Exception as exc:
             raise ServiceException(f"Error deleting transaction: {str(exc)}", 500) from exc
 
-    async def get_monthly_summary(self, session: AsyncSession, year: int, month: int):
+    @staticmethod
+    def _batch_update_error(data: dict) -> Optional[str]:
+        for field in ("amount", "type", "category"):
+            if field in data and data[field] is None:
+                return f"{field} must not be null"
+        if "amount" in data:
+            if data["amount"] <= 0:
+                return "Amount must be greater than zero"
+            if data["amount"] > MAX_AMOUNT:
+                return f"Amount must not exceed {MAX_AMOUNT}"
+        if data.get("description") is not None and len(data["description"]) > 255:
+            return "Description must be at most 255 characters"
+        return None
+
+    async def apply_batch(
+        self,
+        session: AsyncSession,
+        user_id: int,
+        operations: List[TransactionBatchOperationDto],
+        max_operations: int
+    ) -> TransactionBatchResponseDto:
+        """
+        Apply create/update/delete operations all or nothing.
+
+        Every operation is validated and the rows it targets are locked
+        first. If any fails, nothing is written: failed operations carry
+        their error and the rest are reported with 424. Otherwise creates run
+        as one multi-row INSERT, updates as one UPDATE ... FROM (VALUES ...)
+        per set of changed fields, and deletes as one DELETE, followed by a
+        single rollup upsert and data version bump.
+        """
+        if len(operations) > max_operations:
+            raise ServiceException(f"A batch may hold at most {max_operations} operations", 400)
+
+        errors: Dict[int, Tuple[int, str]] = {}
+        creates: List[Tuple[int, dict]] = []
+        updates: List[Tuple[int, int, dict]] = []
+        deletes: List[Tuple[int, int]] = []
+        targeted = set()
+
+        for index, operation in enumerate(operations):
+            if operation.op == "create":
+                message = self._bulk_row_error(operation.data)
+                if message:
+                    errors[index] = (400, message)
+                    continue
+                dto = operation.data
+                creates.append((index, {
+                    "user_id": user_id,
+                    "amount": dto.amount,
+                    "type": dto.type,
+                    "category": dto.category,
+                    "description": dto.description,
+                    "transaction_date": self._normalize_transaction_date(dto.transaction_date),
+                }))
+                continue
+
+            # One UPDATE ... FROM cannot change a row twice, and an update
+            # next to a delete of the same row has no sensible order.
+            if operation.id in targeted:
+                errors[index] = (400, f"Transaction {operation.id} is targeted by more than one operation")
+                continue
+            targeted.add(operation.id)
+
+            if operation.op == "update":
+                data = operation.data.model_dump(exclude_unset=True)
+                message = self._batch_update_error(data)
+                if message:
+                    errors[index] = (400, message)
+                    continue
+                if "transaction_date" in data:
+                    data["transaction_date"] = self._normalize_transaction_date(data["transaction_date"])
+                updates.append((index, operation.id, data))
+            else:
+                deletes.append((index, operation.id))
+
         try:
-            start, end = self._get_month_window(year, month)
-            total_expense = await self.repository.sum_amount(
-                session, start, end, TransactionType.EXPENSE
+            previous = await self.repository.get_aggregate_fields_many(
+                session, user_id, sorted(targeted)
             )
-            total_income = await self.repository.sum_amount(
-                session, start, end, TransactionType.INCOME
+            for index, txn_id, *_ in (*updates, *deletes):
+                if txn_id not in previous:
+                    errors[index] = (404, "Transaction not found")
+            if errors:
+                return self._batch_failure(operations, errors)
+
+            created = await self.repository.bulk_create(
+                session, [row for _, row in creates], returning=RESPONSE_COLUMNS
             )
-            return MonthlySummaryDto(
-                total_expense=total_expense,
-                total_income=total_income,
-                net_savings=total_income - total_expense,
+            updated = {
+                row.id: row
+                for row in await self.repository.bulk_update(
+                    session,
+                    [{"id": txn_id, **data} for _, txn_id, data in updates],
+                    returning=RESPONSE_COLUMNS,
+                    user_id=user_id
+                )
+            }
+            deleted = await self.repository.bulk_delete(
+                session,
+                [txn_id for _, txn_id in deletes],
+                returning=[Transaction.id],
+                user_id=user_id
             )
+
+            removed = [previous[txn_id] for _, txn_id, *_ in (*updates, *deletes)]
+            await self.rollup_repository.apply_changes(
+                session, added=[*created, *updated.values()], removed=removed
+            )
+            await self._invalidate_summaries(
+                session,
+                user_id,
+                *{row.transaction_date for row in (*created, *updated.values(), *removed)}
+            )
+            await self._bump_data_version(session, user_id)
         except Exception as exc:
-            raise ServiceException(f"Error fetching monthly summary: {str(exc)}", 500) from exc
+            raise ServiceException(f"Error applying batch: {str(exc)}", 500) from exc
 
-    async def get_weekly_summary(self, session: AsyncSession):
-        try:
-            today = date.today()
-            week_start = today - timedelta(days=today.weekday())
-            week_end = week_start + timedelta(days=6)
+        results = [None] * len(operations)
+        for (index, _), row in zip(creates, created):
+            results[index] = TransactionBatchResultDto(
+                index=index,
+                op="create",
+                status_code=201,
+                id=row.id,
+                data=TransactionResponseDto.model_validate(row),
+            )
+        for index, txn_id, _ in updates:
+            results[index] = TransactionBatchResultDto(
+                index=index,
+                op="update",
+                status_code=200,
+                id=txn_id,
+                data=TransactionResponseDto.model_validate(updated[txn_id]),
+            )
+        for index, txn_id in deletes:
+            results[index] = TransactionBatchResultDto(
+                index=index, op="delete", status_code=200, id=txn_id
+            )
+
+        for op, count in (("create", len(created)), ("update", len(updated)), ("delete", len(deleted))):
+            if count:
+                metrics.batch_operations_total.labels(op, "applied").inc(count)
+
+        return TransactionBatchResponseDto(
+            applied=True,
+            created=len(created),
+            updated=len(updated),
+            deleted=len(deleted),
+            results=results,
+        )
 
-            total_expense = await self.repository.sum_amount(
-                session, week_start, week_end, TransactionType.EXPENSE
+    @staticmethod
+    def _batch_failure(
+        operations: List[TransactionBatchOperationDto],
+        errors: Dict[int, Tuple[int, str]]
+    ) -> TransactionBatchResponseDto:
+        results = []
+        for index, operation in enumerate(operations):
+            status_code, message = errors.get(
+                index, (424, "Not applied because another operation failed")
             )
-            total_income = await self.repository.sum_amount(
-                session, week_start, week_end, TransactionType.INCOME
+            results.append(TransactionBatchResultDto(
+                index=index,
+                op=operation.op,
+                status_code=status_code,
+                id=getattr(operation, "id", None),
+                error=message,
+            ))
+            metrics.batch_operations_total.labels(
+                operation.op, "failed" if index in errors else "not_applied"
+            ).inc()
+
+        return TransactionBatchResponseDto(
+            applied=False, created=0, updated=0, deleted=0, results=results
+        )
+
+    async def get_monthly_summary(self, session: AsyncSession, user_id: int, year: int, month: int):
+        key = await self._cache_key(user_id, ("monthly", year, month), [(year, month)])
+        cached = await self._cache_get(key, MonthlySummaryDto)
+        if cached is not None:
+            return cached
+
+        try:
+            start, end = self._get_month_window(year, month)
+            totals = await self.rollup_repository.sum_income_expense(session, user_id, start, end)
+            summary = MonthlySummaryDto(
+                total_expense=totals.total_expense,
+                total_income=totals.total_income,
+                net_savings=totals.net,
             )
-            return WeeklySummaryDto(
+            return await self._cache_set(key, summary)
+        except Exception as exc:
+            raise ServiceException(f"Error fetching monthly summary: {str(exc)}", 500) from exc
+
+    async def get_weekly_summary(self, session: AsyncSession, user_id: int):
+        today = date.today()
+        week_start = today - timedelta(days=today.weekday())
+        week_end = week_start + timedelta(days=6)
+
+        key = await self._cache_key(
+            user_id, ("weekly", week_start), months_of(week_start, week_end)
+        )
+        cached = await self._cache_get(key, WeeklySummaryDto)
+        if cached is not None:
+            return cached
+
+        try:
+            totals = await self.rollup_repository.sum_income_expense(
+                session, user_id, week_start, week_end
+            )
+            summary = WeeklySummaryDto(
                 week_start=week_start,
                 week_end=week_end,
-                total_expense=total_expense,
-                total_income=total_income,
-                net_savings=total_income - total_expense,
+                total_expense=totals.total_expense,
+                total_income=totals.total_income,
+                net_savings=totals.net,
             )
+            return await self._cache_set(key, summary)
         except Exception as exc:
             raise ServiceException(f"Error fetching weekly summary: {str(exc)}", 500) from exc
 
-    async def get_category_breakdown(self, session: AsyncSession, year: int, month: int):
+    @staticmethod
+    def _build_category_breakdown(year: int, month: int, grouped):
+        items = [
+            CategoryBreakdownItemDto(category=category, total=total)
+            for category, total in grouped
+        ]
+        items.sort(key=lambda item: item.total, reverse=True)
+        total_expense = sum(item.total for item in items)
+
+        return CategoryBreakdownDto(
+            year=year,
+            month=month,
+            total_expense=total_expense,
+            items=items,
+        )
+
+    @staticmethod
+    def _build_projection(start: date, end: date, today: date, spent_so_far):
+        total_days = end.day
+
+        if today < start:
+            days_passed = 0
+            spent_so_far = 0
+        elif today > end:
+            days_passed = total_days
+        else:
+            days_passed = today.day
+
+        projected = 0 if days_passed == 0 else (spent_so_far / days_passed) * total_days
+
+        return ProjectionSummaryDto(
+            spent_so_far=spent_so_far,
+            projected_month_end=projected,
+            days_passed=days_passed,
+            total_days=total_days,
+        )
+
+    async def get_category_breakdown(
+        self,
+        session: AsyncSession,
+        user_id: int,
+        year: int,
+        month: int
+    ):
+        key = await self._cache_key(user_id, ("category", year, month), [(year, month)])
+        cached = await self._cache_get(key, CategoryBreakdownDto)
+        if cached is not None:
+            return cached
+
         try:
             start, end = self._get_month_window(year, month)
-            grouped = await self.repository.group_sum_by_field(
+            grouped = await self.rollup_repository.group_sum_by_field(
                 session=session,
-                field=Transaction.category,
+                user_id=user_id,
+                field=DailyRollup.category,
                 start_date=start,
                 end_date=end,
                 txn_type=TransactionType.EXPENSE
             )
 
-            items = [
-                CategoryBreakdownItemDto(category=category, total=total)
-                for category, total in grouped
-            ]
-            items.sort(key=lambda item: item.total, reverse=True)
-            total_expense = sum(item.total for item in items)
+            breakdown = self._build_category_breakdown(year, month, grouped)
+            return await self._cache_set(key, breakdown)
+        except Exception as exc:
+            raise ServiceException(f"Error fetching category breakdown: {str(exc)}", 500) from exc
 
-            return CategoryBreakdownDto(
+    async def get_projection(self, session: AsyncSession, user_id: int, year: int, month: int):
+        today = date.today()
+
+        # Projection depends on the current day, so it is part of the key.
+        key = await self._cache_key(
+            user_id, ("projection", year, month, today), [(year, month)]
+        )
+        cached = await self._cache_get(key, ProjectionSummaryDto)
+        if cached is not None:
+            return cached
+
+        try:
+            start, end = self._get_month_window(year, month)
+
+            spent_so_far = 0
+            if today >= start:
+                totals = await self.rollup_repository.sum_income_expense(
+                    session, user_id, start, min(today, end)
+                )
+                spent_so_far = totals.total_expense
+
+            projection = self._build_projection(start, end, today, spent_so_far)
+            return await self._cache_set(key, projection)
+        except Exception as exc:
+            raise ServiceException(f"Error fetching projection: {str(exc)}", 500) from exc
+
+    async def get_dashboard(self, session: AsyncSession, user_id: int, year: int, month: int):
+        """
+        Monthly totals, category breakdown, projection and the current week
+        in one response, computed from a single rollup scan.
+        """
+
+        today = date.today()
+        week_start = today - timedelta(days=today.weekday())
+        week_end = week_start + timedelta(days=6)
+
+        key = await self._cache_key(
+            user_id,
+            ("dashboard", year, month, today),
+            [(year, month), *months_of(week_start, week_end)]
+        )
+        cached = await self._cache_get(key, DashboardSummaryDto)
+        if cached is not None:
+            return cached
+
+        try:
+            start, end = self._get_month_window(year, month)
+            rows = await self.rollup_repository.dashboard_aggregates(
+                session, user_id, start, end, week_start, week_end, as_of=today
+            )
+
+            month_totals = {TransactionType.INCOME: Decimal(0), TransactionType.EXPENSE: Decimal(0)}
+            week_totals = dict(month_totals)
+            spent_so_far = Decimal(0)
+            grouped = []
+            for row in rows:
+                month_totals[row.type] += row.month_total
+                week_totals[row.type] += row.week_total
+                if row.type == TransactionType.EXPENSE:
+                    spent_so_far += row.month_to_date_total
+                    if row.month_count:
+                        grouped.append((row.category, row.month_total))
+
+            income = month_totals[TransactionType.INCOME]
+            expense = month_totals[TransactionType.EXPENSE]
+            week_income = week_totals[TransactionType.INCOME]
+            week_expense = week_totals[TransactionType.EXPENSE]
+
+            dashboard = DashboardSummaryDto(
                 year=year,
                 month=month,
-                total_expense=total_expense,
-                items=items,
+                monthly=MonthlySummaryDto(
+                    total_expense=expense,
+                    total_income=income,
+                    net_savings=income - expense,
+                ),
+                category_breakdown=self._build_category_breakdown(year, month, grouped),
+                projection=self._build_projection(start, end, today, spent_so_far),
+                weekly=WeeklySummaryDto(
+                    week_start=week_start,
+                    week_end=week_end,
+                    total_expense=week_expense,
+                    total_income=week_income,
+                    net_savings=week_income - week_expense,
+                ),
             )
+            return await self._cache_set(key, dashboard)
         except Exception as exc:
-            raise ServiceException(f"Error fetching category breakdown: {str(exc)}", 500) from exc
+            raise ServiceException(f"Error fetching dashboard summary: {str(exc)}", 500) from exc
+
+    @staticmethod
+    def _series_buckets(granularity: str, start: date, end: date):
+        """Every bucket start between start and end, matching date_trunc."""
+        if granularity == "month":
+            return [
+                date(year, month, 1)
+                for year, month in iter_months((start.year, start.month), (end.year, end.month))
+            ]
+
+        step = timedelta(days=7 if granularity == "week" else 1)
+        bucket = start - timedelta(days=start.weekday()) if granularity == "week" else start
+        buckets = []
+        while bucket <= end:
+            buckets.append(bucket)
+            bucket += step
+        return buckets
+
+    async def get_summary_series(
+        self,
+        session: AsyncSession,
+        user_id: int,
+        from_month: Month,
+        to_month: Month,
+        granularity: str
+    ):
+        """
+        Income, expense and net per day/week/month bucket from one grouped
+        query, with buckets that have no activity filled with zeros.
+        """
+        if from_month > to_month:
+            raise ServiceException("from must not be after to", 400)
+
+        months = list(iter_months(from_month, to_month))
+        key = await self._cache_key(
+            user_id, ("series", granularity, from_month, to_month), months
+        )
+        cached = await self._cache_get(key, SummarySeriesDto)
+        if cached is not None:
+            return cached
 
-    async def get_projection(self, session: AsyncSession, year: int, month: int):
         try:
-            today = date.today()
-            start, end = self._get_month_window(year, month)
-            total_days = end.day
-
-            if today < start:
-                days_passed = 0
-                spent_so_far = 0
-            elif today > end:
-                days_passed = total_days
-                spent_so_far = await self.repository.sum_amount(
-                    session, start, end, TransactionType.EXPENSE
-                )
-            else:
-                days_passed = today.day
-                spent_so_far = await self.repository.sum_amount(
-                    session, start, today, TransactionType.EXPENSE
-                )
+            start = date(from_month[0], from_month[1], 1)
+            end = clamp_day(to_month[0], to_month[1], 31)
+            bucket = self.rollup_repository.date_bucket(granularity)
+
+            grouped = await self.rollup_repository.group_sum_by_field(
+                session=session,
+                user_id=user_id,
+                field=(bucket, DailyRollup.type),
+                start_date=start,
+                end_date=end
+            )
 
-            projected = 0 if days_passed == 0 else (spent_so_far / days_passed) * total_days
+            totals = {}
+            for bucket_start, txn_type, total in grouped:
+                income, expense = totals.get(bucket_start, (Decimal(0), Decimal(0)))
+                if txn_type == TransactionType.INCOME:
+                    income += total
+                else:
+                    expense += total
+                totals[bucket_start] = (income, expense)
 
-            return ProjectionSummaryDto(
-                spent_so_far=spent_so_far,
-                projected_month_end=projected,
-                days_passed=days_passed,
-                total_days=total_days,
+            points = []
+            for bucket_start in self._series_buckets(granularity, start, end):
+                income, expense = totals.get(bucket_start, (Decimal(0), Decimal(0)))
+                points.append(SummarySeriesPointDto(
+                    bucket_start=bucket_start,
+                    total_expense=expense,
+                    total_income=income,
+                    net_savings=income - expense,
+                ))
+
+            series = SummarySeriesDto(
+                granularity=granularity,
+                from_month=f"{from_month[0]:04d}-{from_month[1]:02d}",
+                to_month=f"{to_month[0]:04d}-{to_month[1]:02d}",
+                points=points,
             )
+            return await self._cache_set(key, series)
         except Exception as exc:
-            raise ServiceException(f"Error fetching projection: {str(exc)}", 500) from exc
+            raise ServiceException(f"Error fetching summary series: {str(exc)}", 500) from exc
@@ -0,0 +1,71 @@
+import csv
+import io
+import json
+from typing import BinaryIO, Iterator, List, Optional, Tuple, Union
+
+
+IMPORT_FORMAT_CSV = "csv"
+IMPORT_FORMAT_NDJSON = "ndjson"
+
+# Each parsed record is (row number, fields) or (row number, parse error message)
+ParsedRow = Tuple[int, Union[dict, str]]
+
+
+def detect_import_format(filename: Optional[str], content_type: Optional[str]) -> Optional[str]:
+    """Guess the upload format from its filename or content type."""
+    name = (filename or "").lower()
+    kind = (content_type or "").lower()
+
+    if name.endswith((".ndjson", ".jsonl")) or "ndjson" in kind or "jsonl" in kind:
+        return IMPORT_FORMAT_NDJSON
+    if name.endswith(".csv") or "csv" in kind:
+        return IMPORT_FORMAT_CSV
+    return None
+
+
+def iter_csv_rows(stream: BinaryIO) -> Iterator[ParsedRow]:
+    """
+    Yield rows of a CSV file with a header line, one at a time.
+    Rows are numbered from 1, not counting the header. Empty cells become
+    None so optional DTO fields fall back to defaults.
+    """
+    text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+    try:
+        reader = csv.DictReader(text)
+        for row_no, record in enumerate(reader, start=1):
+            if None in record:
+                yield row_no, "Too many columns"
+                continue
+            yield row_no, {
+                key.strip(): (value if value != "" else None)
+                for key, value in record.items()
+                if key is not None
+            }
+    finally:
+        text.detach()
+
+
+def iter_ndjson_rows(stream: BinaryIO) -> Iterator[ParsedRow]:
+    """Yield one JSON object per non-blank line."""
+    for row_no, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as exc:
+            yield row_no, f"Invalid JSON: {exc}"
+            continue
+        if not isinstance(record, dict):
+            yield row_no, "Each line must be a JSON object"
+            continue
+        yield row_no, record
+
+
+def take_batch(rows: Iterator[ParsedRow], size: int) -> List[ParsedRow]:
+    """Pull up to `size` parsed rows from the iterator."""
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            break
+    return batch
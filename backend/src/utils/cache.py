@@ -0,0 +1,187 @@
+import asyncio
+import logging
+from datetime import date
+from typing import Hashable, Iterable, List, Optional, Set, Tuple, Type, TypeVar
+
+from pydantic import BaseModel
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.settings.config import settings
+from src.utils.cache_backends import CacheBackend, build_cache_backend
+from src.utils import metrics
+
+
+logger = logging.getLogger(__name__)
+
+Month = Tuple[int, int]
+DtoType = TypeVar("DtoType", bound=BaseModel)
+
+_PENDING_GENERATIONS_KEY = "summary_cache_pending_generations"
+
+
+def months_of(*dates: date) -> Set[Month]:
+    """Return the (year, month) pairs covered by the given dates."""
+    return {(value.year, value.month) for value in dates if value is not None}
+
+
+def _generation_name(user_id: int, month: Month) -> str:
+    return f"{user_id}:{month[0]:04d}-{month[1]:02d}"
+
+
+def _generation_names(user_id: int, months: Iterable[Month]) -> List[str]:
+    return sorted({_generation_name(user_id, month) for month in months})
+
+
+class SummaryCache:
+    """
+    Read-through cache for summary DTOs on top of a CacheBackend.
+
+    Keys embed the current generation of every month the value was computed
+    from. A write bumps those generations, which makes older entries
+    unreachable on every worker sharing the backend; they then age out via
+    TTL or LRU. Keys and generations are per user, so one user's writes
+    never evict another's summaries. Backend failures are counted and
+    treated as misses.
+    """
+
+    def __init__(self, backend: CacheBackend, ttl_seconds: float = 60.0):
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.errors = 0
+        self._background_tasks: Set[asyncio.Task] = set()
+
+    async def key_for(
+        self,
+        user_id: int,
+        name: Tuple[Hashable, ...],
+        months: Iterable[Month]
+    ) -> Optional[str]:
+        """
+        Build a versioned key, or None if the backend is unavailable.
+        Resolve it once per request and reuse it for both lookup and store.
+        """
+        generation_names = _generation_names(user_id, months)
+        try:
+            generations = await self.backend.get_generations(generation_names)
+        except Exception:
+            self.errors += 1
+            metrics.summary_cache_errors_total.inc()
+            logger.warning("Summary cache backend unavailable", exc_info=True)
+            return None
+
+        versions = ",".join(
+            f"{month}@{generation}" for month, generation in zip(generation_names, generations)
+        )
+        return f"summary:{user_id}:" + ":".join(str(part) for part in name) + "|" + versions
+
+    async def get(self, key: Optional[str], model: Type[DtoType]) -> Optional[DtoType]:
+        if key is None:
+            return None
+
+        try:
+            raw = await self.backend.get(key)
+        except Exception:
+            self.errors += 1
+            metrics.summary_cache_errors_total.inc()
+            logger.warning("Summary cache backend unavailable", exc_info=True)
+            raw = None
+
+        if raw is None:
+            self.misses += 1
+            metrics.summary_cache_lookups_total.labels("miss").inc()
+            return None
+
+        self.hits += 1
+        metrics.summary_cache_lookups_total.labels("hit").inc()
+        return model.model_validate_json(raw)
+
+    async def set(self, key: Optional[str], value: DtoType) -> DtoType:
+        if key is None:
+            return value
+
+        try:
+            await self.backend.set(key, value.model_dump_json().encode("utf-8"), self.ttl_seconds)
+        except Exception:
+            self.errors += 1
+            metrics.summary_cache_errors_total.inc()
+            logger.warning("Summary cache backend unavailable", exc_info=True)
+        return value
+
+    async def invalidate_months(self, user_id: int, months: Iterable[Month]) -> None:
+        await self._bump_generations(_generation_names(user_id, months))
+
+    async def _bump_generations(self, generation_names: List[str]) -> None:
+        if not generation_names:
+            return
+
+        try:
+            await self.backend.bump_generations(generation_names)
+            self.invalidations += len(generation_names)
+            metrics.summary_cache_invalidations_total.inc(len(generation_names))
+        except Exception:
+            self.errors += 1
+            metrics.summary_cache_errors_total.inc()
+            logger.warning("Summary cache invalidation failed", exc_info=True)
+
+    async def invalidate_on_commit(
+        self,
+        session: AsyncSession,
+        user_id: int,
+        months: Iterable[Month]
+    ) -> None:
+        """
+        Invalidate now and again once the session commits.
+
+        The second pass drops anything a concurrent reader cached from
+        pre-commit data in between. Commit hooks are synchronous, so that
+        pass runs as a background task on the current loop.
+        """
+        generation_names = _generation_names(user_id, months)
+        await self._bump_generations(generation_names)
+
+        info = session.sync_session.info
+        pending = info.get(_PENDING_GENERATIONS_KEY)
+        if pending is not None:
+            pending.update(generation_names)
+            return
+
+        info[_PENDING_GENERATIONS_KEY] = set(generation_names)
+        sync_session = session.sync_session
+        loop = asyncio.get_running_loop()
+
+        def on_commit(_session):
+            committed = info.pop(_PENDING_GENERATIONS_KEY, set())
+            event.remove(sync_session, "after_rollback", on_rollback)
+            task = loop.create_task(self._bump_generations(sorted(committed)))
+            self._background_tasks.add(task)
+            task.add_done_callback(self._background_tasks.discard)
+
+        def on_rollback(_session):
+            info.pop(_PENDING_GENERATIONS_KEY, None)
+            event.remove(sync_session, "after_commit", on_commit)
+
+        event.listen(sync_session, "after_commit", on_commit, once=True)
+        event.listen(sync_session, "after_rollback", on_rollback, once=True)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "backend": self.backend.name,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "invalidations": self.invalidations,
+            "errors": self.errors,
+            **self.backend.stats(),
+        }
+
+
+summary_cache = SummaryCache(
+    build_cache_backend(settings),
+    ttl_seconds=settings.SUMMARY_CACHE_TTL_SECONDS,
+)
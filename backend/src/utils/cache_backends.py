@@ -0,0 +1,159 @@
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+class CacheBackend(ABC):
+    """
+    Storage used by SummaryCache.
+
+    Values are opaque bytes. Generations are integer counters that writers
+    bump and readers fold into their keys, which is how invalidation reaches
+    every worker sharing the backend.
+    """
+
+    name = "abstract"
+    # Whether every worker sees the same entries, or each process its own.
+    shared = False
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[bytes]:
+        ...
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        ...
+
+    @abstractmethod
+    async def get_generations(self, names: List[str]) -> List[int]:
+        ...
+
+    @abstractmethod
+    async def bump_generations(self, names: List[str]) -> None:
+        ...
+
+    def stats(self) -> dict:
+        return {}
+
+    async def close(self) -> None:
+        return None
+
+
+class InMemoryCacheBackend(CacheBackend):
+    """Bounded LRU with per-entry TTL, private to the current process."""
+
+    name = "memory"
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self._generations: Dict[str, int] = {}
+        self.evictions = 0
+
+    async def get(self, key: str) -> Optional[bytes]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        self._entries[key] = (self._clock() + ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    async def get_generations(self, names: List[str]) -> List[int]:
+        return [self._generations.get(name, 0) for name in names]
+
+    async def bump_generations(self, names: List[str]) -> None:
+        for name in names:
+            self._generations[name] = self._generations.get(name, 0) + 1
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "evictions": self.evictions,
+        }
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Backend for any server speaking the Redis protocol, shared by all workers.
+
+    Entries expire through the server's own TTL; generation counters never
+    expire so an old key can never become reachable again.
+    """
+
+    name = "redis"
+    shared = True
+
+    def __init__(self, url: str, key_prefix: str = "", client=None):
+        if client is None:
+            try:
+                from redis import asyncio as redis_asyncio
+            except ImportError as exc:
+                raise RuntimeError(
+                    "CACHE_BACKEND=redis requires the 'redis' package"
+                ) from exc
+            client = redis_asyncio.from_url(url)
+
+        self._client = client
+        self._prefix = key_prefix
+
+    def _generation_key(self, name: str) -> str:
+        return f"{self._prefix}gen:{name}"
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self._client.get(self._prefix + key)
+
+    async def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        await self._client.set(
+            self._prefix + key, value, px=max(1, int(ttl_seconds * 1000))
+        )
+
+    async def get_generations(self, names: List[str]) -> List[int]:
+        if not names:
+            return []
+        values = await self._client.mget(
+            [self._generation_key(name) for name in names]
+        )
+        return [int(value) if value is not None else 0 for value in values]
+
+    async def bump_generations(self, names: List[str]) -> None:
+        if not names:
+            return
+        pipe = self._client.pipeline(transaction=False)
+        for name in names:
+            pipe.incr(self._generation_key(name))
+        await pipe.execute()
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+
+def build_cache_backend(settings) -> CacheBackend:
+    """Create the backend selected by Settings.CACHE_BACKEND."""
+    backend = settings.CACHE_BACKEND.lower()
+    if backend == "memory":
+        return InMemoryCacheBackend(max_entries=settings.SUMMARY_CACHE_MAX_ENTRIES)
+    if backend == "redis":
+        return RedisCacheBackend(
+            settings.REDIS_URL,
+            key_prefix=settings.CACHE_KEY_PREFIX,
+        )
+    raise ValueError(f"Unknown CACHE_BACKEND: {settings.CACHE_BACKEND}")
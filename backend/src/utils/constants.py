@@ -27,3 +27,21 @@ class TransactionCategory(str, Enum):
     SUBSCRIPTIONS = "subscriptions"
     
     OTHER = "other"
+
+
+# Bucket sizes accepted by date_trunc-based time series
+DATE_GRANULARITIES = ("day", "week", "month")
+
+
+# Prefix of the per-user data_versions rows bumped by every transactions write
+TRANSACTIONS_DATA_VERSION = "transactions"
+
+
+def transactions_data_version(user_id: int) -> str:
+    """data_versions row tracking one user's transactions."""
+    return f"{TRANSACTIONS_DATA_VERSION}:{user_id}"
+
+
+def user_id_of_data_version(name: str) -> int:
+    """Inverse of transactions_data_version."""
+    return int(name.rsplit(":", 1)[1])
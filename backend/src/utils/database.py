@@ -1,15 +1,50 @@
+import time
+
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker
 
 from src.settings.config import settings
+from src.utils.metrics import observe_query
+from src.utils.timing import current_db_operation, record_query
 
 DATABASE_URL = settings.DATABASE_URL
 
 engine = create_async_engine(
     DATABASE_URL,
-    echo=True,
+    echo=settings.DB_ECHO,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    connect_args={"statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE},
 )
 
+
+# Per-request DB time and query count, read by TimingMiddleware. Start times
+# are stacked on the connection since one connection runs one query at a time.
+@event.listens_for(engine.sync_engine, "before_cursor_execute")
+def _start_query_timer(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+@event.listens_for(engine.sync_engine, "after_cursor_execute")
+def _stop_query_timer(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_started"].pop()
+    record_query(elapsed)
+    observe_query(current_db_operation(), elapsed)
+
+
+@event.listens_for(engine.sync_engine, "handle_error")
+def _discard_query_timer(exception_context):
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("query_started"):
+        elapsed = time.perf_counter() - conn.info["query_started"].pop()
+        record_query(elapsed)
+        observe_query(current_db_operation(), elapsed)
+
+
 AsyncSessionLocal = sessionmaker(
     engine,
     class_=AsyncSession,
@@ -17,6 +52,22 @@ AsyncSessionLocal = sessionmaker(
 )
 
 
+def pool_status() -> dict:
+    """
+    Snapshot of the engine's connection pool, from the pool's public
+    methods only; counts a pool class does not offer are None.
+    """
+    pool = engine.pool
+    return {
+        "pool_class": type(pool).__name__,
+        "size": pool.size() if hasattr(pool, "size") else None,
+        "checked_in": pool.checkedin() if hasattr(pool, "checkedin") else None,
+        "checked_out": pool.checkedout() if hasattr(pool, "checkedout") else None,
+        "overflow": pool.overflow() if hasattr(pool, "overflow") else None,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+    }
+
+
 async def get_async_session() -> AsyncSession:
     async with AsyncSessionLocal() as session:
         try:
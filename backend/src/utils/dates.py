@@ -0,0 +1,28 @@
+from calendar import monthrange
+from datetime import date
+from typing import Iterator, Tuple
+
+
+Month = Tuple[int, int]
+
+# Query-string pattern for YYYY-MM month parameters
+YEAR_MONTH_PATTERN = r"^\d{4}-(0[1-9]|1[0-2])$"
+
+
+def parse_year_month(value: str) -> Month:
+    """Parse a YYYY-MM string into a (year, month) pair."""
+    year, month = value.split("-")
+    return int(year), int(month)
+
+
+def iter_months(start: Month, end: Month) -> Iterator[Month]:
+    """Yield every (year, month) from start to end inclusive."""
+    year, month = start
+    while (year, month) <= end:
+        yield year, month
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+
+
+def clamp_day(year: int, month: int, day: int) -> date:
+    """Return the given day of the month, or the month's last day if shorter."""
+    return date(year, month, min(day, monthrange(year, month)[1]))
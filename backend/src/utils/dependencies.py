@@ -1,21 +1,49 @@
-from fastapi import Depends
-from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
 
-from src.utils.database import get_async_session
-from src.domain_model.repositories.transaction_repository import TransactionRepository
+from fastapi import Header, HTTPException, Request, status
+
+from src.utils.database import AsyncSessionLocal, get_async_session
 from src.services.transaction_service import TransactionService
+from src.services.recurring_service import RecurringService
+from src.settings.config import settings
+
+
+# Every dependency here is `async def`: FastAPI runs plain `def` dependencies
+# in the threadpool, which costs a thread hop per dependency per request.
+
+async def get_transaction_service(request: Request) -> TransactionService:
+    # ServiceRegistry built once by the app lifespan
+    return request.app.state.services.transaction_service
+
+
+async def get_recurring_service(request: Request) -> RecurringService:
+    return request.app.state.services.recurring_service
+
+
+async def get_current_user_id(
+    user_id: Optional[int] = Header(None, alias=settings.USER_ID_HEADER, gt=0)
+) -> int:
+    """Id of the user the request acts for; every query is scoped to it."""
+    if user_id is not None:
+        return user_id
+    if settings.DEFAULT_USER_ID is not None:
+        return settings.DEFAULT_USER_ID
+    raise HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail=f"Missing {settings.USER_ID_HEADER} header",
+    )
 
 
-def get_transaction_repository():
-    return TransactionRepository()
+async def require_admin_endpoints() -> None:
+    """Hide the admin endpoints unless ADMIN_ENDPOINTS_ENABLED is set."""
+    if not settings.ADMIN_ENDPOINTS_ENABLED:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
 
 
-def get_transaction_service(
-    repo: TransactionRepository = Depends(get_transaction_repository)
-):
-    return TransactionService(repo)
+# The session generator is the dependency itself rather than wrapped in a
+# second async generator.
+get_db_session = get_async_session
 
 
-async def get_db_session():
-    async for session in get_async_session():
-        yield session
+async def get_session_factory():
+    return AsyncSessionLocal
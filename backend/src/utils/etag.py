@@ -0,0 +1,45 @@
+from typing import Any, Dict, Optional
+
+from fastapi import Response, status
+
+from src.settings.config import settings
+
+
+def version_etag(version: int, user_id: int, *variant: Any) -> str:
+    """
+    Weak ETag for a user's representation built from data at `version`.
+
+    Versions are counted per user, so the user id is part of the tag;
+    otherwise two users at the same version would share ETags. `variant`
+    carries anything else the body depends on besides the URL, such as the
+    current day for projections.
+    """
+    tag = "-".join(str(part) for part in (user_id, version, *variant))
+    return f'W/"{tag}"'
+
+
+def etag_headers(etag: str) -> Dict[str, str]:
+    """Headers for an ETagged response; the body also varies by user header."""
+    return {"ETag": etag, "Vary": settings.USER_ID_HEADER}
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Whether an If-None-Match header matches the ETag, using the weak
+    comparison RFC 9110 requires for GET/HEAD.
+    """
+    if not if_none_match:
+        return False
+
+    if if_none_match.strip() == "*":
+        return True
+
+    opaque = etag.removeprefix("W/")
+    for candidate in if_none_match.split(","):
+        if candidate.strip().removeprefix("W/") == opaque:
+            return True
+    return False
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=etag_headers(etag))
@@ -0,0 +1,85 @@
+import csv
+import io
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any, List, Sequence
+
+import orjson
+
+EXPORT_FORMAT_CSV = "csv"
+EXPORT_FORMAT_NDJSON = "ndjson"
+EXPORT_FORMAT_COLUMNAR = "columnar"
+
+EXPORT_MEDIA_TYPES = {
+    EXPORT_FORMAT_CSV: "text/csv",
+    EXPORT_FORMAT_NDJSON: "application/x-ndjson",
+    EXPORT_FORMAT_COLUMNAR: "application/x-ndjson",
+}
+
+EXPORT_FILE_EXTENSIONS = {
+    EXPORT_FORMAT_CSV: "csv",
+    EXPORT_FORMAT_NDJSON: "ndjson",
+    EXPORT_FORMAT_COLUMNAR: "columns.ndjson",
+}
+
+
+def _to_wire(value: Any) -> Any:
+    """Convert a column value to the same representation the JSON API uses."""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, (date, datetime)):
+        # Formatted by orjson like FastJSONResponse, so UTC ends in "Z".
+        return orjson.dumps(value, option=orjson.OPT_UTC_Z)[1:-1].decode()
+    return value
+
+
+class ExportEncoder:
+    """
+    Turns chunks of row tuples into bytes for one export format.
+
+    csv:      header line, then one line per row
+    ndjson:   one JSON object per row
+    columnar: one JSON object per chunk mapping each column to a list of
+              values, which keeps a column's values together like a
+              Parquet row group while needing no extra dependency
+    """
+
+    def __init__(self, export_format: str, columns: Sequence[str]):
+        self.export_format = export_format
+        self.columns = list(columns)
+
+    def header(self) -> bytes:
+        if self.export_format == EXPORT_FORMAT_CSV:
+            return self._csv_lines([self.columns])
+        return b""
+
+    def encode(self, rows: List[Sequence[Any]]) -> bytes:
+        if self.export_format == EXPORT_FORMAT_CSV:
+            return self._csv_lines(
+                [[_to_wire(value) for value in row] for row in rows]
+            )
+
+        if self.export_format == EXPORT_FORMAT_NDJSON:
+            return "".join(
+                json.dumps(
+                    {column: _to_wire(value) for column, value in zip(self.columns, row)},
+                    separators=(",", ":"),
+                ) + "\n"
+                for row in rows
+            ).encode("utf-8")
+
+        columns = {
+            column: [_to_wire(row[index]) for row in rows]
+            for index, column in enumerate(self.columns)
+        }
+        return (json.dumps(columns, separators=(",", ":")) + "\n").encode("utf-8")
+
+    @staticmethod
+    def _csv_lines(rows: List[Sequence[Any]]) -> bytes:
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(rows)
+        return buffer.getvalue().encode("utf-8")
@@ -0,0 +1,116 @@
+"""
+Prometheus metrics.
+
+With several workers, set PROMETHEUS_MULTIPROC_DIR to an empty directory
+shared by them (wipe it on every deploy). prometheus_client then keeps
+values in per-process files and /metrics aggregates all of them. Without
+it, each process reports only its own values.
+"""
+import os
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from prometheus_client import REGISTRY
+
+
+MULTIPROCESS_DIR = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+http_request_duration_seconds = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template and status.",
+    ["method", "route", "status"],
+    buckets=LATENCY_BUCKETS,
+)
+
+db_queries_total = Counter(
+    "db_queries_total",
+    "SQL statements executed, by repository method.",
+    ["operation"],
+)
+db_query_duration_seconds = Histogram(
+    "db_query_duration_seconds",
+    "SQL statement latency by repository method.",
+    ["operation"],
+    buckets=LATENCY_BUCKETS,
+)
+
+# Gauges are summed over live workers in multiprocess mode.
+db_pool_connections = Gauge(
+    "db_pool_connections",
+    "Connections in the engine pool by state.",
+    ["state"],
+    multiprocess_mode="livesum",
+)
+
+summary_cache_lookups_total = Counter(
+    "summary_cache_lookups_total",
+    "Summary cache lookups by result; hit ratio is hit / (hit + miss).",
+    ["result"],
+)
+summary_cache_invalidations_total = Counter(
+    "summary_cache_invalidations_total",
+    "Month generations bumped by writes.",
+)
+summary_cache_errors_total = Counter(
+    "summary_cache_errors_total",
+    "Cache backend failures treated as misses.",
+)
+
+bulk_import_rows_total = Counter(
+    "bulk_import_rows_total",
+    "Rows processed by bulk imports, by result.",
+    ["result"],
+)
+bulk_import_duration_seconds = Histogram(
+    "bulk_import_duration_seconds",
+    "Wall time of whole bulk imports.",
+    buckets=(0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0),
+)
+
+batch_operations_total = Counter(
+    "batch_operations_total",
+    "Operations submitted to the batch write endpoint, by kind and result.",
+    ["op", "result"],
+)
+
+
+def observe_request(method: str, route: str, status: int, seconds: float) -> None:
+    http_request_duration_seconds.labels(method, route, str(status)).observe(seconds)
+
+
+def observe_query(operation: str, seconds: float) -> None:
+    db_queries_total.labels(operation).inc()
+    db_query_duration_seconds.labels(operation).observe(seconds)
+
+
+def set_pool_gauges(status: dict) -> None:
+    for state in ("size", "checked_in", "checked_out", "overflow"):
+        value = status.get(state)
+        if value is not None:
+            db_pool_connections.labels(state).set(value)
+
+
+def render_metrics():
+    """Return (body, content type) for the exposition endpoint."""
+    if MULTIPROCESS_DIR:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+def mark_process_dead() -> None:
+    """Drop this worker's live gauges from the shared directory on shutdown."""
+    if MULTIPROCESS_DIR:
+        multiprocess.mark_process_dead(os.getpid())
@@ -0,0 +1,40 @@
+import base64
+import binascii
+import json
+from datetime import date
+from typing import Optional, Tuple
+
+from src.utils.exceptions import ServiceException
+
+
+CURSOR_NEXT = "next"
+CURSOR_PREV = "prev"
+
+
+def encode_cursor(transaction_date: date, txn_id: int, direction: str) -> str:
+    """Encode a keyset position into an opaque, URL-safe token."""
+    payload = {"d": transaction_date.isoformat(), "i": txn_id, "dir": direction}
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str) -> Tuple[date, int, str]:
+    """
+    Decode a token produced by encode_cursor.
+    Raises a 400 ServiceException when the token is malformed.
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        direction = payload["dir"]
+        if direction not in (CURSOR_NEXT, CURSOR_PREV):
+            raise ValueError(direction)
+        return date.fromisoformat(payload["d"]), int(payload["i"]), direction
+    except (binascii.Error, ValueError, KeyError, TypeError, UnicodeError):
+        raise ServiceException("Invalid pagination cursor", 400)
+
+
+def cursor_from_row(row, direction: str) -> Optional[str]:
+    if row is None:
+        return None
+    return encode_cursor(row.transaction_date, row.id, direction)
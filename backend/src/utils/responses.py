@@ -0,0 +1,43 @@
+import time
+from decimal import Decimal
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+from src.utils.timing import record_serialization
+
+
+def _encode_default(value: Any) -> Any:
+    # Pydantic emits Decimal as its string form; keep the same wire format.
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def encode_json(content: Any) -> bytes:
+    """
+    Encode trusted content with orjson.
+
+    Output matches what the pydantic response models produce: Decimals as
+    strings, enums by value and UTC datetimes with a trailing "Z".
+    """
+    return orjson.dumps(content, default=_encode_default, option=orjson.OPT_UTC_Z)
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response for content that is already trusted.
+
+    Returning it from a route bypasses response_model validation, so only
+    use it with payloads shaped exactly like the declared model. Bytes are
+    sent as-is, which allows pre-encoded bodies.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        started = time.perf_counter()
+        body = encode_json(content)
+        record_serialization(time.perf_counter() - started)
+        return body
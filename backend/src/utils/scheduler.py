@@ -0,0 +1,148 @@
+import asyncio
+import hashlib
+import logging
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+logger = logging.getLogger(__name__)
+
+JobFunc = Callable[[AsyncSession], Awaitable[None]]
+
+
+def advisory_lock_key(name: str) -> int:
+    """Stable signed 64-bit key for pg advisory locks, derived from a job name."""
+    digest = hashlib.blake2b(name.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
+
+
+@dataclass
+class Job:
+    """A periodic job run on its own session and transaction."""
+
+    name: str
+    func: JobFunc
+    interval_seconds: float
+    jitter_seconds: float = 0.0
+    max_concurrency: int = 1
+    # Exclusive jobs run on one worker per tick; the rest run on every worker.
+    exclusive: bool = True
+    runs: int = 0
+    failures: int = 0
+    skipped_busy: int = 0
+    skipped_locked: int = 0
+    last_duration_seconds: Optional[float] = None
+    last_error: Optional[str] = None
+    _semaphore: asyncio.Semaphore = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+    def next_delay(self) -> float:
+        return self.interval_seconds + random.uniform(0, self.jitter_seconds)
+
+    def stats(self) -> dict:
+        return {
+            "name": self.name,
+            "interval_seconds": self.interval_seconds,
+            "exclusive": self.exclusive,
+            "runs": self.runs,
+            "failures": self.failures,
+            "skipped_busy": self.skipped_busy,
+            "skipped_locked": self.skipped_locked,
+            "last_duration_seconds": self.last_duration_seconds,
+            "last_error": self.last_error,
+        }
+
+
+class Scheduler:
+    """
+    Runs periodic jobs on the event loop, off the request path.
+
+    Each tick is delayed by a random jitter so workers started together do
+    not fire in lockstep. A job never runs more than `max_concurrency` times
+    at once in this process, and every run of an exclusive job first takes a
+    transaction-scoped Postgres advisory lock so only one worker executes it
+    at a time; the others skip that tick. Non-exclusive jobs, such as those
+    filling per-process state, run on every worker.
+    """
+
+    def __init__(self, session_factory: Callable[[], AsyncSession]):
+        self.session_factory = session_factory
+        self.jobs: Dict[str, Job] = {}
+        self._tasks: List[asyncio.Task] = []
+        self._running: set = set()
+
+    def add_job(
+        self,
+        name: str,
+        func: JobFunc,
+        interval_seconds: float,
+        jitter_seconds: float = 0.0,
+        max_concurrency: int = 1,
+        exclusive: bool = True
+    ) -> Job:
+        job = Job(name, func, interval_seconds, jitter_seconds, max_concurrency, exclusive)
+        self.jobs[name] = job
+        return job
+
+    async def start(self) -> None:
+        for job in self.jobs.values():
+            self._tasks.append(asyncio.create_task(self._loop(job), name=f"scheduler:{job.name}"))
+
+    async def stop(self) -> None:
+        tasks = self._tasks + list(self._running)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks.clear()
+        self._running.clear()
+
+    async def _loop(self, job: Job) -> None:
+        # First run happens after the jitter alone, not a full interval.
+        await asyncio.sleep(random.uniform(0, job.jitter_seconds))
+        while True:
+            if job._semaphore.locked():
+                job.skipped_busy += 1
+            else:
+                task = asyncio.create_task(self.run_job(job))
+                self._running.add(task)
+                task.add_done_callback(self._running.discard)
+            await asyncio.sleep(job.next_delay())
+
+    async def run_job(self, job: Job) -> bool:
+        """Run one job now. Returns False if another worker held its lock."""
+        async with job._semaphore:
+            started = time.perf_counter()
+            try:
+                async with self.session_factory() as session:
+                    async with session.begin():
+                        if job.exclusive:
+                            locked = await session.scalar(
+                                select(func.pg_try_advisory_xact_lock(advisory_lock_key(job.name)))
+                            )
+                            if not locked:
+                                job.skipped_locked += 1
+                                return False
+                        await job.func(session)
+
+                job.runs += 1
+                job.last_error = None
+                return True
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                job.failures += 1
+                job.last_error = str(exc)
+                logger.exception("Scheduled job %s failed", job.name)
+                return False
+            finally:
+                job.last_duration_seconds = time.perf_counter() - started
+
+    def stats(self) -> list:
+        return [job.stats() for job in self.jobs.values()]
@@ -0,0 +1,288 @@
+import bisect
+import inspect
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import wraps
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from fastapi.routing import APIRoute
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.utils.metrics import observe_request
+
+
+# Upper bounds in milliseconds; the last bucket is open-ended.
+DEFAULT_BUCKETS_MS = (1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+@dataclass
+class RequestTimings:
+    """Timings collected while one request is handled."""
+
+    started: float = field(default_factory=time.perf_counter)
+    db_seconds: float = 0.0
+    query_count: int = 0
+    serialization_seconds: float = 0.0
+    endpoint_finished: Optional[float] = None
+
+    def total_seconds(self) -> float:
+        return time.perf_counter() - self.started
+
+
+_current: ContextVar[Optional[RequestTimings]] = ContextVar("request_timings", default=None)
+
+# "<Repository>.<method>" currently issuing SQL, for per-method query metrics
+_db_operation: ContextVar[str] = ContextVar("db_operation", default="other")
+
+
+def current_timings() -> Optional[RequestTimings]:
+    return _current.get()
+
+
+def record_query(seconds: float) -> None:
+    """Called from engine hooks. The ContextVar is shared into SQLAlchemy's greenlets."""
+    timings = _current.get()
+    if timings is not None:
+        timings.db_seconds += seconds
+        timings.query_count += 1
+
+
+def record_serialization(seconds: float) -> None:
+    timings = _current.get()
+    if timings is not None:
+        timings.serialization_seconds += seconds
+
+
+def current_db_operation() -> str:
+    return _db_operation.get()
+
+
+def _label_coroutine(fn):
+    @wraps(fn)
+    async def labelled(self, *args, **kwargs):
+        token = _db_operation.set(f"{type(self).__name__}.{fn.__name__}")
+        try:
+            return await fn(self, *args, **kwargs)
+        finally:
+            _db_operation.reset(token)
+
+    return labelled
+
+
+def _label_async_generator(fn):
+    @wraps(fn)
+    async def labelled(self, *args, **kwargs):
+        label = f"{type(self).__name__}.{fn.__name__}"
+        generator = fn(self, *args, **kwargs)
+        try:
+            while True:
+                # Only label while the generator runs, not while the caller
+                # handles a yielded item.
+                token = _db_operation.set(label)
+                try:
+                    item = await generator.__anext__()
+                except StopAsyncIteration:
+                    return
+                finally:
+                    _db_operation.reset(token)
+                yield item
+        finally:
+            await generator.aclose()
+
+    return labelled
+
+
+def label_db_operations(cls) -> None:
+    """Make the public async methods defined on `cls` label the SQL they issue."""
+    for name, value in list(vars(cls).items()):
+        if name.startswith("_"):
+            continue
+        if inspect.iscoroutinefunction(value):
+            setattr(cls, name, _label_coroutine(value))
+        elif inspect.isasyncgenfunction(value):
+            setattr(cls, name, _label_async_generator(value))
+
+
+class Histogram:
+    """Fixed-bucket histogram; percentiles are interpolated within buckets."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS_MS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def percentile(self, q: float) -> float:
+        if not self.count:
+            return 0.0
+        rank = self.count * q / 100
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            if bucket_count and seen + bucket_count >= rank:
+                lower = self.buckets[index - 1] if index else 0.0
+                upper = self.buckets[index] if index < len(self.buckets) else self.max
+                upper = min(upper, self.max)
+                return lower + (upper - lower) * (rank - seen) / bucket_count
+            seen += bucket_count
+        return self.max
+
+    def snapshot(self) -> dict:
+        return {
+            "count": self.count,
+            "mean": self.sum / self.count if self.count else 0.0,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "max": self.max,
+        }
+
+
+class TimingRegistry:
+    """Per-route histograms of total, DB and serialization time in milliseconds."""
+
+    def __init__(self):
+        self._routes: Dict[Tuple[str, str], Dict[str, Histogram]] = {}
+
+    def observe(self, method: str, route: str, timings: RequestTimings, total_seconds: float) -> None:
+        histograms = self._routes.get((method, route))
+        if histograms is None:
+            histograms = {
+                "total_ms": Histogram(),
+                "db_ms": Histogram(),
+                "serialization_ms": Histogram(),
+                "queries": Histogram((0, 1, 2, 3, 5, 10, 20, 50, 100)),
+            }
+            self._routes[(method, route)] = histograms
+
+        histograms["total_ms"].observe(total_seconds * 1000)
+        histograms["db_ms"].observe(timings.db_seconds * 1000)
+        histograms["serialization_ms"].observe(timings.serialization_seconds * 1000)
+        histograms["queries"].observe(timings.query_count)
+
+    def stats(self) -> List[dict]:
+        return [
+            {
+                "method": method,
+                "route": route,
+                **{name: histogram.snapshot() for name, histogram in histograms.items()},
+            }
+            for (method, route), histograms in sorted(self._routes.items(), key=lambda item: item[0][1])
+        ]
+
+    def reset(self) -> None:
+        self._routes.clear()
+
+
+timing_registry = TimingRegistry()
+
+
+def server_timing_header(timings: RequestTimings, total_seconds: float) -> str:
+    app_seconds = max(0.0, total_seconds - timings.db_seconds - timings.serialization_seconds)
+    return ", ".join((
+        f'db;dur={timings.db_seconds * 1000:.2f};desc="{timings.query_count} queries"',
+        f"ser;dur={timings.serialization_seconds * 1000:.2f}",
+        f"app;dur={app_seconds * 1000:.2f}",
+        f"total;dur={total_seconds * 1000:.2f}",
+    ))
+
+
+class TimingMiddleware:
+    """
+    Times each HTTP request, adds a Server-Timing header and feeds
+    timing_registry and the Prometheus request histogram, keyed by route
+    template rather than raw path.
+
+    Written as plain ASGI middleware so the ContextVar set here is the
+    one the endpoint and the engine hooks see. The header carries time up
+    to the first response byte; streamed bodies are not included.
+    """
+
+    def __init__(self, app: ASGIApp, registry: TimingRegistry = timing_registry, emit_header: bool = True):
+        self.app = app
+        self.registry = registry
+        self.emit_header = emit_header
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings = RequestTimings()
+        token = _current.set(timings)
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if self.emit_header:
+                    headers = MutableHeaders(scope=message)
+                    headers.append(
+                        "Server-Timing", server_timing_header(timings, timings.total_seconds())
+                    )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current.reset(token)
+            total = timings.total_seconds()
+            route = scope.get("route")
+            # Unmatched paths share one label to keep metric cardinality bounded.
+            template = getattr(route, "path", None) or "unmatched"
+            if route is not None:
+                self.registry.observe(scope["method"], template, timings, total)
+            observe_request(scope["method"], template, status_code, total)
+
+
+def _mark_endpoint_finished(endpoint):
+    if getattr(endpoint, "_marks_endpoint_finished", False):
+        # include_router re-creates routes from already wrapped endpoints.
+        return endpoint
+
+    @wraps(endpoint)
+    async def timed_endpoint(*args, **kwargs):
+        try:
+            return await endpoint(*args, **kwargs)
+        finally:
+            timings = _current.get()
+            if timings is not None:
+                timings.endpoint_finished = time.perf_counter()
+
+    timed_endpoint._marks_endpoint_finished = True
+    return timed_endpoint
+
+
+class TimedRoute(APIRoute):
+    """
+    APIRoute that attributes response-model validation and JSON rendering,
+    which FastAPI runs after the endpoint returns, to serialization time.
+    Only coroutine endpoints are wrapped; sync ones run in a threadpool.
+    """
+
+    def __init__(self, path: str, endpoint, **kwargs):
+        if inspect.iscoroutinefunction(endpoint):
+            endpoint = _mark_endpoint_finished(endpoint)
+        super().__init__(path, endpoint, **kwargs)
+
+    def get_route_handler(self):
+        handler = super().get_route_handler()
+
+        async def timed_handler(request):
+            response = await handler(request)
+            timings = _current.get()
+            if timings is not None and timings.endpoint_finished is not None:
+                record_serialization(time.perf_counter() - timings.endpoint_finished)
+            return response
+
+        return timed_handler
+
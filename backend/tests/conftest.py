@@ -0,0 +1,46 @@
+"""
+Shared fixtures: the app wired to in-memory repositories, and clients that
+send requests through it in process.
+"""
+import httpx
+import pytest
+
+from src.app import app
+from src.services.service_registry import ServiceRegistry
+from src.settings.config import settings
+
+from benchmarks.inmemory import (
+    InMemoryDailyRollupRepository,
+    InMemoryDataVersionRepository,
+    InMemoryRecurringTemplateRepository,
+    InMemoryTransactionRepository,
+)
+
+
+@pytest.fixture
+def services():
+    """What the lifespan builds, backed by in-memory repositories."""
+    previous = getattr(app.state, "services", None)
+    app.state.services = ServiceRegistry(
+        None,
+        transaction_repository=InMemoryTransactionRepository(),
+        rollup_repository=InMemoryDailyRollupRepository(),
+        recurring_template_repository=InMemoryRecurringTemplateRepository(),
+        version_repository=InMemoryDataVersionRepository(),
+    )
+    yield app.state.services
+    app.state.services = previous
+
+
+@pytest.fixture
+def api_client(services):
+    """Factory for clients acting as one user; use as an async context manager."""
+
+    def make(user_id: int = 1) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app),
+            base_url="http://test",
+            headers={settings.USER_ID_HEADER: str(user_id)},
+        )
+
+    return make
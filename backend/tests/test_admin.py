@@ -0,0 +1,34 @@
+import asyncio
+
+import pytest
+
+from src.app import app
+from src.services.maintenance_jobs import build_scheduler
+from src.settings.config import settings
+
+ADMIN_PATHS = ("/api/v1/admin/cache", "/api/v1/admin/pool",
+               "/api/v1/admin/scheduler", "/api/v1/admin/timings")
+
+
+@pytest.mark.parametrize("path", ADMIN_PATHS)
+def test_admin_endpoints_are_disabled_by_default(api_client, path):
+    async def scenario():
+        async with api_client() as client:
+            response = await client.get(path)
+        assert response.status_code == 404
+
+    asyncio.run(scenario())
+
+
+def test_scheduler_stats_report_exclusive_jobs(api_client, services, monkeypatch):
+    monkeypatch.setattr(settings, "ADMIN_ENDPOINTS_ENABLED", True)
+    monkeypatch.setattr(app.state, "scheduler", build_scheduler(None, services), raising=False)
+
+    async def scenario():
+        async with api_client() as client:
+            response = await client.get("/api/v1/admin/scheduler")
+        assert response.status_code == 200
+        jobs = {job["name"]: job for job in response.json()["data"]}
+        assert jobs["materialize_recurring"]["exclusive"] is True
+
+    asyncio.run(scenario())
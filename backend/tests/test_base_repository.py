@@ -0,0 +1,93 @@
+"""
+BaseRepository.bulk_create returns RETURNING rows in input order.
+
+The database test needs a migrated Postgres at TEST_DATABASE_URL and rolls
+back what it inserts.
+"""
+import asyncio
+import os
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from src.domain_model.models.transaction import Transaction
+from src.domain_model.repositories.transaction_repository import TransactionRepository
+from src.utils.constants import TransactionCategory, TransactionType
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+
+requires_database = pytest.mark.skipif(
+    not TEST_DATABASE_URL, reason="TEST_DATABASE_URL is not set"
+)
+
+
+def build_rows(count: int):
+    # Dates out of order, so neither id nor date order matches the input.
+    return [
+        {
+            "user_id": 1,
+            "amount": Decimal(index + 1),
+            "type": TransactionType.EXPENSE,
+            "category": TransactionCategory.FOOD,
+            "description": f"row {index}",
+            "transaction_date": date(2026, 1 + index % 12, 1 + (index * 7) % 28),
+            "is_recurring_generated": False,
+        }
+        for index in range(count)
+    ]
+
+
+class _Result:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def all(self):
+        return self.rows
+
+
+class RecordingSession:
+    def __init__(self):
+        self.statements = []
+
+    async def execute(self, statement, params=None):
+        self.statements.append(statement)
+        return _Result([(row["description"],) for row in params])
+
+
+def test_bulk_create_returns_rows_sorted_by_parameter_order():
+    session = RecordingSession()
+    rows = build_rows(25)
+
+    returned = asyncio.run(TransactionRepository().bulk_create(
+        session, rows, returning=[Transaction.description], chunk_size=10
+    ))
+
+    assert [row[0] for row in returned] == [row["description"] for row in rows]
+    assert len(session.statements) == 3
+    assert all(statement._sort_by_parameter_order for statement in session.statements)
+
+
+@requires_database
+def test_bulk_create_keeps_input_order_in_postgres():
+    async def run():
+        engine = create_async_engine(TEST_DATABASE_URL)
+        try:
+            async with AsyncSession(engine) as session:
+                try:
+                    rows = build_rows(250)
+                    returned = await TransactionRepository().bulk_create(
+                        session, rows,
+                        returning=[Transaction.id, Transaction.description],
+                        chunk_size=100,
+                    )
+                    assert [row.description for row in returned] == [
+                        row["description"] for row in rows
+                    ]
+                finally:
+                    await session.rollback()
+        finally:
+            await engine.dispose()
+
+    asyncio.run(run())
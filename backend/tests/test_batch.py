@@ -0,0 +1,49 @@
+"""
+POST /transactions/batch: request limits and all-or-nothing application.
+"""
+import asyncio
+
+from src.settings.config import settings
+
+BATCH_PATH = "/api/v1/transactions/batch"
+
+LUNCH = {
+    "amount": "12.50",
+    "type": "expense",
+    "category": "food",
+    "description": "lunch",
+    "transaction_date": "2026-05-04",
+}
+
+
+def test_oversized_batch_is_rejected_before_the_service(api_client):
+    async def scenario():
+        operations = [{"op": "delete", "id": 1}] * (settings.BATCH_MAX_OPERATIONS + 1)
+        async with api_client() as client:
+            response = await client.post(BATCH_PATH, json={"operations": operations})
+        assert response.status_code == 422
+
+    asyncio.run(scenario())
+
+
+def test_failed_operation_applies_nothing(api_client, services):
+    async def scenario():
+        async with api_client() as client:
+            created = await client.post("/api/v1/transactions/", json=LUNCH)
+            existing = created.json()["data"]["id"]
+
+            response = await client.post(BATCH_PATH, json={"operations": [
+                {"op": "create", "data": LUNCH},
+                {"op": "update", "id": existing + 100, "data": {"amount": "1.00"}},
+                {"op": "delete", "id": existing},
+            ]})
+
+        assert response.status_code == 404
+        body = response.json()["data"]
+        assert body["applied"] is False
+        assert [result["status_code"] for result in body["results"]] == [424, 404, 424]
+        assert (body["created"], body["updated"], body["deleted"]) == (0, 0, 0)
+
+        assert list(services.transaction_repository._rows) == [existing]
+
+    asyncio.run(scenario())
@@ -0,0 +1,56 @@
+"""
+TransactionService.bulk_import against the in-memory repositories.
+"""
+import asyncio
+import io
+from datetime import date
+from decimal import Decimal
+
+from src.services.transaction_service import TransactionService
+from src.utils.bulk_import import IMPORT_FORMAT_CSV
+
+from benchmarks.inmemory import (
+    InMemoryDailyRollupRepository,
+    InMemoryDataVersionRepository,
+    InMemoryTransactionRepository,
+    NullSession,
+)
+
+USER_ID = 1
+DAY = date(2026, 5, 4)
+
+
+def test_amounts_that_do_not_fit_the_column_are_rejected_per_row():
+    csv = (
+        "amount,type,category,description,transaction_date\n"
+        f"0.005,expense,food,coffee,{DAY}\n"
+        f"0.005,expense,food,coffee,{DAY}\n"
+        f"99999999.995,expense,food,too big,{DAY}\n"
+        f"12.50,expense,food,lunch,{DAY}\n"
+        f"99999999.99,income,salary,largest,{DAY}\n"
+    )
+
+    async def scenario():
+        transactions = InMemoryTransactionRepository()
+        rollups = InMemoryDailyRollupRepository()
+        service = TransactionService(
+            transactions, rollups, None, InMemoryDataVersionRepository()
+        )
+
+        result = await service.bulk_import(
+            NullSession(), USER_ID, io.BytesIO(csv.encode()), IMPORT_FORMAT_CSV,
+            chunk_size=100, max_errors=10,
+        )
+
+        assert (result.inserted, result.failed) == (2, 3)
+        assert [error.row for error in result.errors] == [1, 2, 3]
+        assert "2 decimal places" in result.errors[0].message
+        assert "10 digits" in result.errors[2].message
+
+        # The rollup agrees with the stored rows to the cent.
+        ledger = await transactions.sum_income_expense(NullSession(), USER_ID, DAY, DAY)
+        summary = await rollups.sum_income_expense(NullSession(), USER_ID, DAY, DAY)
+        assert ledger == summary
+        assert summary.total_expense == Decimal("12.50")
+
+    asyncio.run(scenario())
@@ -0,0 +1,59 @@
+"""
+Keyset (cursor) pagination of GET /transactions, in both directions.
+"""
+import asyncio
+from datetime import date
+from decimal import Decimal
+
+from src.domain_model.models.transaction import Transaction
+from src.utils.constants import TransactionCategory, TransactionType
+
+LIST_PATH = "/api/v1/transactions/"
+USER_ID = 1
+
+# Several rows share a date, so the id breaks ties.
+DATES = [date(2026, 5, day) for day in (1, 2, 2, 2, 3, 4, 4)]
+
+
+def seed(services):
+    repo = services.transaction_repository
+    for day in DATES:
+        repo._store(Transaction(
+            user_id=USER_ID,
+            amount=Decimal("10.00"),
+            type=TransactionType.EXPENSE,
+            category=TransactionCategory.FOOD,
+            transaction_date=day,
+        ))
+    newest_first = sorted(repo._rows.values(), key=lambda obj: (obj.transaction_date, obj.id))
+    return [obj.id for obj in reversed(newest_first)]
+
+
+def test_cursor_pages_walk_forward_and_back(api_client, services):
+    expected = seed(services)
+
+    async def page(client, cursor=None):
+        params = {"pagination": "cursor", "max_per_page": 3}
+        if cursor:
+            params["cursor"] = cursor
+        response = await client.get(LIST_PATH, params=params)
+        assert response.status_code == 200, response.text
+        return response.json()["data"]
+
+    async def scenario():
+        async with api_client(USER_ID) as client:
+            forward = [await page(client)]
+            assert forward[0]["prev_cursor"] is None
+            while forward[-1]["next_cursor"]:
+                forward.append(await page(client, forward[-1]["next_cursor"]))
+
+            backward = [forward[-1]]
+            while backward[-1]["prev_cursor"]:
+                backward.append(await page(client, backward[-1]["prev_cursor"]))
+
+        ids = [[row["id"] for row in data["data"]] for data in forward]
+        assert ids == [expected[0:3], expected[3:6], expected[6:]]
+        assert [[row["id"] for row in data["data"]] for data in reversed(backward)] == ids
+        assert all(data["total"] == len(DATES) for data in forward)
+
+    asyncio.run(scenario())
@@ -0,0 +1,73 @@
+import asyncio
+
+from src.settings.config import settings
+from src.utils.etag import etag_matches, not_modified, version_etag
+
+
+def test_users_at_the_same_version_get_different_etags():
+    first = version_etag(0, 1)
+    second = version_etag(0, 2)
+
+    assert first != second
+    assert not etag_matches(first, second)
+    assert etag_matches(f'"x", {first}', version_etag(0, 1))
+
+
+def test_variant_is_part_of_the_etag():
+    assert version_etag(3, 1, "2026-06-15") != version_etag(3, 1, "2026-06-16")
+
+
+def test_not_modified_varies_by_user_header():
+    response = not_modified(version_etag(0, 1))
+
+    assert response.status_code == 304
+    assert response.headers["ETag"] == version_etag(0, 1)
+    assert response.headers["Vary"] == settings.USER_ID_HEADER
+
+
+SUMMARY_PATH = "/api/v1/transactions/summary/monthly"
+SUMMARY_PARAMS = {"year": 2026, "month": 5}
+
+LUNCH = {
+    "amount": "12.50",
+    "type": "expense",
+    "category": "food",
+    "transaction_date": "2026-05-04",
+}
+
+
+def test_conditional_get_until_the_users_own_write(api_client):
+    async def scenario():
+        async with api_client(1) as first, api_client(2) as second:
+            response = await first.get(SUMMARY_PATH, params=SUMMARY_PARAMS)
+            assert response.status_code == 200
+            etag = response.headers["ETag"]
+            assert response.headers["Vary"] == settings.USER_ID_HEADER
+
+            revalidated = await first.get(
+                SUMMARY_PATH, params=SUMMARY_PARAMS, headers={"If-None-Match": etag}
+            )
+            assert revalidated.status_code == 304
+            assert revalidated.content == b""
+
+            # Another user's tag never matches, and their writes bump only
+            # their own version.
+            other = await second.get(
+                SUMMARY_PATH, params=SUMMARY_PARAMS, headers={"If-None-Match": etag}
+            )
+            assert other.status_code == 200
+            assert (await second.post("/api/v1/transactions/", json=LUNCH)).status_code == 201
+            still_fresh = await first.get(
+                SUMMARY_PATH, params=SUMMARY_PARAMS, headers={"If-None-Match": etag}
+            )
+            assert still_fresh.status_code == 304
+
+            assert (await first.post("/api/v1/transactions/", json=LUNCH)).status_code == 201
+            changed = await first.get(
+                SUMMARY_PATH, params=SUMMARY_PARAMS, headers={"If-None-Match": etag}
+            )
+            assert changed.status_code == 200
+            assert changed.headers["ETag"] != etag
+            assert changed.json()["data"]["total_expense"] == "12.50"
+
+    asyncio.run(scenario())
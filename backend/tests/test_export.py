@@ -0,0 +1,30 @@
+"""
+Exports use the same wire format as the JSON API.
+"""
+import asyncio
+import json
+
+
+def test_export_row_matches_get_by_id(api_client):
+    async def scenario():
+        async with api_client() as client:
+            created = await client.post("/api/v1/transactions/", json={
+                "amount": "12.50",
+                "type": "expense",
+                "category": "food",
+                "description": "lunch",
+                "transaction_date": "2026-05-04",
+            })
+            assert created.status_code == 201, created.text
+            txn_id = created.json()["data"]["id"]
+
+            fetched = await client.get(f"/api/v1/transactions/{txn_id}")
+            exported = await client.get("/api/v1/transactions/export", params={"format": "ndjson"})
+
+        assert exported.status_code == 200
+        (row,) = [json.loads(line) for line in exported.text.splitlines()]
+        expected = fetched.json()["data"]
+        assert row == {key: expected[key] for key in row}
+        assert row["created_at"].endswith("Z")
+
+    asyncio.run(scenario())
@@ -0,0 +1,61 @@
+"""
+Every request acts for the user in X-User-Id and sees only that user's rows.
+"""
+import asyncio
+
+from src.settings.config import settings
+
+TRANSACTIONS = "/api/v1/transactions"
+
+LUNCH = {
+    "amount": "12.50",
+    "type": "expense",
+    "category": "food",
+    "description": "lunch",
+    "transaction_date": "2026-05-04",
+}
+
+
+def test_users_cannot_see_or_change_each_others_transactions(api_client, services):
+    async def scenario():
+        async with api_client(1) as owner, api_client(2) as other:
+            created = await owner.post(f"{TRANSACTIONS}/", json=LUNCH)
+            txn_id = created.json()["data"]["id"]
+            path = f"{TRANSACTIONS}/{txn_id}"
+
+            assert (await other.get(path)).status_code == 404
+            assert (await other.put(path, json={"amount": "1.00"})).status_code == 404
+            assert (await other.delete(path)).status_code == 404
+            batch = await other.post(f"{TRANSACTIONS}/batch", json={"operations": [
+                {"op": "delete", "id": txn_id},
+            ]})
+            assert batch.status_code == 404
+
+            listed = await other.get(f"{TRANSACTIONS}/")
+            assert listed.json()["data"]["data"] == []
+            exported = await other.get(f"{TRANSACTIONS}/export", params={"format": "ndjson"})
+            assert exported.text == ""
+            summary = await other.get(
+                f"{TRANSACTIONS}/summary/monthly", params={"year": 2026, "month": 5}
+            )
+            assert summary.json()["data"]["total_expense"] == "0"
+
+            fetched = await owner.get(path)
+            assert fetched.status_code == 200
+            assert fetched.json()["data"]["amount"] == "12.50"
+
+        assert [obj.user_id for obj in services.transaction_repository._rows.values()] == [1]
+
+    asyncio.run(scenario())
+
+
+def test_requests_without_a_user_are_rejected(api_client, monkeypatch):
+    monkeypatch.setattr(settings, "DEFAULT_USER_ID", None)
+
+    async def scenario():
+        async with api_client() as client:
+            client.headers.pop(settings.USER_ID_HEADER)
+            response = await client.get(f"{TRANSACTIONS}/")
+        assert response.status_code == 401
+
+    asyncio.run(scenario())
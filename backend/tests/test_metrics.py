@@ -0,0 +1,19 @@
+import asyncio
+
+from src.utils.database import pool_status
+
+
+def test_pool_status_uses_only_public_counts():
+    assert set(pool_status()) == {
+        "pool_class", "size", "checked_in", "checked_out", "overflow", "max_overflow",
+    }
+
+
+def test_scrape_samples_pool_gauges(api_client):
+    async def scenario():
+        async with api_client() as client:
+            response = await client.get("/metrics")
+        assert response.status_code == 200
+        assert 'db_pool_connections{state="checked_out"}' in response.text
+
+    asyncio.run(scenario())
@@ -0,0 +1,147 @@
+"""
+Partition pruning of month-window queries, and no partition DDL on the
+bulk insert path.
+
+The plan-parsing tests run anywhere. The database tests need a migrated
+Postgres at TEST_DATABASE_URL; they run inside a transaction that is
+rolled back, partitions created along the way included.
+"""
+import asyncio
+import os
+from datetime import date
+
+import pytest
+from sqlalchemy import Insert, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from src.domain_model.repositories.transaction_partition_repository import (
+    DEFAULT_PARTITION,
+    TransactionPartitionRepository,
+)
+from src.domain_model.repositories.transaction_repository import TransactionRepository
+from scripts.explain_queries import build_queries
+from scripts.partitions import MONTH_WINDOW_QUERIES, explain_partitions, scanned_partitions
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+
+requires_database = pytest.mark.skipif(
+    not TEST_DATABASE_URL, reason="TEST_DATABASE_URL is not set"
+)
+
+PRUNED_PLAN = {
+    "Node Type": "Aggregate",
+    "Plans": [{
+        "Node Type": "Index Only Scan",
+        "Relation Name": "transactions_p2026_10",
+        "Index Name": "transactions_p2026_10_user_id_transaction_date_idx",
+    }],
+}
+
+UNPRUNED_PLAN = {
+    "Node Type": "Aggregate",
+    "Plans": [{
+        "Node Type": "Append",
+        "Plans": [
+            {"Node Type": "Seq Scan", "Relation Name": "transactions_p2026_09"},
+            {"Node Type": "Seq Scan", "Relation Name": "transactions_p2026_10"},
+            {"Node Type": "Seq Scan", "Relation Name": DEFAULT_PARTITION},
+        ],
+    }, {
+        "Node Type": "Index Scan",
+        "Relation Name": "recurring_templates",
+    }],
+}
+
+
+def test_scanned_partitions_of_a_pruned_plan():
+    assert scanned_partitions(PRUNED_PLAN) == {"transactions_p2026_10"}
+
+
+def test_scanned_partitions_include_the_default_partition():
+    assert scanned_partitions(UNPRUNED_PLAN) == {
+        "transactions_p2026_09",
+        "transactions_p2026_10",
+        DEFAULT_PARTITION,
+    }
+
+
+class RecordingSession:
+    def __init__(self):
+        self.statements = []
+
+    async def execute(self, statement, params=None):
+        self.statements.append(statement)
+
+
+def test_bulk_insert_runs_no_partition_ddl():
+    session = RecordingSession()
+    rows = [
+        {"user_id": 1, "amount": 10, "type": "expense", "category": "food",
+         "transaction_date": date(1990, month, 1), "is_recurring_generated": False}
+        for month in (1, 2)
+    ]
+
+    assert asyncio.run(TransactionRepository().bulk_insert(session, rows)) == 2
+    assert [type(statement) for statement in session.statements] == [Insert]
+
+
+def run_in_rolled_back_transaction(scenario):
+    async def run():
+        engine = create_async_engine(TEST_DATABASE_URL)
+        try:
+            async with AsyncSession(engine) as session:
+                try:
+                    await scenario(session)
+                finally:
+                    await session.rollback()
+        finally:
+            await engine.dispose()
+
+    asyncio.run(run())
+
+
+@requires_database
+def test_month_queries_scan_only_their_partition():
+    async def scenario(session):
+        today = date.today()
+        await TransactionPartitionRepository().ensure_ahead(session, today, 0)
+
+        queries = dict(build_queries(TransactionRepository(), today))
+        for name in MONTH_WINDOW_QUERIES:
+            partitions = await explain_partitions(session, queries[name])
+            assert partitions <= {f"transactions_p{today:%Y_%m}"}, name
+
+    run_in_rolled_back_transaction(scenario)
+
+
+@requires_database
+def test_history_split_out_of_the_default_partition_is_pruned():
+    async def scenario(session):
+        month = date(1990, 1, 1)
+        partition = f"transactions_p{month:%Y_%m}"
+        await session.execute(
+            text(
+                "INSERT INTO transactions (user_id, amount, type, category, transaction_date, "
+                "is_recurring_generated, created_at, updated_at) "
+                "VALUES (1, 10, 'EXPENSE', 'FOOD', :day, false, now(), now())"
+            ),
+            {"day": date(1990, 1, 15)},
+        )
+        repo = TransactionRepository()
+
+        async def count_month(s):
+            return await repo.count_transactions(s, 1, year=month.year, month=month.month)
+
+        assert await explain_partitions(session, count_month) == {DEFAULT_PARTITION}
+
+        assert month in await TransactionPartitionRepository().split_default(session)
+
+        assert await explain_partitions(session, count_month) == {partition}
+        assert await count_month(session) == 1
+        left_behind = await session.scalar(
+            text(f"SELECT count(*) FROM {DEFAULT_PARTITION} WHERE transaction_date < :end"),
+            {"end": date(1990, 2, 1)},
+        )
+        assert left_behind == 0
+
+    run_in_rolled_back_transaction(scenario)
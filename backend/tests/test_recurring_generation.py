@@ -0,0 +1,98 @@
+"""
+RecurringService.generate against the in-memory repositories.
+"""
+import asyncio
+from datetime import date
+from decimal import Decimal
+
+from src.domain_model.dtos.recurring_dtos import RecurringTemplateCreateDto
+from src.domain_model.dtos.transaction_dtos import TransactionUpdateDto
+from src.services.recurring_service import RecurringService
+from src.services.transaction_service import TransactionService
+from src.utils.constants import TransactionCategory, TransactionType
+
+from benchmarks.inmemory import (
+    InMemoryDailyRollupRepository,
+    InMemoryDataVersionRepository,
+    InMemoryRecurringTemplateRepository,
+    InMemoryTransactionRepository,
+    NullSession,
+)
+
+USER_ID = 1
+
+
+def build_services():
+    transactions = InMemoryTransactionRepository()
+    rollups = InMemoryDailyRollupRepository()
+    versions = InMemoryDataVersionRepository()
+    templates = InMemoryRecurringTemplateRepository()
+    recurring = RecurringService(templates, transactions, rollups, None, versions)
+    service = TransactionService(transactions, rollups, None, versions)
+    return recurring, service, transactions, templates
+
+
+async def create_rent(recurring: RecurringService, session) -> int:
+    template = await recurring.create_template(session, USER_ID, RecurringTemplateCreateDto(
+        amount=Decimal("1200.00"),
+        type=TransactionType.EXPENSE,
+        category=TransactionCategory.RENT,
+        description="rent",
+        day_of_month=1,
+        start_date=date(2026, 1, 1),
+    ))
+    return template.id
+
+
+def occurrences(transactions: InMemoryTransactionRepository, template_id: int):
+    return sorted(
+        (obj.transaction_date, obj.id) for obj in transactions._rows.values()
+        if obj.recurring_template_id == template_id
+    )
+
+
+def test_deleted_and_moved_occurrences_are_not_recreated():
+    async def scenario():
+        recurring, service, transactions, templates = build_services()
+        session = NullSession()
+        template_id = await create_rent(recurring, session)
+
+        result = await recurring.generate(session, USER_ID, (2026, 1), (2026, 3), date(2026, 3, 31))
+        assert result.created == 3
+        assert templates._rows[template_id].generated_through == date(2026, 3, 1)
+
+        (_, january), (_, february), (_, march) = occurrences(transactions, template_id)
+        await service.delete_transaction(session, USER_ID, february)
+        await service.update_transaction(
+            session, USER_ID, march, TransactionUpdateDto(transaction_date=date(2026, 3, 5))
+        )
+
+        again = await recurring.generate(session, USER_ID, (2026, 1), (2026, 3), date(2026, 3, 31))
+        assert again.due == 0
+        assert again.created == 0
+        assert [when for when, _ in occurrences(transactions, template_id)] == [
+            date(2026, 1, 1), date(2026, 3, 5),
+        ]
+
+    asyncio.run(scenario())
+
+
+def test_generation_moves_forward_from_the_watermark():
+    async def scenario():
+        recurring, _, transactions, templates = build_services()
+        session = NullSession()
+        template_id = await create_rent(recurring, session)
+
+        # The April occurrence is not due yet on March 31.
+        result = await recurring.generate(session, USER_ID, (2026, 3), (2026, 4), date(2026, 3, 31))
+        assert result.created == 1
+        assert templates._rows[template_id].generated_through == date(2026, 3, 1)
+
+        result = await recurring.generate(session, USER_ID, (2026, 3), (2026, 4), date(2026, 4, 1))
+        assert (result.due, result.created) == (1, 1)
+        assert templates._rows[template_id].generated_through == date(2026, 4, 1)
+        assert [when for when, _ in occurrences(transactions, template_id)] == [
+            date(2026, 3, 1), date(2026, 4, 1),
+        ]
+
+    asyncio.run(scenario())
@@ -0,0 +1,226 @@
+"""
+RedisCacheBackend against an in-process fake server speaking RESP2.
+
+The fake implements the commands the backend sends (GET, SET with PX,
+MGET, INCR/INCRBY) and records which commands arrived in each network
+read, so the generation bump can be checked to go out as one pipelined
+write.
+"""
+import asyncio
+import time
+from typing import Dict, List, Optional, Tuple
+
+from pydantic import BaseModel
+
+from src.utils.cache import SummaryCache
+from src.utils.cache_backends import RedisCacheBackend
+
+
+class FakeRedisServer:
+
+    def __init__(self):
+        self.data: Dict[bytes, Tuple[bytes, Optional[float]]] = {}
+        self.reads: List[List[List[bytes]]] = []
+        self._server: Optional[asyncio.base_events.Server] = None
+        self._writers: List[asyncio.StreamWriter] = []
+
+    async def start(self) -> str:
+        self._server = await asyncio.start_server(self._serve, "127.0.0.1", 0)
+        port = self._server.sockets[0].getsockname()[1]
+        return f"redis://127.0.0.1:{port}/0"
+
+    async def stop(self) -> None:
+        """Close the listener and every open connection, like a server going away."""
+        self._server.close()
+        for writer in self._writers:
+            writer.close()
+        await self._server.wait_closed()
+
+    def commands(self) -> List[List[bytes]]:
+        return [command for batch in self.reads for command in batch]
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self._writers.append(writer)
+        buffer = b""
+        try:
+            while True:
+                chunk = await reader.read(65536)
+                if not chunk:
+                    return
+                buffer += chunk
+                batch = []
+                while True:
+                    parsed = self._parse(buffer)
+                    if parsed is None:
+                        break
+                    command, buffer = parsed
+                    batch.append(command)
+                if batch:
+                    self.reads.append(batch)
+                    writer.write(b"".join(self._execute(command) for command in batch))
+                    await writer.drain()
+        except (ConnectionError, asyncio.CancelledError):
+            return
+        finally:
+            writer.close()
+
+    @staticmethod
+    def _parse(buffer: bytes):
+        # *<n>\r\n followed by n bulk strings $<len>\r\n<data>\r\n
+        if not buffer.startswith(b"*") or b"\r\n" not in buffer:
+            return None
+        header, rest = buffer.split(b"\r\n", 1)
+        parts = []
+        for _ in range(int(header[1:])):
+            if b"\r\n" not in rest:
+                return None
+            length_line, rest = rest.split(b"\r\n", 1)
+            length = int(length_line[1:])
+            if len(rest) < length + 2:
+                return None
+            parts.append(rest[:length])
+            rest = rest[length + 2:]
+        return parts, rest
+
+    def _get(self, key: bytes) -> Optional[bytes]:
+        entry = self.data.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self.data[key]
+            return None
+        return value
+
+    @staticmethod
+    def _bulk(value: Optional[bytes]) -> bytes:
+        if value is None:
+            return b"$-1\r\n"
+        return b"$%d\r\n%s\r\n" % (len(value), value)
+
+    def _execute(self, command: List[bytes]) -> bytes:
+        name = command[0].upper()
+        if name == b"GET":
+            return self._bulk(self._get(command[1]))
+        if name == b"SET":
+            expires_at = None
+            options = [part.upper() for part in command[3:]]
+            if b"PX" in options:
+                expires_at = time.monotonic() + int(command[3 + options.index(b"PX") + 1]) / 1000
+            self.data[command[1]] = (command[2], expires_at)
+            return b"+OK\r\n"
+        if name == b"MGET":
+            values = [self._get(key) for key in command[1:]]
+            return b"*%d\r\n" % len(values) + b"".join(self._bulk(value) for value in values)
+        if name in (b"INCR", b"INCRBY"):
+            amount = int(command[2]) if name == b"INCRBY" else 1
+            value = int(self._get(command[1]) or 0) + amount
+            self.data[command[1]] = (str(value).encode(), None)
+            return b":%d\r\n" % value
+        if name == b"PING":
+            return b"+PONG\r\n"
+        return b"-ERR unknown command '%s'\r\n" % command[0]
+
+
+class SummaryDto(BaseModel):
+    total: int
+
+
+def run(test):
+    async def scenario():
+        server = FakeRedisServer()
+        url = await server.start()
+        backend = RedisCacheBackend(url, key_prefix="test:")
+        try:
+            await test(server, backend)
+        finally:
+            await backend.close()
+            await server.stop()
+
+    asyncio.run(scenario())
+
+
+def test_get_and_set_with_ttl():
+    async def scenario(server, backend):
+        assert await backend.get("missing") is None
+
+        await backend.set("summary", b"payload", ttl_seconds=60)
+        assert await backend.get("summary") == b"payload"
+        assert server.data[b"test:summary"][1] is not None
+
+        await backend.set("short", b"gone", ttl_seconds=0.01)
+        await asyncio.sleep(0.05)
+        assert await backend.get("short") is None
+
+    run(scenario)
+
+
+def test_generations_use_mget_and_incr():
+    async def scenario(server, backend):
+        assert await backend.get_generations([]) == []
+        assert await backend.get_generations(["1:2026-01", "1:2026-02"]) == [0, 0]
+
+        await backend.bump_generations(["1:2026-01"])
+        await backend.bump_generations(["1:2026-01"])
+        assert await backend.get_generations(["1:2026-01", "1:2026-02"]) == [2, 0]
+
+        names = [command[0].upper() for command in server.commands()]
+        assert b"MGET" in names and b"INCRBY" in names
+        assert server.data[b"test:gen:1:2026-01"] == (b"2", None)
+
+    run(scenario)
+
+
+def test_generation_bump_is_pipelined():
+    async def scenario(server, backend):
+        await backend.get_generations(["warm-up"])
+        server.reads.clear()
+
+        names = [f"1:2026-{month:02d}" for month in range(1, 7)]
+        await backend.bump_generations(names)
+
+        incr_reads = [batch for batch in server.reads if batch[0][0].upper() == b"INCRBY"]
+        assert len(incr_reads) == 1
+        assert [command[1] for command in incr_reads[0]] == [
+            f"test:gen:{name}".encode() for name in names
+        ]
+        assert await backend.get_generations(names) == [1] * len(names)
+
+    run(scenario)
+
+
+def test_summary_cache_round_trip():
+    async def scenario(server, backend):
+        cache = SummaryCache(backend, ttl_seconds=60)
+
+        key = await cache.key_for(1, ("monthly", 2026, 1), [(2026, 1)])
+        assert await cache.get(key, SummaryDto) is None
+        await cache.set(key, SummaryDto(total=5))
+        assert await cache.get(key, SummaryDto) == SummaryDto(total=5)
+
+        await cache.invalidate_months(1, [(2026, 1)])
+        fresh = await cache.key_for(1, ("monthly", 2026, 1), [(2026, 1)])
+        assert fresh != key
+        assert await cache.get(fresh, SummaryDto) is None
+        assert cache.errors == 0
+
+    run(scenario)
+
+
+def test_summary_cache_falls_back_when_connection_drops():
+    async def scenario(server, backend):
+        cache = SummaryCache(backend, ttl_seconds=60)
+        key = await cache.key_for(1, ("monthly", 2026, 1), [(2026, 1)])
+        await cache.set(key, SummaryDto(total=5))
+
+        await server.stop()
+
+        # Every operation degrades to a miss or a no-op instead of raising.
+        assert await cache.key_for(1, ("monthly", 2026, 1), [(2026, 1)]) is None
+        assert await cache.get(key, SummaryDto) is None
+        assert await cache.set(key, SummaryDto(total=6)) == SummaryDto(total=6)
+        await cache.invalidate_months(1, [(2026, 1)])
+        assert cache.errors == 4
+        assert cache.misses == 1
+
+    run(scenario)
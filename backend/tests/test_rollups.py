@@ -0,0 +1,77 @@
+"""
+Incremental daily rollup maintenance: after every write the rollups equal a
+rebuild from the ledger.
+"""
+import asyncio
+from datetime import date
+from decimal import Decimal
+
+from src.domain_model.dtos.transaction_dtos import TransactionCreateDto, TransactionUpdateDto
+from src.services.transaction_service import TransactionService
+from src.utils.constants import TransactionCategory, TransactionType
+
+from benchmarks.inmemory import (
+    InMemoryDailyRollupRepository,
+    InMemoryDataVersionRepository,
+    InMemoryTransactionRepository,
+    NullSession,
+)
+
+USER_ID = 1
+MAY_4 = date(2026, 5, 4)
+MAY_9 = date(2026, 5, 9)
+
+
+def live(rollups: InMemoryDailyRollupRepository):
+    return {
+        (user_id, key): tuple(entry)
+        for user_id, entries in rollups._rollups.items()
+        for key, entry in entries.items()
+        if entry[1]
+    }
+
+
+def rebuilt(transactions: InMemoryTransactionRepository):
+    rollups = InMemoryDailyRollupRepository()
+    rollups.rebuild_from(transactions._rows.values())
+    return live(rollups)
+
+
+def test_update_and_delete_apply_rollup_deltas():
+    async def scenario():
+        transactions = InMemoryTransactionRepository()
+        rollups = InMemoryDailyRollupRepository()
+        service = TransactionService(
+            transactions, rollups, None, InMemoryDataVersionRepository()
+        )
+        session = NullSession()
+
+        lunch, dinner = [
+            await service.create_transaction(session, USER_ID, TransactionCreateDto(
+                amount=Decimal(amount),
+                type=TransactionType.EXPENSE,
+                category=TransactionCategory.FOOD,
+                transaction_date=MAY_4,
+            ))
+            for amount in ("12.50", "30.00")
+        ]
+        assert live(rollups) == rebuilt(transactions)
+
+        # Amount, type, category and date change at once: the old row's
+        # contribution leaves May 4 and the new one lands on May 9.
+        await service.update_transaction(session, USER_ID, dinner.id, TransactionUpdateDto(
+            amount=Decimal("45.00"),
+            type=TransactionType.INCOME,
+            category=TransactionCategory.SALARY,
+            transaction_date=MAY_9,
+        ))
+        assert live(rollups) == rebuilt(transactions)
+        summary = await rollups.sum_income_expense(session, USER_ID, MAY_4, MAY_4)
+        assert (summary.total_income, summary.total_expense) == (0, Decimal("12.50"))
+
+        await service.delete_transaction(session, USER_ID, lunch.id)
+        assert live(rollups) == rebuilt(transactions)
+        summary = await rollups.sum_income_expense(session, USER_ID, MAY_4, MAY_9)
+        assert (summary.total_income, summary.total_expense) == (Decimal("45.00"), 0)
+
+    asyncio.run(scenario())
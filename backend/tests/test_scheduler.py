@@ -0,0 +1,130 @@
+"""
+Scheduler jobs run with in-memory repositories and a fake session whose
+advisory-lock query answers as configured.
+"""
+import asyncio
+from datetime import date
+from decimal import Decimal
+
+from src.domain_model.dtos.recurring_dtos import RecurringTemplateCreateDto
+from src.services.maintenance_jobs import build_scheduler
+from src.services.service_registry import ServiceRegistry
+from src.utils.constants import TransactionCategory, TransactionType
+from src.utils.scheduler import Scheduler
+
+from benchmarks.inmemory import (
+    InMemoryDailyRollupRepository,
+    InMemoryDataVersionRepository,
+    InMemoryRecurringTemplateRepository,
+    InMemoryTransactionRepository,
+    NullSession,
+)
+
+USER_ID = 1
+
+
+class FakeSession(NullSession):
+    """Session whose only query is the job's advisory lock."""
+
+    def __init__(self, lock_available: bool = True):
+        super().__init__()
+        self.lock_available = lock_available
+        self.lock_queries = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def begin(self):
+        return self
+
+    async def scalar(self, statement):
+        self.lock_queries.append(str(statement))
+        return self.lock_available
+
+
+def build_registry() -> ServiceRegistry:
+    return ServiceRegistry(
+        None,
+        transaction_repository=InMemoryTransactionRepository(),
+        rollup_repository=InMemoryDailyRollupRepository(),
+        recurring_template_repository=InMemoryRecurringTemplateRepository(),
+        version_repository=InMemoryDataVersionRepository(),
+    )
+
+
+def test_materialize_recurring_does_not_recreate_deleted_occurrences():
+    async def scenario():
+        services = build_registry()
+        session = FakeSession()
+        scheduler = build_scheduler(lambda: session, services)
+        job = scheduler.jobs["materialize_recurring"]
+
+        today = date.today()
+        previous = date(today.year - 1, 12, 1) if today.month == 1 else date(
+            today.year, today.month - 1, 1
+        )
+        await services.recurring_service.create_template(
+            session, USER_ID, RecurringTemplateCreateDto(
+                amount=Decimal("15.00"),
+                type=TransactionType.EXPENSE,
+                category=TransactionCategory.SUBSCRIPTIONS,
+                day_of_month=1,
+                start_date=previous,
+            )
+        )
+        transactions = services.transaction_repository
+
+        assert await scheduler.run_job(job)
+        generated = sorted(transactions._rows.values(), key=lambda obj: obj.transaction_date)
+        assert [obj.transaction_date for obj in generated] == [previous, today.replace(day=1)]
+
+        await services.transaction_service.delete_transaction(session, USER_ID, generated[-1].id)
+        assert await scheduler.run_job(job)
+        assert await scheduler.run_job(job)
+
+        assert [obj.transaction_date for obj in transactions._rows.values()] == [previous]
+        assert (job.runs, job.failures) == (3, 0)
+
+    asyncio.run(scenario())
+
+
+def counting_job(calls: list):
+    async def job(session):
+        calls.append(session)
+    return job
+
+
+def test_exclusive_job_runs_only_while_holding_the_lock():
+    async def scenario():
+        calls = []
+        held_elsewhere = FakeSession(lock_available=False)
+        scheduler = Scheduler(lambda: held_elsewhere)
+        job = scheduler.add_job("exclusive", counting_job(calls), 60)
+
+        assert not await scheduler.run_job(job)
+        assert (calls, job.runs, job.skipped_locked) == ([], 0, 1)
+        assert "pg_try_advisory_xact_lock" in held_elsewhere.lock_queries[0]
+
+        free = FakeSession(lock_available=True)
+        scheduler.session_factory = lambda: free
+        assert await scheduler.run_job(job)
+        assert (calls, job.runs, job.skipped_locked) == ([free], 1, 1)
+
+    asyncio.run(scenario())
+
+
+def test_non_exclusive_job_never_takes_the_lock():
+    async def scenario():
+        calls = []
+        session = FakeSession(lock_available=False)
+        scheduler = Scheduler(lambda: session)
+        job = scheduler.add_job("per_process", counting_job(calls), 60, exclusive=False)
+
+        assert await scheduler.run_job(job)
+        assert (len(calls), job.runs, job.skipped_locked) == (1, 1, 0)
+        assert session.lock_queries == []
+
+    asyncio.run(scenario())